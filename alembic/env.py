@@ -5,6 +5,10 @@ from sqlalchemy import pool
 
 from alembic import context
 
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.models.price_model import Base
+from src.infrastructure.database.models import price_rollup_model  # noqa: F401
+
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -18,7 +22,14 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 # from myapp import mymodel
 # target_metadata = mymodel.Base.metadata
-target_metadata = None
+target_metadata = Base.metadata
+
+config.set_main_option(
+    "sqlalchemy.url",
+    f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
+    f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+    .replace("%", "%%"),
+)
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -0,0 +1,41 @@
+"""create prices table
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'prices',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('ticker', sa.String(length=20), nullable=False),
+        sa.Column('price', sa.Float(), nullable=False),
+        sa.Column('timestamp', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_prices_id', 'prices', ['id'])
+    op.create_index('ix_prices_ticker', 'prices', ['ticker'])
+    op.create_index('ix_prices_timestamp', 'prices', ['timestamp'])
+    op.create_index('ix_ticker_timestamp', 'prices', ['ticker', 'timestamp'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ticker_timestamp', table_name='prices')
+    op.drop_index('ix_prices_timestamp', table_name='prices')
+    op.drop_index('ix_prices_ticker', table_name='prices')
+    op.drop_index('ix_prices_id', table_name='prices')
+    op.drop_table('prices')
@@ -0,0 +1,37 @@
+"""make (ticker, timestamp) unique for ON CONFLICT upserts
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        DELETE FROM prices a
+        USING prices b
+        WHERE a.ticker = b.ticker
+          AND a.timestamp = b.timestamp
+          AND a.id > b.id
+        """
+    )
+    op.drop_index('ix_ticker_timestamp', table_name='prices')
+    op.create_index('ix_ticker_timestamp', 'prices', ['ticker', 'timestamp'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ticker_timestamp', table_name='prices')
+    op.create_index('ix_ticker_timestamp', 'prices', ['ticker', 'timestamp'])
@@ -0,0 +1,40 @@
+"""create 1m/1h/1d price rollup tables
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLLUP_TABLES = ('price_rollups_1m', 'price_rollups_1h', 'price_rollups_1d')
+
+
+def upgrade() -> None:
+    for table_name in ROLLUP_TABLES:
+        op.create_table(
+            table_name,
+            sa.Column('ticker', sa.String(length=20), nullable=False),
+            sa.Column('bucket_start', sa.BigInteger(), nullable=False),
+            sa.Column('open', sa.Float(), nullable=False),
+            sa.Column('high', sa.Float(), nullable=False),
+            sa.Column('low', sa.Float(), nullable=False),
+            sa.Column('close', sa.Float(), nullable=False),
+            sa.Column('count', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('ticker', 'bucket_start'),
+        )
+
+
+def downgrade() -> None:
+    for table_name in reversed(ROLLUP_TABLES):
+        op.drop_table(table_name)
@@ -0,0 +1,94 @@
+"""range-partition prices by month on timestamp
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+import time
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.infrastructure.database.partitions import MonthPartition, DEFAULT_PARTITION
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+
+def upgrade() -> None:
+    op.rename_table('prices', 'prices_legacy')
+    for index_name in ('ix_prices_id', 'ix_prices_ticker', 'ix_prices_timestamp', 'ix_ticker_timestamp'):
+        op.drop_index(index_name, table_name='prices_legacy')
+    op.execute("ALTER TABLE prices_legacy RENAME CONSTRAINT prices_pkey TO prices_legacy_pkey")
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY NONE")
+
+    op.execute(
+        """
+        CREATE TABLE prices (
+            id integer NOT NULL DEFAULT nextval('prices_id_seq'),
+            ticker varchar(20) NOT NULL,
+            price double precision NOT NULL,
+            timestamp bigint NOT NULL,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY prices.id")
+
+    oldest = op.get_bind().scalar(sa.text("SELECT min(timestamp) FROM prices_legacy"))
+    now = int(time.time())
+    partition = MonthPartition.containing(oldest if oldest is not None and oldest < now else now)
+    last = MonthPartition.containing(now).shift(MONTHS_AHEAD)
+    while partition.start <= last.start:
+        op.execute(partition.create_sql())
+        partition = partition.shift(1)
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF prices DEFAULT")
+
+    op.execute(
+        """
+        INSERT INTO prices (id, ticker, price, timestamp)
+        SELECT id, ticker, price, timestamp FROM prices_legacy
+        """
+    )
+    op.drop_table('prices_legacy')
+
+    op.create_index('ix_ticker_timestamp', 'prices', ['ticker', 'timestamp'], unique=True)
+    op.create_index('ix_prices_timestamp_brin', 'prices', ['timestamp'], postgresql_using='brin')
+
+
+def downgrade() -> None:
+    op.rename_table('prices', 'prices_partitioned')
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY NONE")
+    op.execute(
+        """
+        CREATE TABLE prices (
+            id integer NOT NULL DEFAULT nextval('prices_id_seq'),
+            ticker varchar(20) NOT NULL,
+            price double precision NOT NULL,
+            timestamp bigint NOT NULL,
+            CONSTRAINT prices_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE prices_id_seq OWNED BY prices.id")
+    op.execute(
+        """
+        INSERT INTO prices (id, ticker, price, timestamp)
+        SELECT id, ticker, price, timestamp FROM prices_partitioned
+        """
+    )
+    # dropping the parent drops every attached partition with it
+    op.drop_table('prices_partitioned')
+
+    op.create_index('ix_prices_id', 'prices', ['id'])
+    op.create_index('ix_prices_ticker', 'prices', ['ticker'])
+    op.create_index('ix_prices_timestamp', 'prices', ['timestamp'])
+    op.create_index('ix_ticker_timestamp', 'prices', ['ticker', 'timestamp'], unique=True)
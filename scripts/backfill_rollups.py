@@ -0,0 +1,62 @@
+import argparse
+import asyncio
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select
+
+from src.infrastructure.database.models.price_model import PriceModel
+from src.infrastructure.database.repositories.price_rollup_repository_impl import PriceRollupRepositoryImpl
+from src.infrastructure.database.session import db_manager
+
+
+async def backfill(start: int = None, end: int = None, chunk_seconds: int = 86400):
+    async with db_manager.async_session_factory() as session:
+        bounds = await session.execute(
+            select(func.min(PriceModel.timestamp), func.max(PriceModel.timestamp))
+        )
+        first, last = bounds.one()
+
+    if first is None:
+        print("No prices to roll up")
+        return
+
+    start = first if start is None else start
+    end = last if end is None else end
+
+    # whole days per chunk, so every hourly and daily bucket is rebuilt from complete data
+    chunk_seconds = max(86400, chunk_seconds - chunk_seconds % 86400)
+    chunk_start = start - start % 86400
+    total = 0
+    started = time.perf_counter()
+
+    while chunk_start <= end:
+        chunk_end = chunk_start + chunk_seconds - 1
+        async with db_manager.async_session_factory() as session:
+            refreshed = await PriceRollupRepositoryImpl(session).refresh(chunk_start, chunk_end)
+            await session.commit()
+        total += refreshed
+        print(f"{chunk_start}..{chunk_end}: {refreshed} buckets")
+        chunk_start = chunk_end + 1
+
+    print(f"Rebuilt {total} rollup buckets in {time.perf_counter() - started:.1f}s")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Rebuild price rollup tables from raw prices")
+    parser.add_argument("--start", type=int, help="UNIX timestamp, defaults to the oldest price")
+    parser.add_argument("--end", type=int, help="UNIX timestamp, defaults to the newest price")
+    parser.add_argument("--chunk-days", type=int, default=7)
+    args = parser.parse_args()
+
+    try:
+        await backfill(args.start, args.end, args.chunk_days * 86400)
+    finally:
+        await db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import delete
+
+from src.domain.entities.price import Price
+from src.infrastructure.database.models.price_model import PriceModel
+from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.database.session import db_manager
+
+BENCH_TICKER = "bench_usd"
+
+
+def make_prices(count: int, offset: int) -> list:
+    base = 1_000_000_000 + offset
+    return [
+        Price(ticker=BENCH_TICKER, price=40000.0 + (i % 1000), timestamp=base + i)
+        for i in range(count)
+    ]
+
+
+async def cleanup():
+    async with db_manager.async_session_factory() as session:
+        await session.execute(delete(PriceModel).where(PriceModel.ticker == BENCH_TICKER))
+        await session.commit()
+
+
+async def run_orm(prices: list) -> float:
+    started = time.perf_counter()
+    async with db_manager.async_session_factory() as session:
+        session.add_all([PriceModel.from_domain(price) for price in prices])
+        await session.commit()
+    return time.perf_counter() - started
+
+
+async def run_batch_save(prices: list, copy_threshold: int) -> float:
+    started = time.perf_counter()
+    async with db_manager.async_session_factory() as session:
+        repository = PriceRepositoryImpl(session, copy_threshold=copy_threshold)
+        saved = await repository.batch_save(prices)
+        await session.commit()
+    elapsed = time.perf_counter() - started
+    assert len(saved) == len(prices) and all(price.id for price in saved)
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Rows/s of PriceRepositoryImpl.batch_save against Postgres")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--orm-max", type=int, default=100_000, help="skip the ORM baseline above this size")
+    args = parser.parse_args()
+
+    await cleanup()
+    print(f"{'rows':>10} {'orm add_all':>16} {'multi-row insert':>16} {'copy':>16}")
+
+    try:
+        for offset, size in enumerate(args.sizes):
+            prices = make_prices(size, offset * 10_000_000)
+            results = []
+
+            if size <= args.orm_max:
+                results.append(size / await run_orm(prices))
+                await cleanup()
+            else:
+                results.append(None)
+
+            results.append(size / await run_batch_save(prices, copy_threshold=size + 1))
+            await cleanup()
+            results.append(size / await run_batch_save(prices, copy_threshold=0))
+            await cleanup()
+
+            print(f"{size:>10} " + " ".join(
+                f"{'-':>16}" if rate is None else f"{rate:>14,.0f}/s" for rate in results
+            ))
+    finally:
+        await cleanup()
+        await db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
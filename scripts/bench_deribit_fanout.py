@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import logging
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from aiohttp import web
+
+from src.infrastructure.external.aiohttp_client import AioHttpClient
+from src.infrastructure.external.deribit_client import DeribitClient
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+
+
+async def start_stub_server(latency: float, port: int) -> web.AppRunner:
+    async def get_index_price(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({
+            "jsonrpc": "2.0",
+            "result": {"index_price": 45000.5, "estimated_delivery_price": 45000.5}
+        })
+
+    app = web.Application()
+    app.router.add_get("/api/v2/public/get_index_price", get_index_price)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def measure(api_url: str, ticker_count: int, concurrency: int, rounds: int) -> float:
+    tickers = [f"idx{i}_usd" for i in range(ticker_count)]
+
+    async with AioHttpClient(base_url=api_url) as http_client:
+        client = DeribitClient(
+            api_url,
+            max_concurrency=concurrency,
+            request_timeout=30.0,
+            ticker_registry=StaticTickerRegistry.from_tickers(tickers),
+            http_client=http_client
+        )
+
+        best = float("inf")
+        for _ in range(rounds):
+            started = time.perf_counter()
+            prices = await client.get_index_prices(tickers)
+            elapsed = time.perf_counter() - started
+            assert len(prices) == ticker_count
+            best = min(best, elapsed)
+    return best
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Wall-clock time of DeribitClient.get_index_prices against a local stub"
+    )
+    parser.add_argument("--latency", type=float, default=0.05, help="stub response delay, seconds")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 2, 10, 25, 50, 100])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    runner = await start_stub_server(args.latency, args.port)
+    api_url = f"http://127.0.0.1:{args.port}/api/v2"
+
+    try:
+        print(f"stub latency: {args.latency * 1000:.0f}ms, best of {args.rounds} rounds")
+        print(f"{'tickers':>8} {'sequential':>12} {f'fan-out x{args.concurrency}':>14} {'speedup':>8}")
+        for count in args.counts:
+            sequential = await measure(api_url, count, 1, args.rounds)
+            concurrent = await measure(api_url, count, args.concurrency, args.rounds)
+            print(
+                f"{count:>8} {sequential:>11.3f}s {concurrent:>13.3f}s "
+                f"{sequential / concurrent:>7.1f}x"
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.application.dtos.price_dto import PriceDTO
+from src.domain.exceptions.domain_exceptions import DomainException
+from src.presentation.api.dependencies import get_last_price_use_case
+from src.presentation.main import app
+from src.presentation.middleware.request_middleware import RequestMiddleware
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    # the previous stack, kept here only for comparison
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except HTTPException:
+            raise
+        except DomainException as domain_exc:
+            return JSONResponse(status_code=400, content={"detail": str(domain_exc)})
+        except Exception:
+            return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start_time = time.time()
+        logging.getLogger(__name__).info(
+            f"Incoming request: {request.method} {request.url.path} "
+            f"from {request.client.host if request.client else 'unknown'}"
+        )
+        response = await call_next(request)
+        logging.getLogger(__name__).info(
+            f"Request completed: {request.method} {request.url.path} "
+            f"Status: {response.status_code} "
+            f"Duration: {time.time() - start_time:.3f}s"
+        )
+        return response
+
+
+class CachedLastPrice:
+    # answers like a warm latest-price cache, so only the HTTP stack is measured
+    async def execute(self, ticker):
+        return PriceDTO(1, ticker, 45000.5, 1_700_000_000)
+
+
+def build_app(stack: str) -> FastAPI:
+    bench_app = FastAPI()
+    bench_app.router.routes.extend(
+        route for route in app.routes if getattr(route, "path", "") in ("/health", "/api/v1/prices/last")
+    )
+    # the copied routes resolve overrides through the app that declared them
+    app.dependency_overrides[get_last_price_use_case] = CachedLastPrice
+    if stack == "legacy":
+        bench_app.add_middleware(LegacyErrorHandlerMiddleware)
+        bench_app.add_middleware(LegacyLoggingMiddleware)
+    elif stack == "asgi":
+        bench_app.add_middleware(RequestMiddleware)
+    return bench_app
+
+
+async def measure(bench_app: FastAPI, path: str, requests: int):
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(100):
+            await client.get(path)
+
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+    return latencies
+
+
+async def main(requests: int):
+    paths = ["/health", "/api/v1/prices/last?ticker=btc_usd"]
+    print(f"{'stack':<8} {'path':<38} {'mean us':>9} {'p99 us':>9}")
+    for path in paths:
+        for stack in ("none", "legacy", "asgi"):
+            latencies = await measure(build_app(stack), path, requests)
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(f"{stack:<8} {path:<38} {statistics.mean(latencies) * 1e6:>9.1f} {p99 * 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-request overhead of the HTTP middleware stack")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--log-level", default="WARNING", help="INFO shows the cost of emitting the log lines")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, stream=open(os.devnull, "w"))
+    asyncio.run(main(args.requests))
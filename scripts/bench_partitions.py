@@ -0,0 +1,109 @@
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from src.infrastructure.database.partitions import MonthPartition
+from src.infrastructure.database.session import db_manager
+
+TICKERS = ["btc_usd", "eth_usd"]
+DAY = 86400
+
+
+def table_ddl(name: str, partitioned: bool) -> list:
+    if not partitioned:
+        return [
+            f"CREATE TABLE {name} (id bigserial PRIMARY KEY, ticker varchar(20) NOT NULL, "
+            f"price double precision NOT NULL, timestamp bigint NOT NULL)",
+            f"CREATE UNIQUE INDEX {name}_ticker_ts ON {name} (ticker, timestamp)",
+            f"CREATE INDEX {name}_ts ON {name} (timestamp)",
+        ]
+    return [
+        f"CREATE TABLE {name} (id bigserial, ticker varchar(20) NOT NULL, "
+        f"price double precision NOT NULL, timestamp bigint NOT NULL, "
+        f"PRIMARY KEY (id, timestamp)) PARTITION BY RANGE (timestamp)",
+        f"CREATE UNIQUE INDEX {name}_ticker_ts ON {name} (ticker, timestamp)",
+        f"CREATE INDEX {name}_ts_brin ON {name} USING brin (timestamp)",
+    ]
+
+
+async def create_table(conn, name: str, partitioned: bool, start: int, end: int):
+    await conn.execute(text(f"DROP TABLE IF EXISTS {name} CASCADE"))
+    for statement in table_ddl(name, partitioned):
+        await conn.execute(text(statement))
+    if partitioned:
+        partition = MonthPartition.containing(start)
+        while partition.start <= end:
+            await conn.execute(text(
+                f"CREATE TABLE {name}_{partition.name} PARTITION OF {name} "
+                f"FOR VALUES FROM ({partition.start}) TO ({partition.end})"
+            ))
+            partition = partition.shift(1)
+
+
+async def load(conn, name: str, start: int, rows: int) -> float:
+    started = time.perf_counter()
+    await conn.execute(text(
+        f"INSERT INTO {name} (ticker, price, timestamp) "
+        f"SELECT (ARRAY['btc_usd', 'eth_usd'])[1 + i % 2], 40000 + random() * 1000, "
+        f"{start} + i / 2 FROM generate_series(0, {rows - 1}) AS i"
+    ))
+    await conn.execute(text(f"ANALYZE {name}"))
+    return rows / (time.perf_counter() - started)
+
+
+async def range_queries(conn, name: str, start: int, end: int, queries: int, span: int) -> list:
+    latencies = []
+    for _ in range(queries):
+        low = random.randint(start, max(start, end - span))
+        started = time.perf_counter()
+        await conn.execute(text(
+            f"SELECT id, price, timestamp FROM {name} "
+            f"WHERE ticker = :ticker AND timestamp BETWEEN :low AND :high"
+        ), {"ticker": random.choice(TICKERS), "low": low, "high": low + span})
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Flat vs month-partitioned prices table: load rate and range-query latency"
+    )
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--span-days", type=int, default=1, help="width of each range query")
+    args = parser.parse_args()
+
+    # one row per ticker per second, ending now
+    end = int(time.time())
+    start = end - args.rows // len(TICKERS)
+
+    print(f"{args.rows:,} rows over {(end - start) / DAY:.0f} days, {args.queries} queries of {args.span_days}d")
+    print(f"{'table':>12} {'load rows/s':>14} {'p50 ms':>8} {'p99 ms':>8}")
+    try:
+        for name, partitioned in (("bench_flat", False), ("bench_parted", True)):
+            async with db_manager.engine.begin() as conn:
+                await create_table(conn, name, partitioned, start, end)
+                rate = await load(conn, name, start, args.rows)
+            async with db_manager.engine.connect() as conn:
+                latencies = await range_queries(
+                    conn, name, start, end, args.queries, args.span_days * DAY
+                )
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(f"{name:>12} {rate:>14,.0f} {statistics.median(latencies):>8.2f} {p99:>8.2f}")
+    finally:
+        async with db_manager.engine.begin() as conn:
+            for name in ("bench_flat", "bench_parted"):
+                await conn.execute(text(f"DROP TABLE IF EXISTS {name} CASCADE"))
+        await db_manager.engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
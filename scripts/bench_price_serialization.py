@@ -0,0 +1,97 @@
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import APIRouter, Depends, Query
+
+from src.application.use_cases.get_all_prices_uc import GetAllPricesUseCase
+from src.domain.entities.price import Price
+from src.infrastructure.database.models.price_model import PriceModel
+from src.presentation.api.dependencies import get_all_prices_use_case
+from src.presentation.main import app
+from src.presentation.models.price_schemas import PriceListResponse, PriceResponse
+
+
+class InMemoryRepository:
+    # serves the same rows the database would, so only the API path is measured
+    def __init__(self, rows: int):
+        self.rows = [(rows - i, "btc_usd", 40000.0 + i % 1000 + 0.25, 1_700_000_000 - i) for i in range(rows)]
+
+    async def get_page_rows(self, ticker, limit, before_timestamp=None):
+        return self.rows[:limit]
+
+    async def get_page(self, ticker, limit, before_timestamp=None):
+        # the previous path: ORM model -> entity, as PriceModel.to_domain() did
+        models = [PriceModel(id=i, ticker=t, price=p, timestamp=ts) for i, t, p, ts in self.rows[:limit]]
+        return [model.to_domain() for model in models]
+
+
+legacy_router = APIRouter()
+
+
+@legacy_router.get("/legacy-prices/", response_model=PriceListResponse)
+async def legacy_get_all_prices(
+    ticker: str = Query(...),
+    limit: int = Query(1000, ge=1, le=10000),
+    use_case: GetAllPricesUseCase = Depends(get_all_prices_use_case)
+):
+    prices_dto, next_cursor = await use_case.execute_page(ticker, limit)
+    prices_response = [PriceResponse.from_dto(price_dto) for price_dto in prices_dto]
+    return PriceListResponse(
+        ticker=ticker,
+        prices=prices_response,
+        count=len(prices_response),
+        next_cursor=next_cursor
+    )
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> list:
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get(path)
+        latencies.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Requests/s and p99 of GET /prices/ for large pages: pydantic path vs orjson row path"
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    repository = InMemoryRepository(args.rows + 1)
+    app.dependency_overrides[get_all_prices_use_case] = lambda: GetAllPricesUseCase(repository)
+    app.include_router(legacy_router, prefix="/api/v1")
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        paths = {
+            "before": f"/api/v1/legacy-prices/?ticker=btc_usd&limit={args.rows}",
+            "after": f"/api/v1/prices/?ticker=btc_usd&limit={args.rows}",
+        }
+        print(f"{args.rows:,} rows per response, {args.requests} sequential requests")
+        print(f"{'path':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, path in paths.items():
+            await measure(client, path, 3)
+            latencies = await measure(client, path, args.requests)
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(
+                f"{name:>8} {len(latencies) / sum(latencies):>8.1f} "
+                f"{statistics.median(latencies) * 1000:>8.1f} {p99 * 1000:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
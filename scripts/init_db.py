@@ -1,22 +1,24 @@
-import asyncio
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.infrastructure.database.session import db_manager
+from alembic import command
+from alembic.config import Config
 
 
-async def init_database():
+def init_database():
+    # migrations are the only path that manages the schema; the API no longer
+    # runs create_all on startup
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    config = Config(os.path.join(root, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(root, "alembic"))
     try:
-        await db_manager.create_tables()
-        async with db_manager.engine.connect() as conn:
-            await conn.execute("SELECT 1")
-        
+        command.upgrade(config, "head")
     except Exception as e:
         print(f"Failed to initialize database: {e}")
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    asyncio.run(init_database())
\ No newline at end of file
+    init_database()
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+
+async def worker(client: httpx.AsyncClient, path: str, deadline: float, latencies: list, errors: list):
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            if response.status_code >= 500:
+                errors.append(response.status_code)
+                continue
+        except httpx.HTTPError as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_level(client: httpx.AsyncClient, path: str, concurrency: int, duration: float):
+    latencies, errors = [], []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(
+        worker(client, path, deadline, latencies, errors) for _ in range(concurrency)
+    ))
+    return latencies, errors
+
+
+async def pool_snapshot(client: httpx.AsyncClient) -> str:
+    try:
+        pools = (await client.get("/health")).json().get("pool", {})
+    except (httpx.HTTPError, ValueError):
+        return "-"
+    return " ".join(
+        f"{name}:{stats['checked_out']}/{stats['size']}+{stats['overflow']}"
+        for name, stats in pools.items()
+    )
+
+
+async def main(base_url: str, path: str, levels: list, duration: float):
+    limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await run_level(client, path, 1, 1.0)
+
+        print(f"{'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}  pool after")
+        for concurrency in levels:
+            latencies, errors = await run_level(client, path, concurrency, duration)
+            if len(latencies) < 2:
+                print(f"{concurrency:>5} {'-':>9} {'-':>8} {'-':>8} {'-':>8} {len(errors):>7}")
+                continue
+            quantiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{concurrency:>5} {len(latencies) / duration:>9.1f} {quantiles[49] * 1000:>8.1f} "
+                f"{quantiles[98] * 1000:>8.1f} {max(latencies) * 1000:>8.1f} {len(errors):>7}  "
+                f"{await pool_snapshot(client)}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Closed-loop load test of a running API: latency percentiles per concurrency level"
+    )
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/prices/by-date?ticker=btc_usd"
+                                          "&start_date=2024-01-01T00:00:00&end_date=2024-01-01T01:00:00")
+    parser.add_argument("--levels", default="1,4,16,32,64,128",
+                        help="comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per level")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.url, args.path, [int(level) for level in args.levels.split(",")], args.duration))
@@ -0,0 +1,115 @@
+import argparse
+import asyncio
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+MODULES = ["src.presentation.main", "src.infrastructure.celery_app.worker"]
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)")
+
+
+def import_profile(module: str):
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    # children are printed before their parent, one indent level (2 spaces) deeper
+    total, children, packages = 0, {}, {}
+    for match in IMPORT_LINE.finditer(output):
+        cumulative, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        if indent == 3:
+            children[name] = cumulative
+        elif indent == 1:
+            if name == module:
+                total, packages = cumulative, children
+            children = {}
+    return total / 1e6, packages
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(path: str, timeout: float) -> float:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "src.presentation.main:app", "--port", str(port), "--log-level", "error"],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"API exited during startup with code {server.returncode}")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"API did not answer {path} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def background_steps(timeout: float):
+    # the warm-ups the API runs after it starts serving, timed one by one
+    from src.infrastructure.external.http_session import start_http_clients, close_http_clients
+    from src.infrastructure.external.deribit_ticker_registry import ticker_registry
+    from src.infrastructure.cache.cache_manager import price_cache_manager
+    from src.presentation.main import warm_price_cache, warm_recent_prices
+
+    await start_http_clients()
+    await price_cache_manager.start()
+    try:
+        for name, step in [
+            ("ticker registry refresh (Deribit)", ticker_registry.ensure_fresh),
+            ("latest-price cache warm-up (database)", warm_price_cache),
+            ("ring buffer load (Redis subscription, database)", warm_recent_prices),
+        ]:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(step(), timeout)
+            except Exception as e:
+                print(f"    {name} failed: {str(e) or type(e).__name__}")
+            print(f"    {(time.perf_counter() - started) * 1000:8.1f} ms  {name}")
+    finally:
+        await price_cache_manager.stop()
+        await close_http_clients()
+
+
+def main(runs: int, top: int, path: str, timeout: float):
+    for module in MODULES:
+        results = [import_profile(module) for _ in range(runs)]
+        totals = [total for total, _ in results]
+        print(f"import {module}: median {statistics.median(totals) * 1000:.0f} ms over {runs} runs")
+        for name, cumulative in sorted(results[-1][1].items(), key=lambda item: -item[1])[:top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {name}")
+
+    first_requests = [time_to_first_request(path, timeout) for _ in range(runs)]
+    print(f"uvicorn start to first {path} 200: median {statistics.median(first_requests) * 1000:.0f} ms over {runs} runs")
+
+    print("background warm-up after startup (not on the first-request path):")
+    asyncio.run(background_steps(timeout))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time and time to first request of the API and Celery worker")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8, help="heaviest top-level imports to list")
+    parser.add_argument("--path", default="/info")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    main(args.runs, args.top, args.path, args.timeout)
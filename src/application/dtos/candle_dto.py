@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime
+from src.domain.entities.candle import Candle
+
+
+@dataclass
+class CandleDTO:
+    
+    ticker: str = ""
+    bucket_start: int = 0
+    open: float = 0.0
+    high: float = 0.0
+    low: float = 0.0
+    close: float = 0.0
+    count: int = 0
+    
+    @classmethod
+    def from_domain(cls, candle: Candle) -> 'CandleDTO':
+        return cls(
+            ticker=candle.ticker,
+            bucket_start=candle.bucket_start,
+            open=candle.open,
+            high=candle.high,
+            low=candle.low,
+            close=candle.close,
+            count=candle.count
+        )
+    
+    @property
+    def datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.bucket_start)
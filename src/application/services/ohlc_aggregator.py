@@ -0,0 +1,45 @@
+from typing import List
+from src.domain.entities.candle import Candle
+from src.domain.entities.price import Price
+
+
+def aggregate_ohlc(ticker: str, prices: List[Price], bucket_seconds: int) -> List[Candle]:
+    if not prices:
+        return []
+    
+    # deferred: numpy is only needed when candles are built from raw prices
+    import numpy as np
+    
+    count = len(prices)
+    timestamps = np.fromiter((price.timestamp for price in prices), dtype=np.int64, count=count)
+    values = np.fromiter((price.price for price in prices), dtype=np.float64, count=count)
+    
+    order = np.argsort(timestamps, kind="stable")
+    timestamps = timestamps[order]
+    values = values[order]
+    
+    buckets = timestamps - timestamps % bucket_seconds
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [count])) - 1
+    
+    opens = values[starts]
+    closes = values[ends]
+    highs = np.maximum.reduceat(values, starts)
+    lows = np.minimum.reduceat(values, starts)
+    counts = ends - starts + 1
+    
+    return [
+        Candle(
+            ticker=ticker,
+            bucket_start=int(bucket_start),
+            open=float(open_),
+            high=float(high),
+            low=float(low),
+            close=float(close),
+            count=int(bucket_count)
+        )
+        for bucket_start, open_, high, low, close, bucket_count in zip(
+            buckets[starts].tolist(), opens.tolist(), highs.tolist(),
+            lows.tolist(), closes.tolist(), counts.tolist()
+        )
+    ]
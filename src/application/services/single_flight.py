@@ -0,0 +1,50 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    # concurrent calls with the same key share one in-flight execution and its
+    # result (or exception); the key is forgotten as soon as the call finishes
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        self.calls += 1
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        # shielded so one cancelled caller does not cancel the query for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is not None:
+            self.failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+        }
+
+
+# shared by the per-request use cases so identical queries coalesce across requests
+price_queries = SingleFlight()
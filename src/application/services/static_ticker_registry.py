@@ -0,0 +1,21 @@
+from typing import Dict, FrozenSet, Iterable, Optional
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.domain.value_objects.currency import CurrencyPair
+
+
+class StaticTickerRegistry(TickerRegistry):
+    def __init__(self, index_mapping: Optional[Dict[str, str]] = None):
+        self._index_by_ticker = dict(index_mapping or {
+            ticker: ticker for ticker in CurrencyPair.list()
+        })
+        self._tickers = frozenset(self._index_by_ticker)
+
+    @classmethod
+    def from_tickers(cls, tickers: Iterable[str]) -> 'StaticTickerRegistry':
+        return cls({ticker: ticker for ticker in tickers})
+
+    def tickers(self) -> FrozenSet[str]:
+        return self._tickers
+
+    def index_name(self, ticker: str) -> Optional[str]:
+        return self._index_by_ticker.get(ticker)
@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 from src.domain.ports.market_data_provider import MarketDataProvider
 from src.domain.ports.price_repository import PriceRepository
+from src.domain.ports.price_cache import PriceCache
 from src.domain.entities.price import Price
 
 
@@ -8,10 +9,12 @@ class FetchMarketPricesUseCase:
     def __init__(
         self, 
         market_data_provider: MarketDataProvider,
-        price_repository: PriceRepository
+        price_repository: PriceRepository,
+        price_cache: Optional[PriceCache] = None
     ):
         self.market_data_provider = market_data_provider
         self.price_repository = price_repository
+        self.price_cache = price_cache
     
     async def execute(self, tickers: List[str] = None) -> List[Price]:
         if tickers is None:
@@ -22,6 +25,11 @@ class FetchMarketPricesUseCase:
         
         if prices:
             saved_prices = await self.price_repository.batch_save(prices)
+            
+            if self.price_cache:
+                for price in saved_prices:
+                    await self.price_cache.set_last(price)
+            
             return saved_prices
         
-        return []
\ No newline at end of file
+        return []
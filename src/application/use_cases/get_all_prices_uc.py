@@ -1,20 +1,107 @@
-from typing import List
-from src.domain.ports.price_repository import PriceRepository
+from contextlib import aclosing
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
+from src.domain.ports.price_repository import PriceRepository, PriceRow
 from src.application.dtos.price_dto import PriceDTO
-from src.domain.exceptions.domain_exceptions import InvalidTickerException
-from src.domain.value_objects.currency import CurrencyPair
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.application.services.single_flight import SingleFlight
 
 
 class GetAllPricesUseCase:    
-    def __init__(self, price_repository: PriceRepository):
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        ticker_registry: Optional[TickerRegistry] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.price_repository = price_repository
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+        self.single_flight = single_flight or SingleFlight()
+    
+    def _validate_ticker(self, ticker: str):
+        self.ticker_registry.validate(ticker)
     
     async def execute(self, ticker: str) -> List[PriceDTO]:
-        if ticker not in CurrencyPair.list():
-            raise InvalidTickerException(
-                f"Invalid ticker: {ticker}. Supported tickers: {CurrencyPair.list()}"
-            )
+        self._validate_ticker(ticker)
+        
+        prices = await self.single_flight.do(
+            ("all", ticker), lambda: self.price_repository.get_all(ticker)
+        )
+        
+        return [PriceDTO.from_domain(price) for price in prices]
+    
+    async def execute_page(
+        self,
+        ticker: str,
+        limit: int,
+        cursor: Optional[int] = None
+    ) -> Tuple[List[PriceDTO], Optional[int]]:
+        self._validate_ticker(ticker)
+        
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        
+        prices = await self.single_flight.do(
+            ("page", ticker, limit, cursor),
+            lambda: self.price_repository.get_page(ticker, limit + 1, cursor)
+        )
+        
+        next_cursor = None
+        if len(prices) > limit:
+            prices = prices[:limit]
+            next_cursor = prices[-1].timestamp
+        
+        return [PriceDTO.from_domain(price) for price in prices], next_cursor
+    
+    async def execute_page_rows(
+        self,
+        ticker: str,
+        limit: int,
+        cursor: Optional[int] = None
+    ) -> Tuple[List[PriceRow], Optional[int]]:
+        self._validate_ticker(ticker)
+        
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        
+        rows = await self.single_flight.do(
+            ("page_rows", ticker, limit, cursor),
+            lambda: self.price_repository.get_page_rows(ticker, limit + 1, cursor)
+        )
+        
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][3]
         
-        prices = await self.price_repository.get_all(ticker)
+        return rows, next_cursor
+    
+    def stream(self, ticker: str, batch_size: int = 1000) -> AsyncIterator[PriceDTO]:
+        self._validate_ticker(ticker)
+        return self._stream(ticker, batch_size)
+    
+    def stream_row_batches(
+        self,
+        ticker: str,
+        batch_size: int = 65536,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[List[PriceRow]]:
+        self._validate_ticker(ticker)
         
-        return [PriceDTO.from_domain(price) for price in prices]
\ No newline at end of file
+        if start_date and end_date and start_date > end_date:
+            raise ValueError("start_date cannot be greater than end_date")
+        
+        return self.price_repository.stream_row_batches(
+            ticker,
+            batch_size,
+            int(start_date.timestamp()) if start_date else None,
+            int(end_date.timestamp()) if end_date else None
+        )
+    
+    async def _stream(self, ticker: str, batch_size: int) -> AsyncIterator[PriceDTO]:
+        # closing this generator closes the repository stream and its session
+        async with aclosing(self.price_repository.stream_all(ticker, batch_size)) as prices:
+            async for price in prices:
+                yield PriceDTO.from_domain(price)
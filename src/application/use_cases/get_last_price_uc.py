@@ -1,22 +1,77 @@
-from typing import Optional
+from typing import Dict, List, Optional
 from src.domain.ports.price_repository import PriceRepository
+from src.domain.ports.price_cache import PriceCache
 from src.application.dtos.price_dto import PriceDTO
-from src.domain.exceptions.domain_exceptions import InvalidTickerException
-from src.domain.value_objects.currency import CurrencyPair
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.application.services.single_flight import SingleFlight
+
+
+MAX_BATCH_TICKERS = 100
 
 
 class GetLastPriceUseCase:    
-    def __init__(self, price_repository: PriceRepository):
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        price_cache: Optional[PriceCache] = None,
+        ticker_registry: Optional[TickerRegistry] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.price_repository = price_repository
+        self.price_cache = price_cache
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+        self.single_flight = single_flight or SingleFlight()
     
     async def execute(self, ticker: str) -> Optional[PriceDTO]:
-        if ticker not in CurrencyPair.list():
-            raise InvalidTickerException(
-                f"Invalid ticker: {ticker}. Supported tickers: {CurrencyPair.list()}"
-            )
+        self.ticker_registry.validate(ticker)
         
-        price = await self.price_repository.get_last(ticker)
+        if self.price_cache:
+            cached_price = await self.price_cache.get_last(ticker)
+            if cached_price:
+                return PriceDTO.from_domain(cached_price)
+        
+        price = await self.single_flight.do(
+            ("last", ticker), lambda: self.price_repository.get_last(ticker)
+        )
         
         if price:
+            if self.price_cache:
+                await self.price_cache.set_last(price)
             return PriceDTO.from_domain(price)
-        return None
\ No newline at end of file
+        return None
+    
+    async def execute_many(self, tickers: List[str]) -> Dict[str, Optional[PriceDTO]]:
+        tickers = self.ticker_registry.validate_many(tickers, MAX_BATCH_TICKERS)
+        
+        prices = {}
+        if self.price_cache:
+            for ticker in tickers:
+                cached_price = await self.price_cache.get_last(ticker)
+                if cached_price:
+                    prices[ticker] = cached_price
+        
+        missing = sorted(ticker for ticker in tickers if ticker not in prices)
+        if missing:
+            fetched = await self.single_flight.do(
+                ("last_many", tuple(missing)),
+                lambda: self.price_repository.get_last_many(missing)
+            )
+            if self.price_cache:
+                for price in fetched.values():
+                    await self.price_cache.set_last(price)
+            prices.update(fetched)
+        
+        return {
+            ticker: PriceDTO.from_domain(prices[ticker]) if ticker in prices else None
+            for ticker in tickers
+        }
+    
+    async def warm(self, tickers: List[str]) -> int:
+        if not self.price_cache:
+            return 0
+        
+        prices = await self.price_repository.get_last_many(tickers)
+        for price in prices.values():
+            await self.price_cache.set_last(price)
+        return len(prices)
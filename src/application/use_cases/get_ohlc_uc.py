@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import List, Optional
+from src.domain.ports.price_repository import PriceRepository
+from src.domain.ports.price_cache import PriceCache
+from src.domain.ports.price_rollup_repository import PriceRollupRepository
+from src.application.dtos.candle_dto import CandleDTO
+from src.application.services.ohlc_aggregator import aggregate_ohlc
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.domain.value_objects.candle_interval import CandleInterval
+
+MAX_CANDLES = 50000
+
+
+class GetOhlcUseCase:    
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        price_cache: Optional[PriceCache] = None,
+        rollup_repository: Optional[PriceRollupRepository] = None,
+        ticker_registry: Optional[TickerRegistry] = None
+    ):
+        self.price_repository = price_repository
+        self.price_cache = price_cache
+        self.rollup_repository = rollup_repository
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+    
+    def _pick_rollup(
+        self,
+        start_timestamp: int,
+        end_timestamp: int,
+        bucket_seconds: int
+    ) -> Optional[int]:
+        if not self.rollup_repository:
+            return None
+        
+        # A rollup is usable when its buckets tile both the candles and the range.
+        # An end on a bucket boundary drops the bucket that opens at end_timestamp,
+        # which in raw data could only hold the single price stamped exactly then.
+        for resolution in sorted(self.rollup_repository.resolutions(), reverse=True):
+            if bucket_seconds % resolution or start_timestamp % resolution:
+                continue
+            if end_timestamp % resolution not in (0, resolution - 1):
+                continue
+            return resolution
+        return None
+    
+    async def execute(
+        self, 
+        ticker: str, 
+        start_date: datetime, 
+        end_date: datetime,
+        interval: CandleInterval
+    ) -> List[CandleDTO]:
+        self.ticker_registry.validate(ticker)
+        
+        if start_date > end_date:
+            raise ValueError("start_date cannot be greater than end_date")
+        
+        interval = CandleInterval(interval)
+        start_timestamp = int(start_date.timestamp())
+        end_timestamp = int(end_date.timestamp())
+        
+        if (end_timestamp - start_timestamp) // interval.seconds > MAX_CANDLES:
+            raise ValueError(
+                f"Range too large for interval {interval.value}: "
+                f"at most {MAX_CANDLES} candles per request"
+            )
+        
+        prices = None
+        if self.price_cache:
+            prices = await self.price_cache.get_range(ticker, start_timestamp, end_timestamp)
+        
+        resolution = None
+        if prices is None:
+            resolution = self._pick_rollup(start_timestamp, end_timestamp, interval.seconds)
+        
+        if prices is not None:
+            candles = aggregate_ohlc(ticker, prices, interval.seconds)
+        elif resolution:
+            candles = await self.rollup_repository.get_ohlc(
+                ticker, start_timestamp, end_timestamp, interval.seconds, resolution
+            )
+        else:
+            candles = await self.price_repository.get_ohlc(
+                ticker, start_timestamp, end_timestamp, interval.seconds
+            )
+        
+        return [CandleDTO.from_domain(candle) for candle in candles]
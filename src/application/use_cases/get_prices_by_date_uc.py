@@ -1,14 +1,28 @@
 from datetime import datetime
-from typing import List
-from src.domain.ports.price_repository import PriceRepository
+from typing import Dict, List, Optional
+from src.domain.ports.price_repository import PriceRepository, PriceRow
+from src.domain.ports.price_cache import PriceCache
 from src.application.dtos.price_dto import PriceDTO
-from src.domain.exceptions.domain_exceptions import InvalidTickerException
-from src.domain.value_objects.currency import CurrencyPair
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.application.services.single_flight import SingleFlight
+
+
+MAX_BATCH_TICKERS = 20
 
 
 class GetPricesByDateUseCase:    
-    def __init__(self, price_repository: PriceRepository):
+    def __init__(
+        self,
+        price_repository: PriceRepository,
+        price_cache: Optional[PriceCache] = None,
+        ticker_registry: Optional[TickerRegistry] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         self.price_repository = price_repository
+        self.price_cache = price_cache
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+        self.single_flight = single_flight or SingleFlight()
     
     async def execute(
         self, 
@@ -16,16 +30,76 @@ class GetPricesByDateUseCase:
         start_date: datetime, 
         end_date: datetime
     ) -> List[PriceDTO]:
-        if ticker not in CurrencyPair.list():
-            raise InvalidTickerException(
-                f"Invalid ticker: {ticker}. Supported tickers: {CurrencyPair.list()}"
+        self.ticker_registry.validate(ticker)
+        
+        if start_date > end_date:
+            raise ValueError("start_date cannot be greater than end_date")
+        
+        prices = None
+        if self.price_cache:
+            prices = await self.price_cache.get_range(
+                ticker, int(start_date.timestamp()), int(end_date.timestamp())
+            )
+        
+        if prices is None:
+            prices = await self.single_flight.do(
+                ("by_date", ticker, start_date.timestamp(), end_date.timestamp()),
+                lambda: self.price_repository.get_by_date_range(ticker, start_date, end_date)
             )
         
+        return [PriceDTO.from_domain(price) for price in prices]
+    
+    async def execute_rows(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[PriceRow]:
+        self.ticker_registry.validate(ticker)
+        
         if start_date > end_date:
             raise ValueError("start_date cannot be greater than end_date")
         
-        prices = await self.price_repository.get_by_date_range(
-            ticker, start_date, end_date
+        if self.price_cache:
+            rows = await self.price_cache.get_range_rows(
+                ticker, int(start_date.timestamp()), int(end_date.timestamp())
+            )
+            if rows is not None:
+                return rows
+        
+        return await self.single_flight.do(
+            ("by_date_rows", ticker, start_date.timestamp(), end_date.timestamp()),
+            lambda: self.price_repository.get_by_date_range_rows(ticker, start_date, end_date)
         )
+    
+    async def execute_many(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, List[PriceDTO]]:
+        tickers = self.ticker_registry.validate_many(tickers, MAX_BATCH_TICKERS)
+        
+        if start_date > end_date:
+            raise ValueError("start_date cannot be greater than end_date")
+        
+        prices = {}
+        if self.price_cache:
+            for ticker in tickers:
+                cached = await self.price_cache.get_range(
+                    ticker, int(start_date.timestamp()), int(end_date.timestamp())
+                )
+                if cached is not None:
+                    prices[ticker] = cached
+        
+        missing = sorted(ticker for ticker in tickers if ticker not in prices)
+        if missing:
+            prices.update(await self.single_flight.do(
+                ("by_date_many", tuple(missing), start_date.timestamp(), end_date.timestamp()),
+                lambda: self.price_repository.get_by_date_range_many(missing, start_date, end_date)
+            ))
         
-        return [PriceDTO.from_domain(price) for price in prices]
\ No newline at end of file
+        return {
+            ticker: [PriceDTO.from_domain(price) for price in prices.get(ticker, [])]
+            for ticker in tickers
+        }
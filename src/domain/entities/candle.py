@@ -0,0 +1,17 @@
+from datetime import datetime
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Candle:
+    ticker: str
+    bucket_start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+    
+    @property
+    def datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.bucket_start)
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from ..entities.price import Price
+from .price_repository import PriceRow
+
+
+class PriceCache(ABC):
+
+    @abstractmethod
+    async def get_last(self, ticker: str) -> Optional[Price]:
+        pass
+
+    @abstractmethod
+    async def set_last(self, price: Price) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, ticker: Optional[str] = None) -> None:
+        pass
+
+    async def get_range(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[Price]]:
+        return None
+
+    async def get_range_rows(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[PriceRow]]:
+        prices = await self.get_range(ticker, start_timestamp, end_timestamp)
+        if prices is None:
+            return None
+        return [(price.id, price.ticker, price.price, price.timestamp) for price in prices]
@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 from ..entities.price import Price
+from ..entities.candle import Candle
+
+# (id, ticker, price, timestamp) for read paths that skip entity construction
+PriceRow = Tuple[int, str, float, int]
 
 
 class PriceRepository(ABC):
@@ -14,10 +18,46 @@ class PriceRepository(ABC):
     async def get_all(self, ticker: str) -> List[Price]:
         pass
     
+    @abstractmethod
+    async def get_page(
+        self,
+        ticker: str,
+        limit: int,
+        before_timestamp: Optional[int] = None
+    ) -> List[Price]:
+        pass
+    
+    @abstractmethod
+    async def get_page_rows(
+        self,
+        ticker: str,
+        limit: int,
+        before_timestamp: Optional[int] = None
+    ) -> List[PriceRow]:
+        pass
+    
+    @abstractmethod
+    def stream_all(self, ticker: str, batch_size: int = 1000) -> AsyncIterator[Price]:
+        pass
+    
+    @abstractmethod
+    def stream_row_batches(
+        self,
+        ticker: str,
+        batch_size: int,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None
+    ) -> AsyncIterator[List[PriceRow]]:
+        pass
+    
     @abstractmethod
     async def get_last(self, ticker: str) -> Optional[Price]:
         pass
     
+    @abstractmethod
+    async def get_last_many(self, tickers: List[str]) -> Dict[str, Price]:
+        pass
+    
     @abstractmethod
     async def get_by_date_range(
         self, 
@@ -27,6 +67,36 @@ class PriceRepository(ABC):
     ) -> List[Price]:
         pass
     
+    @abstractmethod
+    async def get_by_date_range_rows(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[PriceRow]:
+        pass
+    
+    @abstractmethod
+    async def get_by_date_range_many(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, List[Price]]:
+        pass
+    
+    @abstractmethod
+    async def get_ohlc(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        bucket_seconds: int
+    ) -> List[Candle]:
+        pass
+    
     @abstractmethod
     async def batch_save(self, prices: List[Price]) -> List[Price]:
+        # one stored row per distinct (ticker, timestamp), in no particular order:
+        # keys that already existed come back as stored, whatever the conflict policy
         pass
\ No newline at end of file
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List
+from ..entities.candle import Candle
+
+
+class PriceRollupRepository(ABC):
+    
+    @abstractmethod
+    def resolutions(self) -> List[int]:
+        pass
+    
+    @abstractmethod
+    async def refresh(self, start_timestamp: int, end_timestamp: int) -> int:
+        pass
+    
+    @abstractmethod
+    async def get_ohlc(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        bucket_seconds: int,
+        resolution_seconds: int
+    ) -> List[Candle]:
+        pass
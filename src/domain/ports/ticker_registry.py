@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import FrozenSet, List, Optional
+from ..exceptions.domain_exceptions import InvalidTickerException
+
+
+class TickerRegistry(ABC):
+
+    @abstractmethod
+    def tickers(self) -> FrozenSet[str]:
+        pass
+
+    @abstractmethod
+    def index_name(self, ticker: str) -> Optional[str]:
+        pass
+
+    def is_supported(self, ticker: str) -> bool:
+        return ticker in self.tickers()
+
+    def validate(self, ticker: str) -> None:
+        if ticker not in self.tickers():
+            raise InvalidTickerException(
+                f"Invalid ticker: {ticker}. Supported tickers: {sorted(self.tickers())}"
+            )
+
+    def validate_many(self, tickers: List[str], limit: int) -> List[str]:
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            raise InvalidTickerException("At least one ticker is required")
+        if len(unique_tickers) > limit:
+            raise InvalidTickerException(f"At most {limit} tickers per request")
+        for ticker in unique_tickers:
+            self.validate(ticker)
+        return unique_tickers
@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class CandleInterval(str, Enum):
+    ONE_MINUTE = "1m"
+    FIVE_MINUTES = "5m"
+    ONE_HOUR = "1h"
+    ONE_DAY = "1d"
+    
+    @classmethod
+    def list(cls):
+        return [interval.value for interval in cls]
+    
+    @property
+    def seconds(self) -> int:
+        return {
+            "1m": 60,
+            "5m": 300,
+            "1h": 3600,
+            "1d": 86400,
+        }[self.value]
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Set
+from redis.asyncio import Redis
+from src.domain.ports.price_cache import PriceCache
+from src.domain.ports.price_repository import PriceRepository
+from src.domain.entities.price import Price
+from src.infrastructure.config.settings import settings
+from .memory_price_cache import InMemoryPriceCache
+from .price_ring_buffer import RecentPriceWindow
+from .redis_price_cache import RedisPriceCache, PriceUpdateSubscriber, create_redis_client
+from .tiered_price_cache import TieredPriceCache
+
+logger = logging.getLogger(__name__)
+
+
+class PriceCacheManager:
+    def __init__(self):
+        self.local = InMemoryPriceCache(ttl=settings.PRICE_CACHE_TTL)
+        self.remote: Optional[RedisPriceCache] = None
+        self.window: Optional[RecentPriceWindow] = None
+        self.subscriber: Optional[PriceUpdateSubscriber] = None
+        self.cache: PriceCache = self.local
+        self._redis = None
+
+    async def start(self):
+        if not settings.PRICE_CACHE_REDIS_ENABLED:
+            return
+
+        self._redis = create_redis_client()
+        self.remote = RedisPriceCache(
+            self._redis,
+            ttl=settings.PRICE_CACHE_REDIS_TTL,
+            window_seconds=settings.PRICE_CACHE_WINDOW_SECONDS,
+            channel=settings.PRICE_CACHE_CHANNEL,
+        )
+        self.cache = TieredPriceCache(self.local, self.remote)
+
+        # the ring buffer is only complete while the update feed is, so it
+        # exists only together with the subscriber
+        if settings.PRICE_RING_BUFFER_CAPACITY > 0:
+            self.window = RecentPriceWindow(settings.PRICE_RING_BUFFER_CAPACITY)
+            self.local.window = self.window
+
+        self.subscriber = PriceUpdateSubscriber(
+            self._redis,
+            settings.PRICE_CACHE_CHANNEL,
+            self.apply_updates,
+            on_disconnect=self.window.reset if self.window else None,
+            on_reset=self.window.reset if self.window else None,
+        )
+        self.subscriber.start()
+
+    async def stop(self):
+        if self.subscriber:
+            await self.subscriber.stop()
+            self.subscriber = None
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+        self.remote = None
+        self.local.window = None
+        self.window = None
+        self.cache = self.local
+
+    async def apply_updates(self, prices: List[Price]):
+        for price in prices:
+            await self.local.set_last(price)
+        if self.window:
+            self.window.add(prices)
+
+    async def warm_window(
+        self,
+        repository: PriceRepository,
+        tickers: List[str],
+        timeout: float = 30.0,
+        batch_size: int = 5000,
+        concurrency: int = 2,
+    ) -> int:
+        if not self.window or not self.subscriber:
+            return 0
+
+        # rows committed before the subscription is live would never reach the buffer
+        try:
+            await asyncio.wait_for(self.subscriber.subscribed.wait(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Price updates are not subscribed, skipping ring buffer warm-up")
+            return 0
+
+        since = int(time.time()) - settings.PRICE_CACHE_WINDOW_SECONDS
+        # a few tickers at a time, leaving the rest of the pool to requests
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load(ticker: str):
+            async with semaphore:
+                rows = deque(maxlen=self.window.capacity)
+                async for batch in repository.stream_row_batches(
+                    ticker, batch_size, start_timestamp=since
+                ):
+                    rows.extend(batch)
+            self.window.load(ticker, rows, since)
+
+        await asyncio.gather(*(load(ticker) for ticker in tickers))
+        return len(tickers)
+
+    def stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"local": self.local.stats()}
+        if self.remote:
+            stats["redis"] = self.remote.stats()
+        if self.window:
+            stats["window"] = self.window.stats()
+        if self.subscriber:
+            stats["updates_received"] = self.subscriber.messages_received
+        return stats
+
+
+# tickers with prices lost by a failed publish whose reset has not reached Redis yet
+_unpublished_tickers: Set[str] = set()
+
+
+async def publish_prices(prices: List[Price], redis: Optional[Redis] = None):
+    if not settings.PRICE_CACHE_REDIS_ENABLED or not prices:
+        return
+
+    owns_client = redis is None
+    if owns_client:
+        redis = create_redis_client()
+    cache = RedisPriceCache(
+        redis,
+        ttl=settings.PRICE_CACHE_REDIS_TTL,
+        window_seconds=settings.PRICE_CACHE_WINDOW_SECONDS,
+        channel=settings.PRICE_CACHE_CHANNEL,
+    )
+    try:
+        pending = set(_unpublished_tickers)
+        try:
+            await cache.publish_prices(prices, reset_tickers=pending)
+            _unpublished_tickers.difference_update(pending)
+        except Exception as e:
+            logger.warning(f"Failed to publish {len(prices)} prices to Redis: {str(e)}")
+            _unpublished_tickers.update(price.ticker for price in prices)
+            await _reset_coverage(cache)
+    finally:
+        if owns_client:
+            await redis.aclose()
+
+
+async def _reset_coverage(cache: RedisPriceCache):
+    # best effort: if Redis is still failing, the reset goes out with the next publish
+    pending = set(_unpublished_tickers)
+    try:
+        await cache.reset_coverage(pending)
+        _unpublished_tickers.difference_update(pending)
+    except Exception as e:
+        logger.warning(f"Failed to reset price coverage for {len(pending)} tickers: {str(e)}")
+
+
+price_cache_manager = PriceCacheManager()
@@ -0,0 +1,90 @@
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from src.domain.ports.price_cache import PriceCache
+from src.domain.ports.price_repository import PriceRow
+from src.domain.entities.price import Price
+from .price_ring_buffer import RecentPriceWindow
+
+
+class InMemoryPriceCache(PriceCache):
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        window: Optional[RecentPriceWindow] = None,
+    ):
+        self.ttl = ttl
+        self._clock = clock
+        # recent range queries; only attached while an update feed keeps it complete
+        self.window = window
+        self._entries: Dict[str, Tuple[Price, float]] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get_last(self, ticker: str) -> Optional[Price]:
+        entry = self._entries.get(ticker)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        price, expires_at = entry
+        if expires_at <= self._clock():
+            del self._entries[ticker]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return price
+
+    async def set_last(self, price: Price) -> None:
+        current = self._entries.get(price.ticker)
+        if current and current[0].timestamp > price.timestamp:
+            price = current[0]
+
+        self._entries[price.ticker] = (price, self._clock() + self.ttl)
+
+    async def invalidate(self, ticker: Optional[str] = None) -> None:
+        if ticker is None:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+        elif self._entries.pop(ticker, None) is not None:
+            self.invalidations += 1
+
+    async def get_range(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[Price]]:
+        rows = await self.get_range_rows(ticker, start_timestamp, end_timestamp)
+        if rows is None:
+            return None
+        return [
+            Price(id=price_id, ticker=row_ticker, price=price, timestamp=timestamp)
+            for price_id, row_ticker, price, timestamp in rows
+        ]
+
+    async def get_range_rows(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[PriceRow]]:
+        if self.window is None:
+            return None
+        return self.window.get_range_rows(ticker, start_timestamp, end_timestamp)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
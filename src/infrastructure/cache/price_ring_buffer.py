@@ -0,0 +1,195 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+from src.domain.ports.price_repository import PriceRow
+from src.domain.entities.price import Price
+
+# three 8-byte columns (id, timestamp, price) per slot: a full buffer costs
+# 24 * capacity bytes per ticker, e.g. ~2 MiB for 86400 one-second prices
+BYTES_PER_SLOT = 24
+NO_ID = -1
+
+
+class _LogicalView:
+    # read-only view of a ring column in oldest-to-newest order, for bisect
+
+    def __init__(self, buffer: "PriceRingBuffer", column: array):
+        self.buffer = buffer
+        self.column = column
+
+    def __len__(self) -> int:
+        return len(self.column)
+
+    def __getitem__(self, index: int):
+        return self.column[self.buffer._slot(index)]
+
+
+class PriceRingBuffer:
+    """Fixed-capacity ring of one ticker's prices, kept in timestamp order.
+
+    The columns grow up to ``capacity`` slots and then overwrite the oldest
+    slot, so memory never exceeds ``BYTES_PER_SLOT * capacity`` bytes.
+    ``covered_since`` is the timestamp from which the buffer holds every price.
+    """
+
+    def __init__(self, ticker: str, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.ticker = ticker
+        self.capacity = capacity
+        self.covered_since: Optional[int] = None
+        self._ids = array("q")
+        self._timestamps = array("q")
+        self._prices = array("d")
+        self._head = 0
+        self._view = _LogicalView(self, self._timestamps)
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def _slot(self, index: int) -> int:
+        return (self._head + index) % self.capacity if len(self._timestamps) == self.capacity else index
+
+    @property
+    def oldest(self) -> Optional[int]:
+        return self._view[0] if self._timestamps else None
+
+    @property
+    def newest(self) -> Optional[int]:
+        return self._view[len(self) - 1] if self._timestamps else None
+
+    def append(self, price_id: Optional[int], price: float, timestamp: int):
+        newest = self.newest
+        if newest is not None and timestamp <= newest:
+            index = bisect_left(self._view, timestamp)
+            if index < len(self) and self._view[index] == timestamp:
+                slot = self._slot(index)
+                self._ids[slot] = NO_ID if price_id is None else price_id
+                self._prices[slot] = price
+            elif self.covered_since is not None and timestamp >= self.covered_since:
+                # a late price cannot be inserted into the ring; ranges reaching
+                # back to it are left to the repository
+                self.covered_since = timestamp + 1
+            return
+
+        if self.covered_since is None:
+            self.covered_since = timestamp
+
+        if len(self._timestamps) < self.capacity:
+            self._ids.append(NO_ID if price_id is None else price_id)
+            self._timestamps.append(timestamp)
+            self._prices.append(price)
+            return
+
+        self._ids[self._head] = NO_ID if price_id is None else price_id
+        self._timestamps[self._head] = timestamp
+        self._prices[self._head] = price
+        self._head = (self._head + 1) % self.capacity
+        self.covered_since = max(self.covered_since, self.oldest)
+
+    def covers(self, start_timestamp: int) -> bool:
+        return self.covered_since is not None and start_timestamp >= self.covered_since
+
+    def range_rows(self, start_timestamp: int, end_timestamp: int) -> List[PriceRow]:
+        # newest first, like the repository's range queries
+        lo = bisect_left(self._view, start_timestamp)
+        hi = bisect_right(self._view, end_timestamp, lo)
+        if lo >= hi:
+            return []
+
+        # the logical range is at most two contiguous physical segments
+        start, stop = self._slot(lo), self._slot(hi - 1) + 1
+        segments = [(start, stop)] if start < stop else [(start, self.capacity), (0, stop)]
+        ids, timestamps, prices = [], [], []
+        for begin, end in segments:
+            ids.extend(self._ids[begin:end])
+            timestamps.extend(self._timestamps[begin:end])
+            prices.extend(self._prices[begin:end])
+
+        ticker = self.ticker
+        return [
+            (None if price_id == NO_ID else price_id, ticker, price, timestamp)
+            for price_id, price, timestamp in zip(
+                reversed(ids), reversed(prices), reversed(timestamps)
+            )
+        ]
+
+    def memory_bytes(self) -> int:
+        return sum(
+            column.itemsize * len(column)
+            for column in (self._ids, self._timestamps, self._prices)
+        )
+
+
+class RecentPriceWindow:
+    """Per-ticker ring buffers answering recent range queries from memory."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._buffers: Dict[str, PriceRingBuffer] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def _buffer(self, ticker: str) -> PriceRingBuffer:
+        buffer = self._buffers.get(ticker)
+        if buffer is None:
+            buffer = self._buffers[ticker] = PriceRingBuffer(ticker, self.capacity)
+        return buffer
+
+    def add(self, prices: Iterable[Price]):
+        for price in sorted(prices, key=lambda price: price.timestamp):
+            self._buffer(price.ticker).append(price.id, price.price, price.timestamp)
+
+    def load(self, ticker: str, rows: Iterable[PriceRow], covered_since: int):
+        # rows come from the repository in ascending order; prices pushed while
+        # they were being read are kept on top of them
+        buffer = PriceRingBuffer(ticker, self.capacity)
+        buffer.covered_since = covered_since
+        for price_id, _, price, timestamp in rows:
+            buffer.append(price_id, price, timestamp)
+
+        live = self._buffers.get(ticker)
+        if live is not None and live.newest is not None:
+            newest = buffer.newest
+            for price_id, _, price, timestamp in reversed(
+                live.range_rows(newest + 1 if newest is not None else 0, live.newest)
+            ):
+                buffer.append(price_id, price, timestamp)
+
+        if len(buffer) == self.capacity:
+            buffer.covered_since = max(covered_since, buffer.oldest)
+        self._buffers[ticker] = buffer
+
+    def get_range_rows(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[PriceRow]]:
+        buffer = self._buffers.get(ticker)
+        if buffer is None or not buffer.covers(start_timestamp):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return buffer.range_rows(start_timestamp, end_timestamp)
+
+    def reset(self, tickers: Optional[Iterable[str]] = None):
+        # called when the update feed was interrupted (for all tickers) or a
+        # publish failed (for its tickers): nothing buffered so far is known
+        # to be complete, coverage restarts with the next price
+        if tickers is None:
+            self._buffers.clear()
+            return
+        for ticker in tickers:
+            self._buffers.pop(ticker, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "tickers": len(self._buffers),
+            "capacity": self.capacity,
+            "memory_bytes": sum(buffer.memory_bytes() for buffer in self._buffers.values()),
+        }
@@ -0,0 +1,277 @@
+import asyncio
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.domain.ports.price_cache import PriceCache
+from src.domain.entities.price import Price
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+# replaces the cached latest price only with a newer one: read-path fills may
+# carry a lagging replica's value while the ingest side has already published
+SET_LAST_IF_NEWER = """
+local current = redis.call('GET', KEYS[1])
+if current and cjson.decode(current)['timestamp'] > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+
+def create_redis_client() -> Redis:
+    return Redis.from_url(settings.redis_url, decode_responses=True)
+
+
+def price_to_dict(price: Price) -> Dict:
+    return {
+        "id": price.id,
+        "ticker": price.ticker,
+        "price": price.price,
+        "timestamp": price.timestamp,
+    }
+
+
+def encode_price(price: Price) -> str:
+    return json.dumps(price_to_dict(price))
+
+
+def decode_price(raw: str) -> Price:
+    return Price(**json.loads(raw))
+
+
+def encode_reset(tickers: Iterable[str]) -> str:
+    # tells subscribers that prices of these tickers may have been lost
+    return json.dumps({"reset": sorted(tickers)})
+
+
+class RedisPriceCache(PriceCache):
+
+    def __init__(
+        self,
+        redis: Redis,
+        ttl: int = 300,
+        window_seconds: int = 86400,
+        channel: str = "prices:updates",
+        key_prefix: str = "prices",
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.window_seconds = window_seconds
+        self.channel = channel
+        self.key_prefix = key_prefix
+        self._set_last_if_newer = redis.register_script(SET_LAST_IF_NEWER)
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    def _last_key(self, ticker: str) -> str:
+        return f"{self.key_prefix}:last:{ticker}"
+
+    def _window_key(self, ticker: str) -> str:
+        return f"{self.key_prefix}:window:{ticker}"
+
+    def _window_start_key(self, ticker: str) -> str:
+        return f"{self.key_prefix}:window_start:{ticker}"
+
+    async def get_last(self, ticker: str) -> Optional[Price]:
+        try:
+            raw = await self.redis.get(self._last_key(ticker))
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Redis price cache read failed: {str(e)}")
+            return None
+
+        if raw is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return decode_price(raw)
+
+    async def set_last(self, price: Price) -> None:
+        try:
+            await self._set_last_if_newer(
+                keys=[self._last_key(price.ticker)],
+                args=[encode_price(price), price.timestamp, self.ttl],
+            )
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Redis price cache write failed: {str(e)}")
+
+    async def invalidate(self, ticker: Optional[str] = None) -> None:
+        try:
+            if ticker is None:
+                keys = [key async for key in self.redis.scan_iter(f"{self.key_prefix}:*")]
+            else:
+                keys = [
+                    self._last_key(ticker),
+                    self._window_key(ticker),
+                    self._window_start_key(ticker),
+                ]
+            if keys:
+                await self.redis.delete(*keys)
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Redis price cache invalidation failed: {str(e)}")
+
+    async def get_range(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[Price]]:
+        try:
+            window_start = await self.redis.get(self._window_start_key(ticker))
+            if window_start is None or start_timestamp < int(window_start):
+                self.misses += 1
+                return None
+
+            members = await self.redis.zrevrangebyscore(
+                self._window_key(ticker), end_timestamp, start_timestamp
+            )
+        except RedisError as e:
+            self.errors += 1
+            logger.warning(f"Redis price window read failed: {str(e)}")
+            return None
+
+        self.hits += 1
+        return [decode_price(member) for member in members]
+
+    async def reset_coverage(self, tickers: Iterable[str]) -> None:
+        # raises on Redis errors so the caller knows the reset is still owed
+        tickers = set(tickers)
+        if tickers:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(*(self._window_start_key(ticker) for ticker in tickers))
+                pipe.publish(self.channel, encode_reset(tickers))
+                await pipe.execute()
+
+    async def publish_prices(self, prices: List[Price], reset_tickers: Iterable[str] = ()) -> None:
+        if not prices:
+            return
+        reset_tickers = set(reset_tickers)
+
+        newest: Dict[str, Price] = {}
+        oldest: Dict[str, int] = {}
+        for price in prices:
+            if price.ticker not in newest or price.timestamp > newest[price.ticker].timestamp:
+                newest[price.ticker] = price
+            oldest[price.ticker] = min(oldest.get(price.ticker, price.timestamp), price.timestamp)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            if reset_tickers:
+                # the window has a hole where the failed batch belongs: coverage
+                # restarts with this batch
+                pipe.delete(*(self._window_start_key(ticker) for ticker in reset_tickers))
+            for price in prices:
+                window_key = self._window_key(price.ticker)
+                pipe.zremrangebyscore(window_key, price.timestamp, price.timestamp)
+                pipe.zadd(window_key, {encode_price(price): price.timestamp})
+
+            for ticker, price in newest.items():
+                cutoff = price.timestamp - self.window_seconds
+                pipe.set(self._last_key(ticker), encode_price(price), ex=self.ttl)
+                pipe.zremrangebyscore(self._window_key(ticker), "-inf", f"({cutoff}")
+                # Coverage marker: the window is complete from this timestamp on.
+                # It expires unless the writer keeps refreshing it.
+                pipe.set(self._window_start_key(ticker), oldest[ticker], nx=True)
+                pipe.expire(self._window_start_key(ticker), self.ttl)
+
+            if reset_tickers:
+                pipe.publish(self.channel, encode_reset(reset_tickers))
+            pipe.publish(self.channel, json.dumps([price_to_dict(price) for price in prices]))
+            await pipe.execute()
+
+        for ticker, price in newest.items():
+            cutoff = price.timestamp - self.window_seconds
+            window_start = await self.redis.get(self._window_start_key(ticker))
+            if window_start is not None and int(window_start) < cutoff:
+                await self.redis.set(self._window_start_key(ticker), cutoff, ex=self.ttl)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "errors": self.errors}
+
+
+class PriceUpdateSubscriber:
+
+    def __init__(
+        self,
+        redis: Redis,
+        channel: str,
+        on_prices: Callable[[List[Price]], Awaitable[None]],
+        max_backoff: float = 30.0,
+        on_disconnect: Optional[Callable[[], None]] = None,
+        on_reset: Optional[Callable[[List[str]], None]] = None,
+    ):
+        self.redis = redis
+        self.channel = channel
+        self.on_prices = on_prices
+        self.max_backoff = max_backoff
+        # updates published while disconnected are lost for good
+        self.on_disconnect = on_disconnect
+        # and so are prices whose publish failed on the writer's side
+        self.on_reset = on_reset
+        self.subscribed = asyncio.Event()
+        self.messages_received = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        backoff = 1.0
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    self.subscribed.set()
+                    backoff = 1.0
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        await self._handle(message["data"])
+            except asyncio.CancelledError:
+                self.subscribed.clear()
+                raise
+            except Exception as e:
+                self.subscribed.clear()
+                if self.on_disconnect:
+                    self.on_disconnect()
+                logger.warning(
+                    f"Price update subscription lost: {str(e)}. Reconnecting in {backoff:.0f}s"
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    async def _handle(self, data: str):
+        try:
+            payload = json.loads(data)
+            if isinstance(payload, dict):
+                reset, prices = [str(ticker) for ticker in payload["reset"]], []
+            else:
+                reset, prices = [], [Price(**item) for item in payload]
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Ignoring malformed price update: {str(e)}")
+            return
+
+        self.messages_received += 1
+        if reset and self.on_reset:
+            self.on_reset(reset)
+        if prices:
+            await self.on_prices(prices)
@@ -0,0 +1,51 @@
+from typing import List, Optional
+from src.domain.ports.price_cache import PriceCache
+from src.domain.entities.price import Price
+from src.domain.ports.price_repository import PriceRow
+
+
+class TieredPriceCache(PriceCache):
+
+    def __init__(self, local: PriceCache, remote: PriceCache):
+        self.local = local
+        self.remote = remote
+
+    async def get_last(self, ticker: str) -> Optional[Price]:
+        price = await self.local.get_last(ticker)
+        if price:
+            return price
+
+        price = await self.remote.get_last(ticker)
+        if price:
+            await self.local.set_last(price)
+        return price
+
+    async def set_last(self, price: Price) -> None:
+        await self.local.set_last(price)
+        await self.remote.set_last(price)
+
+    async def invalidate(self, ticker: Optional[str] = None) -> None:
+        await self.local.invalidate(ticker)
+        await self.remote.invalidate(ticker)
+
+    async def get_range(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[Price]]:
+        prices = await self.local.get_range(ticker, start_timestamp, end_timestamp)
+        if prices is not None:
+            return prices
+        return await self.remote.get_range(ticker, start_timestamp, end_timestamp)
+
+    async def get_range_rows(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int
+    ) -> Optional[List[PriceRow]]:
+        rows = await self.local.get_range_rows(ticker, start_timestamp, end_timestamp)
+        if rows is not None:
+            return rows
+        return await self.remote.get_range_rows(ticker, start_timestamp, end_timestamp)
@@ -1,6 +1,34 @@
+from collections import defaultdict
 from src.infrastructure.config.settings import settings
 
 
+FETCH_TASK = 'src.infrastructure.celery_app.tasks.fetch_market_prices_task'
+
+
+def fetch_schedule():
+    # one beat entry per distinct interval, each fetching all of its tickers in one task;
+    # the default entry resolves its tickers from the ticker registry at run time
+    schedule = {
+        f'fetch-prices-every-{settings.INGEST_INTERVAL:g}s': {
+            'task': FETCH_TASK,
+            'schedule': settings.INGEST_INTERVAL,
+        },
+    }
+    
+    groups = defaultdict(list)
+    for ticker, interval in settings.INGEST_TICKER_INTERVALS.items():
+        if interval != settings.INGEST_INTERVAL:
+            groups[interval].append(ticker)
+    
+    for interval, tickers in groups.items():
+        schedule[f'fetch-prices-every-{interval:g}s'] = {
+            'task': FETCH_TASK,
+            'schedule': interval,
+            'kwargs': {'tickers': tickers},
+        }
+    return schedule
+
+
 class CeleryConfig:    
     broker_url = settings.CELERY_BROKER_URL
     result_backend = settings.CELERY_RESULT_BACKEND
@@ -12,9 +40,10 @@ class CeleryConfig:
     enable_utc = True
     
     beat_schedule = {
-        'fetch-prices-every-minute': {
-            'task': 'src.infrastructure.celery_app.tasks.fetch_market_prices_task',
-            'schedule': 60.0, 
+        **fetch_schedule(),
+        'maintain-price-partitions-daily': {
+            'task': 'src.infrastructure.celery_app.tasks.maintain_price_partitions_task',
+            'schedule': 86400.0,
         },
     }
     
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+from typing import Any, Coroutine, Optional, TypeVar
+from celery.signals import worker_process_init, worker_process_shutdown, worker_shutdown
+from redis.asyncio import Redis
+from src.domain.ports.market_data_provider import MarketDataProvider
+from src.infrastructure.cache.redis_price_cache import create_redis_client
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import db_manager
+from src.infrastructure.external.http_session import start_http_clients, close_http_clients
+from src.infrastructure.external.provider_factory import create_market_data_provider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# One event loop per worker process, shared by every task it runs: the asyncpg
+# pool, aiohttp session and Redis connection are bound to the loop they were
+# opened on, so they are only reusable while that loop outlives each task.
+class WorkerRuntime:
+
+    def __init__(self):
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.market_data_provider: Optional[MarketDataProvider] = None
+        self.redis: Optional[Redis] = None
+        self.tasks_run = 0
+
+    @property
+    def is_started(self) -> bool:
+        return self.loop is not None and not self.loop.is_closed()
+
+    def start(self):
+        if self.is_started:
+            return
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        db_manager.reset_after_fork()
+        self.loop.run_until_complete(start_http_clients())
+        self.market_data_provider = create_market_data_provider()
+        if settings.PRICE_CACHE_REDIS_ENABLED:
+            self.redis = create_redis_client()
+
+        logger.info("Worker event loop started")
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        self.start()
+        self.tasks_run += 1
+        return self.loop.run_until_complete(coro)
+
+    def stop(self):
+        if not self.is_started:
+            return
+
+        try:
+            self.loop.run_until_complete(self._close())
+        finally:
+            self.loop.close()
+            asyncio.set_event_loop(None)
+            self.loop = None
+            self.market_data_provider = None
+            logger.info(f"Worker event loop stopped after {self.tasks_run} tasks")
+
+    async def _close(self):
+        if self.redis:
+            await self.redis.aclose()
+            self.redis = None
+        await close_http_clients()
+        await db_manager.dispose()
+
+
+worker_runtime = WorkerRuntime()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    worker_runtime.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    worker_runtime.stop()
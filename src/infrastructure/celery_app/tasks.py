@@ -1,26 +1,35 @@
-import asyncio
 import logging
-from typing import List
+from typing import List, Optional
 from src.infrastructure.celery_app.worker import celery_app
 from src.application.use_cases.fetch_market_prices_uc import FetchMarketPricesUseCase
-from src.infrastructure.external.deribit_client import DeribitClient
+from src.infrastructure.celery_app.runtime import worker_runtime
+from src.infrastructure.external.provider_factory import is_streaming_provider
 from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.database.repositories.price_rollup_repository_impl import PriceRollupRepositoryImpl
 from src.infrastructure.database.session import db_manager
+from src.infrastructure.database.partitions import PricePartitionManager
+from src.infrastructure.cache.cache_manager import publish_prices
 from src.infrastructure.config.settings import settings
-from src.domain.value_objects.currency import CurrencyPair
+from src.infrastructure.external.deribit_ticker_registry import ticker_registry
 
 logger = logging.getLogger(__name__)
 
 
 @celery_app.task(bind=True, max_retries=3)
 def fetch_market_prices_task(self, tickers: List[str] = None):
-    if tickers is None:
-        tickers = CurrencyPair.list()
+    if is_streaming_provider():
+        logger.info("Skipping poll: prices are streamed by the websocket ingestor")
+        return {'success': True, 'prices_fetched': 0, 'skipped': True}
     
     try:        
-        result = asyncio.run(async_fetch_prices(tickers))
+        result = worker_runtime.run(async_fetch_prices(tickers))
         
         logger.info(f"Successfully fetched {result['prices_fetched']} prices")
+        
+        if result['prices_fetched']:
+            update_price_rollups_task.delay(
+                result['min_timestamp'], result['max_timestamp']
+            )
         return result
         
     except Exception as e:
@@ -30,27 +39,46 @@ def fetch_market_prices_task(self, tickers: List[str] = None):
         raise self.retry(exc=e, countdown=countdown)
 
 
-async def async_fetch_prices(tickers: List[str]):
+def default_schedule_tickers() -> List[str]:
+    # tickers with their own interval are fetched by their own beat entry
+    return [
+        ticker
+        for ticker, interval in settings.ticker_intervals(settings.ingest_tickers(ticker_registry.tickers())).items()
+        if interval == settings.INGEST_INTERVAL
+    ]
+
+
+async def async_fetch_prices(tickers: Optional[List[str]] = None):
+    if tickers is None:
+        await ticker_registry.ensure_fresh()
+        tickers = default_schedule_tickers()
+    
     try:
         async with db_manager.async_session_factory() as session:
             try:
-                deribit_client = DeribitClient(settings.DERIBIT_API_URL)
-                price_repository = PriceRepositoryImpl(session)
+                price_repository = PriceRepositoryImpl(
+                    session,
+                    on_conflict=settings.PRICE_INSERT_ON_CONFLICT
+                )
                 
                 fetch_uc = FetchMarketPricesUseCase(
-                    market_data_provider=deribit_client,
+                    market_data_provider=worker_runtime.market_data_provider,
                     price_repository=price_repository
                 )
                 
                 prices = await fetch_uc.execute(tickers)
                 
                 await session.commit()
+                await publish_prices(prices, worker_runtime.redis)
                 
                 logger.info(f"Successfully fetched {len(prices)} prices")
+                timestamps = [price.timestamp for price in prices]
                 return {
                     'success': True,
                     'prices_fetched': len(prices) if prices else 0,
-                    'tickers': tickers
+                    'tickers': tickers,
+                    'min_timestamp': min(timestamps) if timestamps else None,
+                    'max_timestamp': max(timestamps) if timestamps else None,
                 }
                 
             except Exception as e:
@@ -59,4 +87,61 @@ async def async_fetch_prices(tickers: List[str]):
                 
     except Exception as e:
         logger.error(f"Error in async_fetch: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+@celery_app.task(bind=True, max_retries=3)
+def update_price_rollups_task(self, start_timestamp: int, end_timestamp: int):
+    try:
+        refreshed = worker_runtime.run(async_refresh_rollups(start_timestamp, end_timestamp))
+        
+        logger.info(
+            f"Refreshed {refreshed} rollup buckets for {start_timestamp}..{end_timestamp}"
+        )
+        return {'success': True, 'buckets_refreshed': refreshed}
+        
+    except Exception as e:
+        logger.error(f"Rollup refresh task failed: {str(e)}")
+        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+
+
+async def async_refresh_rollups(start_timestamp: int, end_timestamp: int) -> int:
+    async with db_manager.async_session_factory() as session:
+        try:
+            refreshed = await PriceRollupRepositoryImpl(session).refresh(
+                start_timestamp, end_timestamp
+            )
+            await session.commit()
+            return refreshed
+        except Exception:
+            await session.rollback()
+            raise
+
+
+
+@celery_app.task(bind=True, max_retries=3)
+def maintain_price_partitions_task(self):
+    try:
+        result = worker_runtime.run(async_maintain_partitions())
+        
+        logger.info(
+            f"Price partitions created: {result['created']}, expired: {result['expired']}"
+        )
+        return result
+        
+    except Exception as e:
+        logger.error(f"Partition maintenance task failed: {str(e)}")
+        raise self.retry(exc=e, countdown=2 ** self.request.retries)
+
+
+async def async_maintain_partitions():
+    async with db_manager.engine.begin() as conn:
+        partition_manager = PricePartitionManager(conn)
+        created = await partition_manager.ensure_partitions(
+            settings.PRICE_PARTITION_MONTHS_AHEAD
+        )
+        expired = await partition_manager.apply_retention(
+            settings.PRICE_RETENTION_MONTHS,
+            settings.PRICE_RETENTION_ACTION
+        )
+    return {'success': True, 'created': created, 'expired': expired}
@@ -1,4 +1,5 @@
 from celery import Celery
+from src.infrastructure.monitoring.metrics import metrics, install_celery_metrics
 from .celery_config import CeleryConfig
 
 
@@ -13,4 +14,7 @@ def create_celery_app():
     return celery_app
 
 
-celery_app = create_celery_app()
\ No newline at end of file
+celery_app = create_celery_app()
+
+if metrics.enabled:
+    install_celery_metrics()
\ No newline at end of file
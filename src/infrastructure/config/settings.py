@@ -1,6 +1,6 @@
 # src/infrastructure/config/settings.py
 import os
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -8,22 +8,104 @@ from pydantic import Field
 class Settings(BaseSettings):    
     APP_ENV: str = "development"
     LOG_LEVEL: str = "INFO"
+    # Prometheus metrics: /metrics on the API, METRICS_PORT on Celery workers and the ingest daemon
+    METRICS_ENABLED: bool = False
+    METRICS_PORT: int = 9100
+    # share of successful requests logged; 5xx and slow requests are always logged
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0
+    REQUEST_LOG_SLOW_THRESHOLD: float = 1.0
     
     POSTGRES_USER: str = "postgres"          
     POSTGRES_PASSWORD: str = "postgres"       
     POSTGRES_DB: str = "db"
     POSTGRES_HOST: str = "postgres"        
     POSTGRES_PORT: int = 5432
+    # optional streaming replica for read-only API queries
+    POSTGRES_REPLICA_HOST: Optional[str] = None
+    POSTGRES_REPLICA_PORT: Optional[int] = None
+    
+    # per engine and per process: API, each Celery child and the ingest daemon get their own pool,
+    # so size them against max_connections before raising (e.g. 10+10 for a busy API replica)
+    DB_POOL_SIZE: int = 3
+    DB_MAX_OVERFLOW: int = 2
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
     
     REDIS_HOST: str = "redis"                
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     
     DERIBIT_API_URL: str = "https://www.deribit.com/api/v2"
+    DERIBIT_MAX_CONCURRENCY: int = 10
+    DERIBIT_REQUEST_TIMEOUT: float = 5.0
+    DERIBIT_WS_URL: str = "wss://www.deribit.com/ws/api/v2"
+    DERIBIT_WS_HEARTBEAT_INTERVAL: int = 30
+    # load supported tickers from public/get_index_price_names instead of CurrencyPair;
+    # this only widens validation, INGEST_TICKERS decides what is collected
+    TICKER_REGISTRY_DYNAMIC: bool = True
+    TICKER_REGISTRY_REFRESH_INTERVAL: float = 3600.0
+    
+    # rest: polled by Celery beat or the ingest daemon; websocket: streamed by the ingest daemon
+    MARKET_DATA_PROVIDER: str = "rest"
+    # tickers fetched/streamed and kept warm in the API caches, ["*"] for every registry index
+    INGEST_TICKERS: List[str] = Field(default_factory=lambda: ["btc_usd", "eth_usd"])
+    INGEST_BATCH_SIZE: int = 500
+    INGEST_FLUSH_INTERVAL: float = 1.0
+    # default fetch interval in seconds; INGEST_TICKER_INTERVALS overrides it per ticker,
+    # e.g. INGEST_TICKER_INTERVALS='{"btc_usd": 2, "eth_usd": 15}'
+    INGEST_INTERVAL: float = 60.0
+    INGEST_TICKER_INTERVALS: Dict[str, float] = Field(default_factory=dict)
+    INGEST_JITTER: float = 0.0
+    # run the ingest daemon inside the API process (single-node deployments, no Celery)
+    INGEST_EMBEDDED: bool = False
+
+    HTTP_TIMEOUT: int = 10
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 20
+    HTTP_DNS_CACHE_TTL: int = 300
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0
+    
+    PRICE_INSERT_ON_CONFLICT: str = "ignore"
+    PRICE_CACHE_TTL: float = 60.0
+    PRICE_CACHE_REDIS_ENABLED: bool = True
+    PRICE_CACHE_REDIS_TTL: int = 300
+    PRICE_CACHE_WINDOW_SECONDS: int = 86400
+    PRICE_CACHE_CHANNEL: str = "prices:updates"
+    # per-process ring buffer of recent prices fed by PRICE_CACHE_CHANNEL (needs Redis);
+    # 24 bytes per slot per ticker, 0 disables it
+    PRICE_RING_BUFFER_CAPACITY: int = 86400
+    
+    # conditional GET on /prices/last and /prices/by-date; ranges ending more than
+    # HTTP_CACHE_CLOSED_RANGE_GRACE seconds ago are served as immutable
+    HTTP_CACHE_MAX_AGE: int = 5
+    HTTP_CACHE_IMMUTABLE_MAX_AGE: int = 31536000
+    HTTP_CACHE_CLOSED_RANGE_GRACE: int = 300
     
+    PRICE_PARTITION_MONTHS_AHEAD: int = 3
+    # 0 keeps raw prices forever; older months are detached/dropped only once rolled up
+    PRICE_RETENTION_MONTHS: int = 0
+    PRICE_RETENTION_ACTION: str = "detach"
+
     CELERY_BROKER_URL: str = Field(default="redis://redis:6379/0")
     CELERY_RESULT_BACKEND: str = Field(default="redis://redis:6379/0")
     
+    def ingest_tickers(self, available: Iterable[str]) -> List[str]:
+        available = set(available)
+        if "*" in self.INGEST_TICKERS:
+            return sorted(available)
+        return sorted(available & set(self.INGEST_TICKERS))
+    
+    def ticker_intervals(self, tickers: List[str]) -> Dict[str, float]:
+        return {
+            ticker: self.INGEST_TICKER_INTERVALS.get(ticker, self.INGEST_INTERVAL)
+            for ticker in tickers
+        }
+    
+    @property
+    def redis_url(self) -> str:
+        return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
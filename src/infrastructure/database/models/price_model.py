@@ -7,13 +7,16 @@ Base = declarative_base()
 class PriceModel(Base):    
     __tablename__ = "prices"
     
-    id = Column(Integer, primary_key=True, index=True)
-    ticker = Column(String(20), nullable=False, index=True)
+    # range-partitioned by month on timestamp, so the partition key is part of the PK
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    ticker = Column(String(20), nullable=False)
     price = Column(Float, nullable=False)
-    timestamp = Column(BigInteger, nullable=False, index=True)
+    timestamp = Column(BigInteger, primary_key=True)
     
     __table_args__ = (
-        Index('ix_ticker_timestamp', 'ticker', 'timestamp'),
+        Index('ix_ticker_timestamp', 'ticker', 'timestamp', unique=True),
+        Index('ix_prices_timestamp_brin', 'timestamp', postgresql_using='brin'),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
     )
     
     def __repr__(self):
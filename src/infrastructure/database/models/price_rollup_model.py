@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Float, BigInteger, Integer
+from .price_model import Base
+
+
+class PriceRollupColumns:
+    ticker = Column(String(20), primary_key=True)
+    bucket_start = Column(BigInteger, primary_key=True)
+    open = Column(Float, nullable=False)
+    high = Column(Float, nullable=False)
+    low = Column(Float, nullable=False)
+    close = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+    
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__}(ticker={self.ticker}, bucket_start={self.bucket_start}, "
+            f"open={self.open}, close={self.close}, count={self.count})>"
+        )
+
+
+class PriceRollup1mModel(PriceRollupColumns, Base):
+    __tablename__ = "price_rollups_1m"
+    resolution_seconds = 60
+
+
+class PriceRollup1hModel(PriceRollupColumns, Base):
+    __tablename__ = "price_rollups_1h"
+    resolution_seconds = 3600
+
+
+class PriceRollup1dModel(PriceRollupColumns, Base):
+    __tablename__ = "price_rollups_1d"
+    resolution_seconds = 86400
+
+
+# finest first: each level is rebuilt from the one before it
+ROLLUP_MODELS = (PriceRollup1mModel, PriceRollup1hModel, PriceRollup1dModel)
@@ -0,0 +1,146 @@
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "prices"
+DEFAULT_PARTITION = "prices_default"
+PARTITION_NAME = re.compile(r"^prices_y(\d{4})m(\d{2})$")
+
+
+def month_start(year: int, month: int) -> int:
+    return int(datetime(year, month, 1, tzinfo=timezone.utc).timestamp())
+
+
+def add_months(year: int, month: int, months: int):
+    index = year * 12 + (month - 1) + months
+    return index // 12, index % 12 + 1
+
+
+@dataclass(frozen=True)
+class MonthPartition:
+    year: int
+    month: int
+    
+    @classmethod
+    def containing(cls, timestamp: int) -> 'MonthPartition':
+        moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return cls(moment.year, moment.month)
+    
+    @classmethod
+    def from_name(cls, name: str) -> Optional['MonthPartition']:
+        match = PARTITION_NAME.match(name)
+        if not match:
+            return None
+        return cls(int(match.group(1)), int(match.group(2)))
+    
+    @property
+    def name(self) -> str:
+        return f"prices_y{self.year:04d}m{self.month:02d}"
+    
+    @property
+    def start(self) -> int:
+        return month_start(self.year, self.month)
+    
+    @property
+    def end(self) -> int:
+        return month_start(*add_months(self.year, self.month, 1))
+    
+    def shift(self, months: int) -> 'MonthPartition':
+        return MonthPartition(*add_months(self.year, self.month, months))
+    
+    def create_sql(self) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} PARTITION OF {PARENT_TABLE} "
+            f"FOR VALUES FROM ({self.start}) TO ({self.end})"
+        )
+
+
+class PricePartitionManager:
+    def __init__(self, connection: AsyncConnection):
+        self.connection = connection
+    
+    async def list_partitions(self) -> List[MonthPartition]:
+        result = await self.connection.execute(text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :parent"
+        ), {"parent": PARENT_TABLE})
+        
+        partitions = [MonthPartition.from_name(name) for name in result.scalars()]
+        return sorted(
+            (partition for partition in partitions if partition),
+            key=lambda partition: partition.start
+        )
+    
+    async def ensure_partitions(self, months_ahead: int, now: Optional[int] = None) -> List[str]:
+        current = MonthPartition.containing(now or int(datetime.now(timezone.utc).timestamp()))
+        existing = {partition.name for partition in await self.list_partitions()}
+        
+        created = []
+        for offset in range(months_ahead + 1):
+            partition = current.shift(offset)
+            if partition.name in existing:
+                continue
+            await self.connection.execute(text(partition.create_sql()))
+            created.append(partition.name)
+        
+        await self.connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"
+        ))
+        
+        if created:
+            logger.info(f"Created price partitions: {', '.join(created)}")
+        return created
+    
+    async def is_rolled_up(self, partition: MonthPartition) -> bool:
+        raw_count = await self.connection.scalar(text(
+            f"SELECT count(*) FROM {partition.name}"
+        ))
+        rolled_up_count = await self.connection.scalar(text(
+            "SELECT coalesce(sum(count), 0) FROM price_rollups_1m "
+            "WHERE bucket_start >= :start AND bucket_start < :end"
+        ), {"start": partition.start, "end": partition.end})
+        return raw_count == rolled_up_count
+    
+    async def apply_retention(
+        self,
+        retention_months: int,
+        action: str = "detach",
+        now: Optional[int] = None
+    ) -> List[str]:
+        if retention_months <= 0:
+            return []
+        if action not in ("detach", "drop"):
+            raise ValueError(f"Unknown retention action: {action}")
+        
+        current = MonthPartition.containing(now or int(datetime.now(timezone.utc).timestamp()))
+        cutoff = current.shift(-retention_months).start
+        
+        expired = []
+        for partition in await self.list_partitions():
+            if partition.end > cutoff:
+                break
+            
+            if not await self.is_rolled_up(partition):
+                logger.warning(
+                    f"Keeping {partition.name} past retention: rollups are incomplete"
+                )
+                continue
+            
+            await self.connection.execute(text(
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}"
+            ))
+            if action == "drop":
+                await self.connection.execute(text(f"DROP TABLE {partition.name}"))
+            expired.append(partition.name)
+        
+        if expired:
+            logger.info(f"Retention {action}ed price partitions: {', '.join(expired)}")
+        return expired
@@ -0,0 +1,44 @@
+from sqlalchemy import Integer, cast, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from src.infrastructure.database.models.price_model import PriceModel
+
+
+def bucket_expression(timestamp_column, bucket_seconds: int):
+    # Inlined so the GROUP BY expression matches the selected one textually
+    return timestamp_column - timestamp_column % literal_column(str(int(bucket_seconds)))
+
+
+def raw_ohlc_select(bucket_seconds: int):
+    bucket_start = bucket_expression(PriceModel.timestamp, bucket_seconds)
+
+    return select(
+        PriceModel.ticker,
+        bucket_start.label("bucket_start"),
+        func.array_agg(
+            aggregate_order_by(PriceModel.price, PriceModel.timestamp.asc())
+        )[1].label("open"),
+        func.max(PriceModel.price).label("high"),
+        func.min(PriceModel.price).label("low"),
+        func.array_agg(
+            aggregate_order_by(PriceModel.price, PriceModel.timestamp.desc())
+        )[1].label("close"),
+        cast(func.count(), Integer).label("count"),
+    ).group_by(PriceModel.ticker, bucket_start).order_by(bucket_start)
+
+
+def rollup_ohlc_select(rollup_model, bucket_seconds: int):
+    bucket_start = bucket_expression(rollup_model.bucket_start, bucket_seconds)
+
+    return select(
+        rollup_model.ticker,
+        bucket_start.label("bucket_start"),
+        func.array_agg(
+            aggregate_order_by(rollup_model.open, rollup_model.bucket_start.asc())
+        )[1].label("open"),
+        func.max(rollup_model.high).label("high"),
+        func.min(rollup_model.low).label("low"),
+        func.array_agg(
+            aggregate_order_by(rollup_model.close, rollup_model.bucket_start.desc())
+        )[1].label("close"),
+        cast(func.sum(rollup_model.count), Integer).label("count"),
+    ).group_by(rollup_model.ticker, bucket_start).order_by(bucket_start)
@@ -1,64 +1,189 @@
-from typing import List, Optional
+from enum import Enum
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, and_
-from src.domain.ports.price_repository import PriceRepository
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, desc, and_, update, column, table, text, true, func, literal, tuple_, BigInteger, Float, String
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.domain.ports.price_repository import PriceRepository, PriceRow
 from src.domain.entities.price import Price
+from src.domain.entities.candle import Candle
 from src.infrastructure.database.models.price_model import PriceModel
+from src.infrastructure.database.repositories.ohlc_queries import raw_ohlc_select
+from src.infrastructure.database.repositories.session_scope import SessionScope
+from src.infrastructure.monitoring.metrics import timed_methods
 
+# asyncpg accepts at most 32767 bind parameters per statement, 3 per row here
+INSERT_CHUNK_SIZE = 10000
+COPY_THRESHOLD = 50000
+
+_staging_table = table(
+    "prices_staging",
+    column("ticker", String),
+    column("price", Float),
+    column("timestamp", BigInteger),
+)
+
+
+class OnConflict(str, Enum):
+    IGNORE = "ignore"
+    UPDATE = "update"
+
+
+@timed_methods
+class PriceRepositoryImpl(SessionScope, PriceRepository):
+
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        on_conflict: OnConflict = OnConflict.IGNORE,
+        copy_threshold: int = COPY_THRESHOLD,
+        session_factory: Optional[async_sessionmaker] = None,
+    ):
+        super().__init__(session, session_factory)
+        self.on_conflict = OnConflict(on_conflict)
+        self.copy_threshold = copy_threshold
 
-class PriceRepositoryImpl(PriceRepository):
-    
-    def __init__(self, session: AsyncSession):
-        self.session = session
-    
     async def save(self, price: Price) -> Price:
-        price_model = PriceModel.from_domain(price)
-        
+        async with self._session(write=True) as session:
+            return await self._save(session, price)
+
+    async def _save(self, session: AsyncSession, price: Price) -> Price:
         if price.id:
-            existing = await self.session.get(PriceModel, price.id)
-            if existing:
-                existing.price = price.price
-                existing.timestamp = price.timestamp
-                price_model = existing
-        
-        self.session.add(price_model)
-        await self.session.flush([price_model])
-        await self.session.refresh(price_model)
-        
-        return price_model.to_domain()
-    
+            stmt = update(PriceModel).where(
+                PriceModel.id == price.id
+            ).values(
+                price=price.price,
+                timestamp=price.timestamp
+            ).returning(*self._returning_columns())
+
+            row = (await session.execute(stmt)).first()
+            if row:
+                return self._row_to_domain(row)
+
+        stmt = self._insert_statement(
+            pg_insert(PriceModel).values(**self._to_row(price, with_id=True))
+        )
+        row = (await session.execute(stmt)).first()
+        if row:
+            return self._row_to_domain(row)
+
+        existing = await session.execute(
+            select(*self._returning_columns()).where(
+                and_(
+                    PriceModel.ticker == price.ticker,
+                    PriceModel.timestamp == price.timestamp
+                )
+            )
+        )
+        return self._row_to_domain(existing.one())
+
     async def get_all(self, ticker: str) -> List[Price]:
         stmt = select(PriceModel).where(
             PriceModel.ticker == ticker
         ).order_by(PriceModel.timestamp.desc())
-        
-        result = await self.session.execute(stmt)
-        price_models = result.scalars().all()
-        
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            price_models = result.scalars().all()
+
         return [price_model.to_domain() for price_model in price_models]
-    
+
+    async def get_page(
+        self,
+        ticker: str,
+        limit: int,
+        before_timestamp: Optional[int] = None
+    ) -> List[Price]:
+        rows = await self.get_page_rows(ticker, limit, before_timestamp)
+        return [self._row_to_domain(row) for row in rows]
+
+    async def get_page_rows(
+        self,
+        ticker: str,
+        limit: int,
+        before_timestamp: Optional[int] = None
+    ) -> List[PriceRow]:
+        stmt = select(*self._returning_columns()).where(PriceModel.ticker == ticker)
+        if before_timestamp is not None:
+            stmt = stmt.where(PriceModel.timestamp < before_timestamp)
+        stmt = stmt.order_by(PriceModel.timestamp.desc()).limit(limit)
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            return result.tuples().all()
+
+    async def stream_all(self, ticker: str, batch_size: int = 1000) -> AsyncIterator[Price]:
+        stmt = select(*self._returning_columns()).where(
+            PriceModel.ticker == ticker
+        ).order_by(PriceModel.timestamp.desc()).execution_options(yield_per=batch_size)
+
+        async with self._session() as session:
+            result = await session.stream(stmt)
+            async for row in result:
+                yield self._row_to_domain(row)
+
+    async def stream_row_batches(
+        self,
+        ticker: str,
+        batch_size: int,
+        start_timestamp: Optional[int] = None,
+        end_timestamp: Optional[int] = None
+    ) -> AsyncIterator[List[PriceRow]]:
+        stmt = select(*self._returning_columns()).where(PriceModel.ticker == ticker)
+        if start_timestamp is not None:
+            stmt = stmt.where(PriceModel.timestamp >= start_timestamp)
+        if end_timestamp is not None:
+            stmt = stmt.where(PriceModel.timestamp <= end_timestamp)
+        stmt = stmt.order_by(PriceModel.timestamp).execution_options(yield_per=batch_size)
+
+        async with self._session() as session:
+            result = await session.stream(stmt)
+            async for batch in result.tuples().partitions(batch_size):
+                yield batch
+
     async def get_last(self, ticker: str) -> Optional[Price]:
         stmt = select(PriceModel).where(
             PriceModel.ticker == ticker
         ).order_by(desc(PriceModel.timestamp)).limit(1)
-        
-        result = await self.session.execute(stmt)
-        price_model = result.scalar_one_or_none()
-        
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            price_model = result.scalar_one_or_none()
+
         if price_model:
             return price_model.to_domain()
         return None
-    
+
+    async def get_last_many(self, tickers: List[str]) -> Dict[str, Price]:
+        if not tickers:
+            return {}
+        
+        # one index probe per ticker via LATERAL ... LIMIT 1; DISTINCT ON (ticker)
+        # would walk every row of each ticker to pick the newest
+        requested = func.unnest(
+            literal(list(tickers), ARRAY(String))
+        ).table_valued("ticker").render_derived(name="requested")
+        latest = select(*self._returning_columns()).where(
+            PriceModel.ticker == requested.c.ticker
+        ).order_by(PriceModel.timestamp.desc()).limit(1).lateral("latest")
+        
+        stmt = select(latest).select_from(requested).join(latest, true())
+        
+        async with self._session() as session:
+            result = await session.execute(stmt)
+
+        return {row.ticker: self._row_to_domain(row) for row in result}
+
     async def get_by_date_range(
-        self, 
-        ticker: str, 
-        start_date: datetime, 
+        self,
+        ticker: str,
+        start_date: datetime,
         end_date: datetime
     ) -> List[Price]:
         start_timestamp = int(start_date.timestamp())
         end_timestamp = int(end_date.timestamp())
-        
+
         stmt = select(PriceModel).where(
             and_(
                 PriceModel.ticker == ticker,
@@ -66,16 +191,182 @@ class PriceRepositoryImpl(PriceRepository):
                 PriceModel.timestamp <= end_timestamp
             )
         ).order_by(PriceModel.timestamp.desc())
-        
-        result = await self.session.execute(stmt)
-        price_models = result.scalars().all()
-        
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            price_models = result.scalars().all()
+
         return [price_model.to_domain() for price_model in price_models]
-    
-    async def batch_save(self, prices: List[Price]) -> List[Price]:
-        saved_prices = []
+
+    async def get_by_date_range_rows(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[PriceRow]:
+        stmt = select(*self._returning_columns()).where(
+            and_(
+                PriceModel.ticker == ticker,
+                PriceModel.timestamp >= int(start_date.timestamp()),
+                PriceModel.timestamp <= int(end_date.timestamp())
+            )
+        ).order_by(PriceModel.timestamp.desc())
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+            return result.tuples().all()
+
+    async def get_by_date_range_many(
+        self,
+        tickers: List[str],
+        start_date: datetime,
+        end_date: datetime
+    ) -> Dict[str, List[Price]]:
+        prices: Dict[str, List[Price]] = {ticker: [] for ticker in tickers}
+        if not tickers:
+            return prices
         
-        price_models = [PriceModel.from_domain(price) for price in prices]
-        self.session.add_all(price_models)
+        stmt = select(*self._returning_columns()).where(
+            and_(
+                PriceModel.ticker.in_(tickers),
+                PriceModel.timestamp >= int(start_date.timestamp()),
+                PriceModel.timestamp <= int(end_date.timestamp())
+            )
+        ).order_by(PriceModel.ticker, PriceModel.timestamp.desc())
         
-        return [price_model.to_domain() for price_model in price_models]
\ No newline at end of file
+        async with self._session() as session:
+            result = await session.execute(stmt)
+
+        for row in result:
+            prices[row.ticker].append(self._row_to_domain(row))
+        return prices
+
+    async def get_ohlc(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        bucket_seconds: int
+    ) -> List[Candle]:
+        stmt = raw_ohlc_select(bucket_seconds).where(
+            and_(
+                PriceModel.ticker == ticker,
+                PriceModel.timestamp >= start_timestamp,
+                PriceModel.timestamp <= end_timestamp
+            )
+        )
+
+        async with self._session() as session:
+            result = await session.execute(stmt)
+
+        return [
+            Candle(
+                ticker=ticker,
+                bucket_start=row.bucket_start,
+                open=row.open,
+                high=row.high,
+                low=row.low,
+                close=row.close,
+                count=row.count
+            )
+            for row in result
+        ]
+
+    async def batch_save(self, prices: List[Price]) -> List[Price]:
+        rows = self._dedupe(prices)
+        if not rows:
+            return []
+
+        async with self._session(write=True) as session:
+            if len(rows) >= self.copy_threshold:
+                saved_prices = await self._copy_save(session, rows)
+            else:
+                saved_prices = []
+                for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+                    stmt = self._insert_statement(
+                        pg_insert(PriceModel).values(rows[start:start + INSERT_CHUNK_SIZE])
+                    )
+                    result = await session.execute(stmt)
+                    saved_prices.extend(self._row_to_domain(row) for row in result)
+
+            if self.on_conflict == OnConflict.IGNORE and len(saved_prices) < len(rows):
+                # DO NOTHING returns no row for conflicting keys; read back what is stored
+                saved_prices.extend(await self._existing(session, rows, saved_prices))
+
+        return saved_prices
+
+    async def _existing(self, session: AsyncSession, rows: List[Dict], saved: List[Price]) -> List[Price]:
+        returned = {(price.ticker, price.timestamp) for price in saved}
+        keys = [
+            (row["ticker"], row["timestamp"]) for row in rows
+            if (row["ticker"], row["timestamp"]) not in returned
+        ]
+
+        existing = []
+        for start in range(0, len(keys), INSERT_CHUNK_SIZE):
+            stmt = select(*self._returning_columns()).where(
+                tuple_(PriceModel.ticker, PriceModel.timestamp).in_(keys[start:start + INSERT_CHUNK_SIZE])
+            )
+            result = await session.execute(stmt)
+            existing.extend(self._row_to_domain(row) for row in result)
+        return existing
+
+    async def _copy_save(self, session: AsyncSession, rows: List[Dict]) -> List[Price]:
+        await session.execute(text(
+            "CREATE TEMP TABLE IF NOT EXISTS prices_staging "
+            "(ticker varchar(20), price double precision, timestamp bigint) "
+            "ON COMMIT DROP"
+        ))
+        await session.execute(text("TRUNCATE prices_staging"))
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "prices_staging",
+            records=[(row["ticker"], row["price"], row["timestamp"]) for row in rows],
+            columns=["ticker", "price", "timestamp"],
+        )
+
+        stmt = self._insert_statement(
+            pg_insert(PriceModel).from_select(
+                ["ticker", "price", "timestamp"],
+                select(_staging_table.c.ticker, _staging_table.c.price, _staging_table.c.timestamp)
+            )
+        )
+        result = await session.execute(stmt)
+        return [self._row_to_domain(row) for row in result]
+
+    def _insert_statement(self, stmt):
+        if self.on_conflict == OnConflict.UPDATE:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[PriceModel.ticker, PriceModel.timestamp],
+                set_={"price": stmt.excluded.price}
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[PriceModel.ticker, PriceModel.timestamp]
+            )
+        return stmt.returning(*self._returning_columns())
+
+    @staticmethod
+    def _returning_columns() -> Tuple:
+        return (PriceModel.id, PriceModel.ticker, PriceModel.price, PriceModel.timestamp)
+
+    @staticmethod
+    def _row_to_domain(row) -> Price:
+        return Price(id=row.id, ticker=row.ticker, price=row.price, timestamp=row.timestamp)
+
+    @staticmethod
+    def _to_row(price: Price, with_id: bool = False) -> Dict:
+        row = {"ticker": price.ticker, "price": price.price, "timestamp": price.timestamp}
+        if with_id and price.id:
+            row["id"] = price.id
+        return row
+
+    @classmethod
+    def _dedupe(cls, prices: List[Price]) -> List[Dict]:
+        # ON CONFLICT cannot touch the same row twice within one statement
+        rows = {}
+        for price in prices:
+            rows[(price.ticker, price.timestamp)] = cls._to_row(price)
+        return list(rows.values())
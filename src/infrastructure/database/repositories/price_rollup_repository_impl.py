@@ -0,0 +1,98 @@
+from typing import List, Optional
+from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.domain.ports.price_rollup_repository import PriceRollupRepository
+from src.domain.entities.candle import Candle
+from src.infrastructure.database.models.price_model import PriceModel
+from src.infrastructure.database.models.price_rollup_model import ROLLUP_MODELS
+from src.infrastructure.monitoring.metrics import timed_methods
+from src.infrastructure.database.repositories.session_scope import SessionScope
+from src.infrastructure.database.repositories.ohlc_queries import (
+    raw_ohlc_select,
+    rollup_ohlc_select,
+)
+
+ROLLUP_COLUMNS = ["ticker", "bucket_start", "open", "high", "low", "close", "count"]
+
+
+@timed_methods
+class PriceRollupRepositoryImpl(SessionScope, PriceRollupRepository):
+    
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        session_factory: Optional[async_sessionmaker] = None
+    ):
+        super().__init__(session, session_factory)
+        self.models = {model.resolution_seconds: model for model in ROLLUP_MODELS}
+    
+    def resolutions(self) -> List[int]:
+        return sorted(self.models)
+    
+    async def refresh(self, start_timestamp: int, end_timestamp: int) -> int:
+        async with self._session(write=True) as session:
+            return await self._refresh(session, start_timestamp, end_timestamp)
+    
+    async def _refresh(self, session: AsyncSession, start_timestamp: int, end_timestamp: int) -> int:
+        refreshed = 0
+        source = None
+        
+        for model in ROLLUP_MODELS:
+            resolution = model.resolution_seconds
+            lower = start_timestamp - start_timestamp % resolution
+            upper = end_timestamp - end_timestamp % resolution + resolution - 1
+            
+            if source is None:
+                aggregate = raw_ohlc_select(resolution).where(
+                    PriceModel.timestamp.between(lower, upper)
+                )
+            else:
+                aggregate = rollup_ohlc_select(source, resolution).where(
+                    source.bucket_start.between(lower, upper)
+                )
+            
+            stmt = pg_insert(model).from_select(ROLLUP_COLUMNS, aggregate.order_by(None))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[model.ticker, model.bucket_start],
+                set_={name: stmt.excluded[name] for name in ROLLUP_COLUMNS[2:]}
+            )
+            result = await session.execute(stmt)
+            refreshed += result.rowcount
+            source = model
+        
+        return refreshed
+    
+    async def get_ohlc(
+        self,
+        ticker: str,
+        start_timestamp: int,
+        end_timestamp: int,
+        bucket_seconds: int,
+        resolution_seconds: int
+    ) -> List[Candle]:
+        model = self.models[resolution_seconds]
+        
+        stmt = rollup_ohlc_select(model, bucket_seconds).where(
+            and_(
+                model.ticker == ticker,
+                model.bucket_start >= start_timestamp,
+                model.bucket_start + resolution_seconds - 1 <= end_timestamp
+            )
+        )
+        
+        async with self._session() as session:
+            result = await session.execute(stmt)
+        
+        return [
+            Candle(
+                ticker=ticker,
+                bucket_start=row.bucket_start,
+                open=row.open,
+                high=row.high,
+                low=row.low,
+                close=row.close,
+                count=row.count
+            )
+            for row in result
+        ]
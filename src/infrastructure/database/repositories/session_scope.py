@@ -0,0 +1,31 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class SessionScope:
+    # a repository either works inside a caller-managed session (the caller
+    # commits), or opens a short-lived session per call from a factory, so a
+    # pooled connection is held only while its query runs
+    def __init__(
+        self,
+        session: Optional[AsyncSession] = None,
+        session_factory: Optional[async_sessionmaker] = None
+    ):
+        if (session is None) == (session_factory is None):
+            raise ValueError("pass exactly one of session or session_factory")
+        self.session = session
+        self.session_factory = session_factory
+
+    @asynccontextmanager
+    async def _session(self, write: bool = False) -> AsyncIterator[AsyncSession]:
+        if self.session is not None:
+            yield self.session
+            return
+
+        async with self.session_factory() as session:
+            if write:
+                async with session.begin():
+                    yield session
+            else:
+                yield session
@@ -1,28 +1,65 @@
-from typing import Generator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import logging
+from functools import cached_property
+from typing import Any, Dict, Generator, Optional
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from src.infrastructure.config.settings import settings
+from src.infrastructure.database.partitions import PricePartitionManager
+from src.infrastructure.monitoring.metrics import metrics, timed_pool_class
+
+logger = logging.getLogger(__name__)
+
+
+def database_url(host: str, port: int) -> str:
+    return (
+        f"postgresql+asyncpg://{settings.POSTGRES_USER}:"
+        f"{settings.POSTGRES_PASSWORD}@{host}:{port}/{settings.POSTGRES_DB}"
+    )
+
+
+def create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        **({"poolclass": timed_pool_class()} if metrics.enabled else {}),
+    )
+
 
 class DatabaseManager:
+    # engines are built on first use, not at import: processes that never touch
+    # the database (celery beat, CLI tools) skip the dialect and pool setup
     def __init__(self):
-        self.database_url = (
-            f"postgresql+asyncpg://{settings.POSTGRES_USER}:"
-            f"{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:"
-            f"{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-        )
-        
-        self.engine = create_async_engine(
-            self.database_url,
-            echo=False,
-            pool_pre_ping=False,  
-            pool_size=3,         
-            max_overflow=2,       
-            pool_recycle=1800,    
-            pool_timeout=30,      
-        )
-        self.async_session_factory = async_sessionmaker(
-            self.engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
+        self.database_url = database_url(settings.POSTGRES_HOST, settings.POSTGRES_PORT)
+    
+    @cached_property
+    def engine(self) -> AsyncEngine:
+        return create_engine(self.database_url)
+    
+    @cached_property
+    def read_engine(self) -> Optional[AsyncEngine]:
+        # read-only API queries go to the replica when one is configured; writes
+        # (ingest, Celery, maintenance) always use the primary engine
+        if not settings.POSTGRES_REPLICA_HOST:
+            return None
+        return create_engine(database_url(
+            settings.POSTGRES_REPLICA_HOST,
+            settings.POSTGRES_REPLICA_PORT or settings.POSTGRES_PORT,
+        ))
+    
+    @cached_property
+    def async_session_factory(self) -> async_sessionmaker:
+        return async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
+    
+    @cached_property
+    def read_session_factory(self) -> async_sessionmaker:
+        return async_sessionmaker(
+            self.read_engine or self.engine, class_=AsyncSession, expire_on_commit=False
         )
     
     async def get_session(self) -> Generator[AsyncSession, None, None]:
@@ -35,11 +72,59 @@ class DatabaseManager:
             finally:
                 await session.close()
     
+    def engines(self) -> Dict[str, AsyncEngine]:
+        # only engines that were actually created
+        engines = {}
+        if "engine" in self.__dict__:
+            engines["primary"] = self.engine
+        if self.__dict__.get("read_engine") is not None:
+            engines["replica"] = self.read_engine
+        return engines
+    
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for name, engine in self.engines().items():
+            pool = engine.pool
+            stats[name] = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(0, pool.overflow()),
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "timeout": settings.DB_POOL_TIMEOUT,
+            }
+        return stats
+    
+    def reset_after_fork(self):
+        # pooled connections inherited from the parent process must not be reused
+        for engine in self.engines().values():
+            engine.sync_engine.dispose(close=False)
+    
+    async def dispose(self):
+        for engine in self.engines().values():
+            await engine.dispose()
+    
+    async def ping(self, timeout: float = 2.0, engine: Optional[AsyncEngine] = None) -> bool:
+        try:
+            async def select_one():
+                async with (engine or self.engine).connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+            await asyncio.wait_for(select_one(), timeout=timeout)
+            return True
+        except Exception as e:
+            logger.warning(f"Database health check failed: {str(e) or type(e).__name__}")
+            return False
+    
     async def create_tables(self):
         from src.infrastructure.database.models.price_model import Base
+        from src.infrastructure.database.models import price_rollup_model  # noqa: F401
         
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all only creates the partitioned parent table
+            await PricePartitionManager(conn).ensure_partitions(
+                settings.PRICE_PARTITION_MONTHS_AHEAD
+            )
     
     async def drop_tables(self):
         from src.infrastructure.database.models.price_model import Base
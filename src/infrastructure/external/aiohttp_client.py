@@ -1,49 +1,98 @@
 import aiohttp
 import asyncio
+import time
 from typing import Dict, Any
 import logging
+from src.infrastructure.monitoring.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
 
-class AioHttpClient:    
-    def __init__(self, base_url: str = None, timeout: int = 10):
+class AioHttpClient:
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: int = 10,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 20,
+        dns_cache_ttl: int = 300,
+        keepalive_timeout: float = 30.0,
+    ):
         self.base_url = base_url
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
         self.session = None
-    
+
+    @property
+    def is_started(self) -> bool:
+        return self.session is not None and not self.session.closed
+
+    async def start(self):
+        if self.is_started:
+            return
+
+        connector = aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            limit_per_host=self.connection_limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+
+    async def close(self):
+        if self.session:
+            await self.session.close()
+            self.session = None
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(timeout=self.timeout)
+        await self.start()
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
-    
+        await self.close()
+
     async def get(self, endpoint: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         if not self.session:
-            raise RuntimeError("Session not initialized. Use async with context.")
-        
+            raise RuntimeError("Session not initialized. Call start() or use async with context.")
+
         url = f"{self.base_url}/{endpoint}" if self.base_url else endpoint
-        
+
+        started = time.perf_counter()
+        outcome = "error"
         try:
             async with self.session.get(url, params=params) as response:
                 response.raise_for_status()
-                return await response.json()
+                result = await response.json()
+                outcome = "ok"
+                return result
         except aiohttp.ClientError as e:
             logger.error(f"HTTP request failed: {str(e)}")
             raise
-    
+        finally:
+            if metrics.enabled:
+                metrics.observe_deribit(endpoint, outcome, time.perf_counter() - started)
+
     async def post(self, endpoint: str, data: Dict[str, Any] = None) -> Dict[str, Any]:
         if not self.session:
-            raise RuntimeError("Session not initialized. Use async with context.")
-        
+            raise RuntimeError("Session not initialized. Call start() or use async with context.")
+
         url = f"{self.base_url}/{endpoint}" if self.base_url else endpoint
-        
+
+        started = time.perf_counter()
+        outcome = "error"
         try:
             async with self.session.post(url, json=data) as response:
                 response.raise_for_status()
-                return await response.json()
+                result = await response.json()
+                outcome = "ok"
+                return result
         except aiohttp.ClientError as e:
             logger.error(f"HTTP request failed: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+        finally:
+            if metrics.enabled:
+                metrics.observe_deribit(endpoint, outcome, time.perf_counter() - started)
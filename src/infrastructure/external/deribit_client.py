@@ -1,88 +1,122 @@
+import asyncio
 import aiohttp
 import logging
-from typing import Dict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
 from datetime import datetime
 from src.domain.ports.market_data_provider import MarketDataProvider
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
 from src.domain.entities.price import Price
 from .aiohttp_client import AioHttpClient
 
 logger = logging.getLogger(__name__)
 
 
-class DeribitClient(MarketDataProvider):    
-    def __init__(self, api_url: str):
+class DeribitClient(MarketDataProvider):
+    def __init__(
+        self,
+        api_url: str,
+        max_concurrency: int = 10,
+        request_timeout: Optional[float] = 5.0,
+        ticker_registry: Optional[TickerRegistry] = None,
+        http_client: Optional[AioHttpClient] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.api_url = api_url
-        self.http_client = AioHttpClient(base_url=api_url)
-        
-        self.index_mapping = {
-            "btc_usd": "btc_usd",  
-            "eth_usd": "eth_usd",
-        }
-    
+        self.http_client = http_client or AioHttpClient(base_url=api_url)
+        self.max_concurrency = max_concurrency
+        self.request_timeout = request_timeout
+
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[AioHttpClient]:
+        if self.http_client.is_started:
+            yield self.http_client
+        else:
+            # outside the app/worker lifespan: a private session, so concurrent
+            # callers never close the shared client under each other
+            async with AioHttpClient(base_url=self.http_client.base_url or self.api_url) as client:
+                yield client
+
     async def get_index_price(self, ticker: str) -> Price:
-        valid_index_map = {
-            "btc_usd": "btc_usd",   
-            "eth_usd": "eth_usd",  
-        }
+        async with self._client() as client:
+            return await self._fetch_index_price(client, ticker)
+
+    async def get_index_prices(self, tickers: list) -> Dict[str, Price]:
+        prices = {}
+        if not tickers:
+            return prices
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._client() as client:
+            async def fetch_one(ticker: str) -> Price:
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        self._fetch_index_price(client, ticker),
+                        timeout=self.request_timeout
+                    )
+
+            results = await asyncio.gather(
+                *(fetch_one(ticker) for ticker in tickers),
+                return_exceptions=True
+            )
+
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.error(
+                    f"Failed to get price for {ticker}: "
+                    f"timed out after {self.request_timeout}s"
+                )
+            elif isinstance(result, BaseException):
+                logger.error(f"Failed to get price for {ticker}: {str(result)}")
+            else:
+                prices[ticker] = result
+                logger.info(f"Successfully fetched price for {ticker}: {result.price}")
+
+        return prices
+
+    async def _fetch_index_price(self, client: AioHttpClient, ticker: str) -> Price:
+        index_name = self.ticker_registry.index_name(ticker)
 
-        index_name = valid_index_map.get(ticker)
-        
         if not index_name:
             raise ValueError(
                 f"Unsupported ticker for index price: '{ticker}'. "
-                f"Supported tickers: {list(valid_index_map.keys())}"
+                f"Supported tickers: {sorted(self.ticker_registry.tickers())}"
             )
 
-        try:
-            async with self.http_client as client:
-                response = await client.get(
-                    "public/get_index_price",
-                    params={"index_name": index_name}
-                )
-                
-                result = response.get("result", {})
-                price_value = result.get("index_price")
-
-                if price_value is None:
-                    price_value = result.get("estimated_delivery_price")
-                
-                price = float(price_value) if price_value else 0.0
-                timestamp = int(datetime.now().timestamp())
-
-                if price <= 0:
-                    raise ValueError(f"Invalid or zero price received for {ticker}: {price}")
-
-                return Price(
-                    ticker=ticker,
-                    price=price,
-                    timestamp=timestamp
-                )
-                    
-        except Exception as e:
-                raise 
-        
-        logger.error(f"All index formats failed for {ticker}")
-        raise RuntimeError(f"Failed to fetch price for {ticker}. Last error: {last_error}")
-    
-    async def get_index_prices(self, tickers: list) -> Dict[str, Price]:
-        prices = {}
-        
-        for ticker in tickers:
-            try:
-                price = await self.get_index_price(ticker)
-                prices[ticker] = price
-                logger.info(f"Successfully fetched price for {ticker}: {price.price}")
-            except Exception as e:
-                logger.error(f"Failed to get price for {ticker}: {str(e)}")
-                continue
-        
-        return prices
-    
+        response = await client.get(
+            "public/get_index_price",
+            params={"index_name": index_name}
+        )
+
+        result = response.get("result", {})
+        price_value = result.get("index_price")
+
+        if price_value is None:
+            price_value = result.get("estimated_delivery_price")
+
+        price = float(price_value) if price_value else 0.0
+        timestamp = int(datetime.now().timestamp())
+
+        if price <= 0:
+            raise ValueError(f"Invalid or zero price received for {ticker}: {price}")
+
+        return Price(
+            ticker=ticker,
+            price=price,
+            timestamp=timestamp
+        )
+
     async def test_connection(self) -> bool:
         try:
-            async with self.http_client as client:
+            async with self._client() as client:
                 response = await client.get("public/get_time")
                 return "result" in response
         except Exception as e:
             logger.error(f"Connection test failed: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, FrozenSet, List, Optional
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.domain.value_objects.currency import CurrencyPair
+from src.infrastructure.config.settings import settings
+from .aiohttp_client import AioHttpClient
+from .http_session import deribit_http_client
+
+logger = logging.getLogger(__name__)
+
+
+class DeribitTickerRegistry(TickerRegistry):
+    def __init__(
+        self,
+        http_client: AioHttpClient,
+        refresh_interval: float = 3600.0,
+        fallback: Optional[List[str]] = None,
+        dynamic: bool = True,
+    ):
+        self.http_client = http_client
+        self.refresh_interval = refresh_interval
+        self.dynamic = dynamic
+        self.refreshed_at: Optional[float] = None
+        self.refresh_failures = 0
+
+        # Deribit index names double as our tickers
+        self._tickers: FrozenSet[str] = frozenset(fallback or CurrencyPair.list())
+        self._listeners: List[Callable[[FrozenSet[str]], None]] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def tickers(self) -> FrozenSet[str]:
+        return self._tickers
+
+    def index_name(self, ticker: str) -> Optional[str]:
+        return ticker if ticker in self._tickers else None
+
+    def on_change(self, listener: Callable[[FrozenSet[str]], None]):
+        self._listeners.append(listener)
+
+    async def refresh(self) -> bool:
+        try:
+            if self.http_client.is_started:
+                response = await self.http_client.get("public/get_index_price_names")
+            else:
+                # a private session: entering the shared client would close it on exit
+                async with AioHttpClient(base_url=self.http_client.base_url) as client:
+                    response = await client.get("public/get_index_price_names")
+            names = frozenset(name.lower() for name in response.get("result") or [])
+        except Exception as e:
+            self.refresh_failures += 1
+            logger.warning(f"Failed to refresh Deribit index list, keeping {len(self._tickers)} tickers: {str(e)}")
+            return False
+
+        self.refreshed_at = time.monotonic()
+        if not names:
+            logger.warning("Deribit returned an empty index list, keeping the previous one")
+            return False
+
+        if names != self._tickers:
+            added, removed = names - self._tickers, self._tickers - names
+            self._tickers = names
+            logger.info(f"Ticker registry updated: +{sorted(added)} -{sorted(removed)}")
+            for listener in self._listeners:
+                listener(names)
+        return True
+
+    async def ensure_fresh(self):
+        if not self.dynamic:
+            return
+        if self.refreshed_at is None or time.monotonic() - self.refreshed_at >= self.refresh_interval:
+            await self.refresh()
+
+    def start(self):
+        if not self.dynamic:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await self.ensure_fresh()
+            # retry sooner while the initial load has not succeeded yet
+            await asyncio.sleep(
+                self.refresh_interval if self.refreshed_at else min(self.refresh_interval, 60.0)
+            )
+
+    def stats(self) -> Dict:
+        return {
+            "tickers": len(self._tickers),
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+ticker_registry = DeribitTickerRegistry(
+    deribit_http_client,
+    refresh_interval=settings.TICKER_REGISTRY_REFRESH_INTERVAL,
+    dynamic=settings.TICKER_REGISTRY_DYNAMIC,
+)
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import logging
+from itertools import count
+from typing import AsyncIterator, Callable, Dict, Iterable, Optional
+import aiohttp
+from src.domain.ports.market_data_provider import MarketDataProvider
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.domain.entities.price import Price
+
+logger = logging.getLogger(__name__)
+
+INDEX_CHANNEL_PREFIX = "deribit_price_index."
+
+
+class DeribitWebSocketClient(MarketDataProvider):
+    def __init__(
+        self,
+        ws_url: str,
+        ticker_registry: Optional[TickerRegistry] = None,
+        ticker_filter: Optional[Callable[[Iterable[str]], Iterable[str]]] = None,
+        heartbeat_interval: int = 30,
+        request_timeout: float = 5.0,
+        max_backoff: float = 30.0,
+        queue_size: int = 10000,
+    ):
+        self.ws_url = ws_url
+        self.heartbeat_interval = heartbeat_interval
+        self.request_timeout = request_timeout
+        self.max_backoff = max_backoff
+
+        self.ticker_registry = ticker_registry or StaticTickerRegistry()
+        # subscribe to a subset of the supported tickers; None streams all of them
+        self.ticker_filter = ticker_filter
+        self._tickers_by_index: Dict[str, str] = {}
+
+        self.latest: Dict[str, Price] = {}
+        self.connects = 0
+        self.dropped = 0
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._connected = asyncio.Event()
+        self._first_price: Dict[str, asyncio.Event] = {}
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._request_ids = count(1)
+        self._ws: Optional[aiohttp.ClientWebSocketResponse] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected.is_set()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def get_index_price(self, ticker: str) -> Price:
+        if not self.ticker_registry.is_supported(ticker):
+            raise ValueError(
+                f"Unsupported ticker for index price: '{ticker}'. "
+                f"Supported tickers: {sorted(self.ticker_registry.tickers())}"
+            )
+
+        if ticker not in self.latest:
+            self.start()
+            event = self._first_price.setdefault(ticker, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.request_timeout)
+            except asyncio.TimeoutError:
+                raise ValueError(
+                    f"No index price received for {ticker} within {self.request_timeout}s"
+                )
+        return self.latest[ticker]
+
+    async def get_index_prices(self, tickers: list) -> Dict[str, Price]:
+        prices = {}
+        results = await asyncio.gather(
+            *(self.get_index_price(ticker) for ticker in tickers),
+            return_exceptions=True
+        )
+        for ticker, result in zip(tickers, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to get price for {ticker}: {str(result)}")
+            else:
+                prices[ticker] = result
+        return prices
+
+    async def stream(self) -> AsyncIterator[Price]:
+        self.start()
+        while True:
+            yield await self._queue.get()
+
+    async def _run(self):
+        backoff = min(1.0, self.max_backoff)
+        async with aiohttp.ClientSession() as session:
+            while True:
+                try:
+                    async with session.ws_connect(
+                        self.ws_url, heartbeat=self.heartbeat_interval
+                    ) as ws:
+                        self._ws = ws
+                        reader = asyncio.create_task(self._read(ws))
+                        try:
+                            await self._subscribe()
+                            self.connects += 1
+                            self._connected.set()
+                            backoff = min(1.0, self.max_backoff)
+                            logger.info(f"Subscribed to Deribit index prices via {self.ws_url}")
+                            await reader
+                        finally:
+                            reader.cancel()
+                    raise ConnectionError("websocket closed by server")
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.warning(
+                        f"Deribit websocket lost: {str(e)}. Reconnecting in {backoff:.0f}s"
+                    )
+                finally:
+                    self._ws = None
+                    self._connected.clear()
+                    self._fail_pending()
+
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    async def _subscribe(self):
+        # Deribit answers public/set_heartbeat with periodic test_request
+        # notifications and drops the connection if they go unanswered
+        await self._call("public/set_heartbeat", {"interval": self.heartbeat_interval})
+        # the channel set follows the registry as of each (re)connect
+        tickers = self.ticker_registry.tickers()
+        if self.ticker_filter:
+            tickers = self.ticker_filter(tickers)
+        self._tickers_by_index = {
+            self.ticker_registry.index_name(ticker): ticker for ticker in tickers
+        }
+        await self._call("public/subscribe", {
+            "channels": [INDEX_CHANNEL_PREFIX + index for index in self._tickers_by_index]
+        })
+
+    async def _call(self, method: str, params: Optional[Dict] = None) -> Dict:
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send(method, params, request_id)
+            return await asyncio.wait_for(future, timeout=self.request_timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _send(self, method: str, params: Optional[Dict] = None, request_id: Optional[int] = None):
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        if request_id is not None:
+            message["id"] = request_id
+        await self._ws.send_str(json.dumps(message))
+
+    async def _read(self, ws: aiohttp.ClientWebSocketResponse):
+        async for message in ws:
+            if message.type == aiohttp.WSMsgType.TEXT:
+                await self._handle(json.loads(message.data))
+            elif message.type == aiohttp.WSMsgType.ERROR:
+                raise ws.exception() or ConnectionError("websocket error")
+
+    async def _handle(self, message: Dict):
+        if "id" in message:
+            future = self._pending.get(message["id"])
+            if future and not future.done():
+                if "error" in message:
+                    future.set_exception(RuntimeError(f"Deribit error: {message['error']}"))
+                else:
+                    future.set_result(message.get("result"))
+            return
+
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "heartbeat":
+            if params.get("type") == "test_request":
+                await self._send("public/test")
+        elif method == "subscription":
+            self._on_index_price(params.get("channel", ""), params.get("data", {}))
+
+    def _on_index_price(self, channel: str, data: Dict):
+        ticker = self._tickers_by_index.get(channel[len(INDEX_CHANNEL_PREFIX):])
+        price_value = data.get("price")
+        if ticker is None or not price_value or price_value <= 0:
+            return
+
+        price = Price(
+            ticker=ticker,
+            price=float(price_value),
+            timestamp=int(data["timestamp"]) // 1000
+        )
+        self.latest[ticker] = price
+        if ticker in self._first_price:
+            self._first_price.pop(ticker).set()
+
+        if self._queue.full():
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(price)
+
+    def _fail_pending(self):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("websocket disconnected"))
+        self._pending.clear()
+
+    async def test_connection(self) -> bool:
+        self.start()
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout=self.request_timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.error(f"Connection test failed: not connected to {self.ws_url}")
+            return False
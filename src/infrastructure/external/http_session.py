@@ -0,0 +1,20 @@
+from src.infrastructure.config.settings import settings
+from .aiohttp_client import AioHttpClient
+
+
+deribit_http_client = AioHttpClient(
+    base_url=settings.DERIBIT_API_URL,
+    timeout=settings.HTTP_TIMEOUT,
+    connection_limit=settings.HTTP_POOL_LIMIT,
+    connection_limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+    dns_cache_ttl=settings.HTTP_DNS_CACHE_TTL,
+    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+)
+
+
+async def start_http_clients():
+    await deribit_http_client.start()
+
+
+async def close_http_clients():
+    await deribit_http_client.close()
@@ -0,0 +1,33 @@
+from src.domain.ports.market_data_provider import MarketDataProvider
+from src.infrastructure.config.settings import settings
+from .deribit_client import DeribitClient
+from .deribit_ws_client import DeribitWebSocketClient
+from .http_session import deribit_http_client
+from .deribit_ticker_registry import ticker_registry
+
+REST = "rest"
+WEBSOCKET = "websocket"
+
+
+def is_streaming_provider() -> bool:
+    return settings.MARKET_DATA_PROVIDER == WEBSOCKET
+
+
+def create_market_data_provider() -> MarketDataProvider:
+    if settings.MARKET_DATA_PROVIDER == REST:
+        return DeribitClient(
+            settings.DERIBIT_API_URL,
+            max_concurrency=settings.DERIBIT_MAX_CONCURRENCY,
+            request_timeout=settings.DERIBIT_REQUEST_TIMEOUT,
+            ticker_registry=ticker_registry,
+            http_client=deribit_http_client
+        )
+    if settings.MARKET_DATA_PROVIDER == WEBSOCKET:
+        return DeribitWebSocketClient(
+            settings.DERIBIT_WS_URL,
+            ticker_registry=ticker_registry,
+            ticker_filter=settings.ingest_tickers,
+            heartbeat_interval=settings.DERIBIT_WS_HEARTBEAT_INTERVAL,
+            request_timeout=settings.DERIBIT_REQUEST_TIMEOUT,
+        )
+    raise ValueError(f"Unknown market data provider: {settings.MARKET_DATA_PROVIDER}")
@@ -0,0 +1,26 @@
+import asyncio
+from src.infrastructure.config.logging_config import setup_logging
+from src.infrastructure.database.session import db_manager
+from src.infrastructure.external.http_session import start_http_clients, close_http_clients
+from src.infrastructure.config.settings import settings
+from src.infrastructure.monitoring.metrics import metrics, start_metrics_server
+from .service import ingest_service
+
+
+async def main():
+    await start_http_clients()
+    try:
+        await ingest_service.run()
+    finally:
+        await close_http_clients()
+        await db_manager.dispose()
+
+
+if __name__ == "__main__":
+    setup_logging()
+    if metrics.enabled:
+        start_metrics_server(settings.METRICS_PORT)
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
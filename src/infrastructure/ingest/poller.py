@@ -0,0 +1,53 @@
+import logging
+from typing import Awaitable, Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.application.use_cases.fetch_market_prices_uc import FetchMarketPricesUseCase
+from src.domain.ports.market_data_provider import MarketDataProvider
+from src.domain.entities.price import Price
+from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.database.repositories.price_rollup_repository_impl import PriceRollupRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+class PricePoller:
+    def __init__(
+        self,
+        market_data_provider: MarketDataProvider,
+        session_factory: async_sessionmaker[AsyncSession],
+        tickers: List[str],
+        on_conflict: str = "ignore",
+        refresh_rollups: bool = True,
+        on_saved: Optional[Callable[[List[Price]], Awaitable[None]]] = None,
+    ):
+        self.market_data_provider = market_data_provider
+        self.session_factory = session_factory
+        self.tickers = tickers
+        self.on_conflict = on_conflict
+        self.refresh_rollups = refresh_rollups
+        self.on_saved = on_saved
+
+    async def poll(self, tickers: Optional[List[str]] = None) -> List[Price]:
+        async with self.session_factory() as session:
+            try:
+                fetch_uc = FetchMarketPricesUseCase(
+                    market_data_provider=self.market_data_provider,
+                    price_repository=PriceRepositoryImpl(session, on_conflict=self.on_conflict)
+                )
+                prices = await fetch_uc.execute(tickers or self.tickers)
+
+                if self.refresh_rollups and prices:
+                    timestamps = [price.timestamp for price in prices]
+                    await PriceRollupRepositoryImpl(session).refresh(
+                        min(timestamps), max(timestamps)
+                    )
+
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        logger.info(f"Successfully fetched {len(prices)} prices")
+        if self.on_saved:
+            await self.on_saved(prices)
+        return prices
@@ -0,0 +1,124 @@
+import asyncio
+import heapq
+import logging
+import random
+from typing import Awaitable, Callable, Dict, List, Set
+
+logger = logging.getLogger(__name__)
+
+
+class TickerScheduler:
+    def __init__(
+        self,
+        job: Callable[[List[str]], Awaitable],
+        intervals: Dict[str, float],
+        jitter: float = 0.0,
+        coalesce_window: float = 0.01,
+        name: str = "job",
+    ):
+        if not intervals:
+            raise ValueError("at least one ticker must be scheduled")
+        if any(interval <= 0 for interval in intervals.values()):
+            raise ValueError("intervals must be positive")
+        if not 0 <= jitter < min(intervals.values()):
+            raise ValueError("jitter must be between 0 and the shortest interval")
+
+        self.job = job
+        self.intervals = intervals
+        self.jitter = jitter
+        self.coalesce_window = coalesce_window
+        self.name = name
+
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self._in_flight: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self._added: Set[str] = set()
+        self._changed = asyncio.Event()
+
+    def set_intervals(self, intervals: Dict[str, float]):
+        # removed tickers drop out of the heap when they next come due
+        self._added.update(set(intervals) - set(self.intervals))
+        self.intervals = dict(intervals)
+        self._changed.set()
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        heap = [(started, ticker) for ticker in self.intervals]
+        heapq.heapify(heap)
+        scheduled = set(self.intervals)
+
+        try:
+            while True:
+                if self._added:
+                    now = loop.time()
+                    for ticker in self._added - scheduled:
+                        heapq.heappush(heap, (now, ticker))
+                    scheduled.update(self._added)
+                    self._added.clear()
+                if not heap:
+                    await self._changed.wait()
+                    self._changed.clear()
+                    continue
+
+                delay = heap[0][0] + random.uniform(0, self.jitter) - loop.time()
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=max(0.0, delay))
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                now = loop.time()
+                due_tickers: Dict[str, float] = {}
+                # tickers due at (nearly) the same moment share one fetch and one write
+                while heap and heap[0][0] <= now + self.coalesce_window:
+                    due, ticker = heapq.heappop(heap)
+                    if ticker not in self.intervals:
+                        scheduled.discard(ticker)
+                        continue
+                    due_tickers[ticker] = due
+                # re-queued only after draining: after a stall the next slot can itself
+                # fall inside the coalesce window and would be fetched twice
+                for ticker, due in due_tickers.items():
+                    heapq.heappush(heap, (self._next_due(due, now, self.intervals[ticker]), ticker))
+
+                if due_tickers:
+                    self._fire(list(due_tickers))
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @staticmethod
+    def _next_due(due: float, now: float, interval: float) -> float:
+        # anchored to the ticker's own schedule so slow runs do not accumulate
+        # drift; slots missed while the loop was busy are skipped, not replayed
+        return due + (int(max(0.0, now - due) // interval) + 1) * interval
+
+    def _fire(self, tickers: List[str]):
+        busy = [ticker for ticker in tickers if ticker in self._in_flight]
+        if busy:
+            self.skipped += len(busy)
+            logger.warning(f"Skipping {self.name} for {busy}: previous run still in progress")
+
+        ready = [ticker for ticker in tickers if ticker not in self._in_flight]
+        if ready:
+            self._in_flight.update(ready)
+            task = asyncio.create_task(self._run_job(ready))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, tickers: List[str]):
+        try:
+            await self.job(tickers)
+            self.runs += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"{self.name} failed for {tickers}: {str(e)}")
+        finally:
+            self._in_flight.difference_update(tickers)
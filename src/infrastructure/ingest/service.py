@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from functools import partial
+from typing import Any, Dict, Optional
+from src.infrastructure.external.deribit_ticker_registry import ticker_registry
+from src.infrastructure.cache.cache_manager import publish_prices
+from src.infrastructure.cache.redis_price_cache import create_redis_client
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import db_manager
+from src.infrastructure.external.provider_factory import create_market_data_provider, is_streaming_provider
+from .poller import PricePoller
+from .scheduler import TickerScheduler
+from .stream_ingestor import PriceStreamIngestor
+
+logger = logging.getLogger(__name__)
+
+
+class IngestService:
+    def __init__(self):
+        self.scheduler: Optional[TickerScheduler] = None
+        self.ingestor: Optional[PriceStreamIngestor] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self):
+        # one Redis connection for the daemon's lifetime instead of one per publish
+        redis = create_redis_client() if settings.PRICE_CACHE_REDIS_ENABLED else None
+        try:
+            await self._run(partial(publish_prices, redis=redis))
+        finally:
+            if redis:
+                await redis.aclose()
+
+    async def _run(self, publish):
+        await ticker_registry.ensure_fresh()
+        provider = create_market_data_provider()
+
+        if is_streaming_provider():
+            self.ingestor = PriceStreamIngestor(
+                provider.stream,
+                db_manager.async_session_factory,
+                batch_size=settings.INGEST_BATCH_SIZE,
+                flush_interval=settings.INGEST_FLUSH_INTERVAL,
+                on_conflict=settings.PRICE_INSERT_ON_CONFLICT,
+                on_flush=publish,
+            )
+            logger.info(f"Streaming index prices from {settings.DERIBIT_WS_URL}")
+            async with provider:
+                await self.ingestor.run()
+            return
+
+        tickers = settings.ingest_tickers(ticker_registry.tickers())
+        poller = PricePoller(
+            provider,
+            db_manager.async_session_factory,
+            tickers,
+            on_conflict=settings.PRICE_INSERT_ON_CONFLICT,
+            on_saved=publish,
+        )
+        intervals = settings.ticker_intervals(tickers)
+        self.scheduler = TickerScheduler(
+            poller.poll,
+            intervals,
+            jitter=settings.INGEST_JITTER,
+            name="fetch-prices",
+        )
+        ticker_registry.on_change(
+            lambda tickers: self.scheduler.set_intervals(settings.ticker_intervals(settings.ingest_tickers(tickers)))
+        )
+        ticker_registry.start()
+
+        logger.info(f"Polling index prices on schedule {intervals}")
+        try:
+            await self.scheduler.run()
+        finally:
+            await ticker_registry.stop()
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        if self.scheduler:
+            return {
+                "runs": self.scheduler.runs,
+                "failures": self.scheduler.failures,
+                "skipped": self.scheduler.skipped,
+            }
+        if self.ingestor:
+            return {
+                "received": self.ingestor.received,
+                "saved": self.ingestor.saved,
+                "failed_flushes": self.ingestor.failed_flushes,
+                "dropped": self.ingestor.dropped,
+            }
+        return {}
+
+
+ingest_service = IngestService()
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from src.domain.entities.price import Price
+from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.database.repositories.price_rollup_repository_impl import PriceRollupRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+class PriceStreamIngestor:
+    def __init__(
+        self,
+        source: Callable[[], AsyncIterator[Price]],
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_buffer: int = 100000,
+        on_conflict: str = "ignore",
+        refresh_rollups: bool = True,
+        on_flush: Optional[Callable[[List[Price]], Awaitable[None]]] = None,
+    ):
+        self.source = source
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.on_conflict = on_conflict
+        self.refresh_rollups = refresh_rollups
+        self.on_flush = on_flush
+
+        self.received = 0
+        self.saved = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+
+        self._buffer: List[Price] = []
+        self._batch_ready = asyncio.Event()
+
+    async def run(self):
+        pump = asyncio.create_task(self._pump())
+        try:
+            while not pump.done():
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                await self.flush()
+            # surface errors from the source
+            pump.result()
+        finally:
+            pump.cancel()
+            await self.flush()
+
+    async def _pump(self):
+        try:
+            async for price in self.source():
+                self.received += 1
+                self._buffer.append(price)
+                if len(self._buffer) >= self.batch_size:
+                    self._batch_ready.set()
+        finally:
+            self._batch_ready.set()
+
+    async def flush(self) -> int:
+        self._batch_ready.clear()
+        if not self._buffer:
+            return 0
+
+        prices, self._buffer = self._buffer, []
+        try:
+            saved = await self._write(prices)
+        except Exception as e:
+            self.failed_flushes += 1
+            logger.error(f"Failed to write {len(prices)} streamed prices, will retry: {str(e)}")
+            self._requeue(prices)
+            return 0
+
+        self.flushes += 1
+        self.saved += len(saved)
+        if self.on_flush:
+            await self.on_flush(saved)
+        return len(saved)
+
+    async def _write(self, prices: List[Price]) -> List[Price]:
+        async with self.session_factory() as session:
+            try:
+                saved = await PriceRepositoryImpl(
+                    session, on_conflict=self.on_conflict
+                ).batch_save(prices)
+
+                if self.refresh_rollups and saved:
+                    timestamps = [price.timestamp for price in saved]
+                    await PriceRollupRepositoryImpl(session).refresh(
+                        min(timestamps), max(timestamps)
+                    )
+
+                await session.commit()
+                return saved
+            except Exception:
+                await session.rollback()
+                raise
+
+    def _requeue(self, prices: List[Price]):
+        self._buffer = prices + self._buffer
+        overflow = len(self._buffer) - self.max_buffer
+        if overflow > 0:
+            self.dropped += overflow
+            self._buffer = self._buffer[overflow:]
+            logger.warning(f"Ingest buffer full, dropped {overflow} oldest prices")
@@ -0,0 +1,205 @@
+import functools
+import inspect
+import logging
+import os
+import shutil
+import time
+from typing import Any, Dict, Optional
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metrics:
+    # every hook checks `enabled` first; with metrics off nothing is created and
+    # prometheus_client is never imported
+    def __init__(self, enabled: bool):
+        self.enabled = False
+        if enabled:
+            try:
+                self._create()
+                self.enabled = True
+            except ImportError:
+                logger.error("METRICS_ENABLED is set but prometheus_client is not installed, metrics disabled")
+
+    def _create(self):
+        from prometheus_client import CollectorRegistry, Gauge, Histogram
+
+        self.registry = CollectorRegistry(auto_describe=True)
+        self.http_seconds = Histogram(
+            "http_request_duration_seconds", "HTTP request latency",
+            ["method", "route", "status"], buckets=LATENCY_BUCKETS, registry=self.registry,
+        )
+        self.deribit_seconds = Histogram(
+            "deribit_request_duration_seconds", "Deribit API call latency",
+            ["endpoint", "outcome"], buckets=LATENCY_BUCKETS, registry=self.registry,
+        )
+        self.repository_seconds = Histogram(
+            "repository_query_duration_seconds", "Price repository method latency",
+            ["repository", "method"], buckets=LATENCY_BUCKETS, registry=self.registry,
+        )
+        self.pool_checkout_seconds = Histogram(
+            "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection",
+            buckets=LATENCY_BUCKETS, registry=self.registry,
+        )
+        self.pool_connections = Gauge(
+            "db_pool_connections", "SQLAlchemy pool occupancy", ["engine", "state"], registry=self.registry,
+        )
+        self.ingest_lag = Gauge(
+            "ingest_lag_seconds", "Seconds since the latest stored price", ["ticker"], registry=self.registry,
+        )
+        self.task_seconds = Histogram(
+            "celery_task_duration_seconds", "Celery task duration",
+            ["task", "state"], buckets=LATENCY_BUCKETS, registry=self.registry,
+        )
+
+    def observe_http(self, method: str, route: str, status: int, seconds: float):
+        self.http_seconds.labels(method, route, str(status)).observe(seconds)
+
+    def observe_deribit(self, endpoint: str, outcome: str, seconds: float):
+        self.deribit_seconds.labels(endpoint, outcome).observe(seconds)
+
+    def observe_task(self, task: str, state: str, seconds: float):
+        self.task_seconds.labels(task, state).observe(seconds)
+
+    def update_pools(self, pool_stats: Dict[str, Dict[str, Any]]):
+        for engine, stats in pool_stats.items():
+            for state in ("size", "checked_out", "checked_in", "overflow"):
+                self.pool_connections.labels(engine, state).set(stats[state])
+
+    def update_ingest_lag(self, latest: Dict[str, Optional[int]], now: Optional[float] = None):
+        now = time.time() if now is None else now
+        for ticker, timestamp in latest.items():
+            if timestamp is not None:
+                self.ingest_lag.labels(ticker).set(max(0.0, now - timestamp))
+
+    def render(self) -> bytes:
+        from prometheus_client import generate_latest
+        return generate_latest(self.registry)
+
+
+metrics = Metrics(settings.METRICS_ENABLED)
+
+
+def timed_methods(cls):
+    # wraps every public coroutine method with a latency histogram; a no-op class
+    # decorator when metrics are disabled, so the hot path is the plain method
+    if not metrics.enabled:
+        return cls
+
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _timed(method, metrics.repository_seconds.labels(cls.__name__, name)))
+    return cls
+
+
+def _timed(method, histogram):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - started)
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def timed_pool_class():
+    # built on first use so importing this module does not pull in SQLAlchemy
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+        # the pool has no "checkout started" event, so the wait is timed around _do_get
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                metrics.pool_checkout_seconds.observe(time.perf_counter() - started)
+
+    return TimedAsyncQueuePool
+
+
+def route_template(scope) -> str:
+    # the matched route's path template keeps label cardinality bounded
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is None or app is None:
+        return "unmatched"
+    for route in getattr(app, "routes", ()):
+        if getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return "unmatched"
+
+
+def install_celery_metrics():
+    from celery.signals import task_prerun, task_postrun, worker_init, worker_process_shutdown
+
+    started: Dict[str, float] = {}
+
+    @task_prerun.connect(weak=False)
+    def on_task_prerun(task_id=None, **kwargs):
+        started[task_id] = time.perf_counter()
+
+    @task_postrun.connect(weak=False)
+    def on_task_postrun(task_id=None, task=None, state=None, **kwargs):
+        start_time = started.pop(task_id, None)
+        if start_time is not None:
+            metrics.observe_task(task.name, state or "UNKNOWN", time.perf_counter() - start_time)
+
+    @worker_init.connect(weak=False)
+    def on_worker_init(sender=None, **kwargs):
+        multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+        if is_prefork_worker(sender) and not multiproc_dir:
+            # tasks run in forked children whose observations never reach this
+            # process, so the endpoint would only ever serve empty task histograms
+            logger.error(
+                "Celery prefork pool without PROMETHEUS_MULTIPROC_DIR: worker metrics are not served. "
+                "Set PROMETHEUS_MULTIPROC_DIR or run with --pool=solo/threads"
+            )
+            return
+        if multiproc_dir:
+            clean_multiproc_dir(multiproc_dir)
+        start_metrics_server(settings.METRICS_PORT)
+
+    @worker_process_shutdown.connect(weak=False)
+    def on_worker_process_shutdown(pid=None, **kwargs):
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            from prometheus_client import multiprocess
+            multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def is_prefork_worker(worker) -> bool:
+    pool_cls = getattr(worker, "pool_cls", None)
+    name = pool_cls if isinstance(pool_cls, str) else getattr(pool_cls, "__module__", "")
+    return "prefork" in (name or "")
+
+
+def clean_multiproc_dir(path: str):
+    # files left by a previous worker run would be summed into the new one
+    os.makedirs(path, exist_ok=True)
+    for entry in os.listdir(path):
+        full_path = os.path.join(path, entry)
+        if os.path.isdir(full_path):
+            shutil.rmtree(full_path)
+        else:
+            os.remove(full_path)
+
+
+def start_metrics_server(port: int):
+    from prometheus_client import start_http_server
+
+    registry = metrics.registry
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        # prefork children write to the shared directory, the parent serves the sum
+        from prometheus_client import CollectorRegistry, multiprocess
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    start_http_server(port, registry=registry)
+    logger.info(f"Serving Prometheus metrics on :{port}")
+
@@ -3,10 +3,18 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.infrastructure.database.session import db_manager
 from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.database.repositories.price_rollup_repository_impl import PriceRollupRepositoryImpl
 from src.infrastructure.external.deribit_client import DeribitClient
+from src.infrastructure.external.http_session import deribit_http_client
+from src.infrastructure.cache.cache_manager import price_cache_manager
+from src.infrastructure.external.deribit_ticker_registry import ticker_registry
+from src.domain.ports.price_cache import PriceCache
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.application.services.single_flight import price_queries
 from src.application.use_cases.get_all_prices_uc import GetAllPricesUseCase
 from src.application.use_cases.get_last_price_uc import GetLastPriceUseCase
 from src.application.use_cases.get_prices_by_date_uc import GetPricesByDateUseCase
+from src.application.use_cases.get_ohlc_uc import GetOhlcUseCase
 from src.application.use_cases.fetch_market_prices_uc import FetchMarketPricesUseCase
 from src.infrastructure.config.settings import settings
 
@@ -22,31 +30,73 @@ def get_price_repository(
     return PriceRepositoryImpl(session)
 
 
-def get_deribit_client() -> DeribitClient:
-    return DeribitClient(settings.DERIBIT_API_URL)
+# read repositories take a session per query instead of one per request: requests
+# answered by validation or the cache never touch the pool, and a connection is
+# returned before the response body is sent
+def get_read_price_repository() -> PriceRepositoryImpl:
+    return PriceRepositoryImpl(session_factory=db_manager.read_session_factory)
+
+
+def get_price_rollup_repository() -> PriceRollupRepositoryImpl:
+    return PriceRollupRepositoryImpl(session_factory=db_manager.read_session_factory)
+
+
+def get_price_cache() -> PriceCache:
+    return price_cache_manager.cache
+
+
+def get_ticker_registry() -> TickerRegistry:
+    return ticker_registry
+
+
+def get_deribit_client(
+    registry: TickerRegistry = Depends(get_ticker_registry)
+) -> DeribitClient:
+    return DeribitClient(
+        settings.DERIBIT_API_URL,
+        max_concurrency=settings.DERIBIT_MAX_CONCURRENCY,
+        request_timeout=settings.DERIBIT_REQUEST_TIMEOUT,
+        ticker_registry=registry,
+        http_client=deribit_http_client
+    )
 
 
 def get_all_prices_use_case(
-    repository: PriceRepositoryImpl = Depends(get_price_repository)
+    repository: PriceRepositoryImpl = Depends(get_read_price_repository),
+    registry: TickerRegistry = Depends(get_ticker_registry)
 ) -> GetAllPricesUseCase:
 
-    return GetAllPricesUseCase(repository)
+    return GetAllPricesUseCase(repository, registry, price_queries)
 
 
 def get_last_price_use_case(
-    repository: PriceRepositoryImpl = Depends(get_price_repository)
+    repository: PriceRepositoryImpl = Depends(get_read_price_repository),
+    cache: PriceCache = Depends(get_price_cache),
+    registry: TickerRegistry = Depends(get_ticker_registry)
 ) -> GetLastPriceUseCase:
-    return GetLastPriceUseCase(repository)
+    return GetLastPriceUseCase(repository, cache, registry, price_queries)
 
 
 def get_prices_by_date_use_case(
-    repository: PriceRepositoryImpl = Depends(get_price_repository)
+    repository: PriceRepositoryImpl = Depends(get_read_price_repository),
+    cache: PriceCache = Depends(get_price_cache),
+    registry: TickerRegistry = Depends(get_ticker_registry)
 ) -> GetPricesByDateUseCase:
-    return GetPricesByDateUseCase(repository)
+    return GetPricesByDateUseCase(repository, cache, registry, price_queries)
+
+
+def get_ohlc_use_case(
+    repository: PriceRepositoryImpl = Depends(get_read_price_repository),
+    cache: PriceCache = Depends(get_price_cache),
+    rollup_repository: PriceRollupRepositoryImpl = Depends(get_price_rollup_repository),
+    registry: TickerRegistry = Depends(get_ticker_registry)
+) -> GetOhlcUseCase:
+    return GetOhlcUseCase(repository, cache, rollup_repository, registry)
 
 
 def get_fetch_market_prices_use_case(
     client: DeribitClient = Depends(get_deribit_client),
-    repository: PriceRepositoryImpl = Depends(get_price_repository)
+    repository: PriceRepositoryImpl = Depends(get_price_repository),
+    cache: PriceCache = Depends(get_price_cache)
 ) -> FetchMarketPricesUseCase:
-    return FetchMarketPricesUseCase(client, repository)
\ No newline at end of file
+    return FetchMarketPricesUseCase(client, repository, cache)
\ No newline at end of file
@@ -1,17 +1,48 @@
+import csv
+import io
+import json
 from datetime import datetime
-from typing import List
-from fastapi import APIRouter, Query, HTTPException, Depends
+from typing import AsyncIterator, List, Literal, Optional, Union
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from src.application.dtos.price_dto import PriceDTO
 from src.application.use_cases.get_all_prices_uc import GetAllPricesUseCase
 from src.application.use_cases.get_last_price_uc import GetLastPriceUseCase
-from src.application.use_cases.get_prices_by_date_uc import GetPricesByDateUseCase
-from src.presentation.models.price_schemas import PriceResponse, PriceListResponse, ErrorResponse
+from src.application.use_cases.get_prices_by_date_uc import (
+    MAX_BATCH_TICKERS as MAX_RANGE_TICKERS,
+    GetPricesByDateUseCase,
+)
+from src.application.use_cases.get_ohlc_uc import GetOhlcUseCase
+from src.domain.value_objects.candle_interval import CandleInterval
+from src.domain.ports.ticker_registry import TickerRegistry
+from src.presentation.models.price_schemas import (
+    PriceResponse,
+    PriceListResponse,
+    LastPricesResponse,
+    PriceRangesResponse,
+    CandleResponse,
+    OhlcResponse,
+    ErrorResponse,
+)
 from src.presentation.models.request_schemas import DateFilterRequest
+from src.presentation.models.fast_json import price_list_response
+from src.presentation.models.http_cache import CacheValidator, is_closed_range
+from src.presentation.models.columnar_export import (
+    MEDIA_TYPES,
+    ExportUnavailableError,
+    encode_batches,
+    require_pyarrow,
+)
 from src.presentation.api.dependencies import (
     get_all_prices_use_case,
     get_last_price_use_case,
     get_prices_by_date_use_case,
+    get_ohlc_use_case,
+    get_ticker_registry,
 )
+from src.infrastructure.cache.cache_manager import price_cache_manager
+from src.application.services.single_flight import price_queries
 from src.domain.exceptions.domain_exceptions import (
     InvalidTickerException,
     PriceNotFoundException
@@ -19,6 +50,16 @@ from src.domain.exceptions.domain_exceptions import (
 
 router = APIRouter(prefix="/prices", tags=["prices"])
 
+
+def _parse_tickers(ticker: Optional[str], tickers: Optional[str]) -> Optional[List[str]]:
+    if ticker and tickers:
+        raise HTTPException(status_code=400, detail="Pass either ticker or tickers, not both")
+    if tickers is not None:
+        return [item.strip() for item in tickers.split(",") if item.strip()]
+    if not ticker:
+        raise HTTPException(status_code=400, detail="ticker or tickers is required")
+    return None
+
 @router.get(
     "/",
     response_model=PriceListResponse,
@@ -30,52 +71,165 @@ router = APIRouter(prefix="/prices", tags=["prices"])
 )
 async def get_all_prices(
     ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    limit: int = Query(1000, ge=1, le=10000, description="Размер страницы"),
+    cursor: Optional[int] = Query(
+        None, gt=0, description="next_cursor из предыдущей страницы"
+    ),
     use_case: GetAllPricesUseCase = Depends(get_all_prices_use_case)
 ):
     try:
-        prices_dto = await use_case.execute(ticker)
+        rows, next_cursor = await use_case.execute_page_rows(ticker, limit, cursor)
         
-        if not prices_dto:
+        if not rows and cursor is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"No prices found for ticker: {ticker}"
             )
         
-        prices_response = [
-            PriceResponse(
-                id=price_dto.id,
-                ticker=price_dto.ticker,
-                value=price_dto.price, 
-                timestamp=price_dto.timestamp,
-                datetime=datetime.fromtimestamp(price_dto.timestamp)
-            ) for price_dto in prices_dto
-        ]
-        
-        return PriceListResponse(
-            ticker=ticker,
-            prices=prices_response,
-            count=len(prices_response)
-        )
+        return price_list_response(ticker, rows, next_cursor)
         
+    except HTTPException:
+        raise
     except InvalidTickerException as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+STREAM_COLUMNS = ["id", "ticker", "value", "timestamp", "datetime"]
+
+
+def _stream_row(price_dto: PriceDTO) -> list:
+    return [
+        price_dto.id,
+        price_dto.ticker,
+        price_dto.price,
+        price_dto.timestamp,
+        datetime.fromtimestamp(price_dto.timestamp).isoformat(),
+    ]
+
+
+async def _ndjson_lines(prices: AsyncIterator[PriceDTO]) -> AsyncIterator[str]:
+    async for price_dto in prices:
+        yield json.dumps(dict(zip(STREAM_COLUMNS, _stream_row(price_dto)))) + "\n"
+
+
+async def _csv_lines(prices: AsyncIterator[PriceDTO]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(STREAM_COLUMNS)
+    async for price_dto in prices:
+        writer.writerow(_stream_row(price_dto))
+        if buffer.tell() >= 64 * 1024:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def _aclose(source: AsyncIterator):
+    # BackgroundTask only awaits coroutine functions, not the built-in aclose
+    await source.aclose()
+
+
+def _streaming_response(body: AsyncIterator, source: AsyncIterator, **kwargs) -> StreamingResponse:
+    # the source holds a pooled session until it is exhausted or closed; close it
+    # once the response ends, also when the client disconnects mid-body
+    return StreamingResponse(body, background=BackgroundTask(_aclose, source), **kwargs)
+
+
+@router.get(
+    "/stream",
+    summary="Потоковая выгрузка всех цен по тикеру (NDJSON или CSV)",
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        400: {"model": ErrorResponse, "description": "Неверный запрос"}
+    }
+)
+async def stream_prices(
+    ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Формат выгрузки"),
+    use_case: GetAllPricesUseCase = Depends(get_all_prices_use_case)
+):
+    try:
+        prices = use_case.stream(ticker)
+    except InvalidTickerException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if format == "csv":
+        return _streaming_response(
+            _csv_lines(prices),
+            prices,
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{ticker}.csv"'}
+        )
+    return _streaming_response(_ndjson_lines(prices), prices, media_type="application/x-ndjson")
+
+
+@router.get(
+    "/export",
+    summary="Выгрузка истории цен в колоночном формате (Arrow IPC или Parquet)",
+    responses={
+        200: {"content": {media_type: {} for media_type in MEDIA_TYPES.values()}},
+        400: {"model": ErrorResponse, "description": "Неверный запрос"},
+        501: {"model": ErrorResponse, "description": "pyarrow не установлен"}
+    }
+)
+async def export_prices(
+    ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    format: Literal["arrow", "parquet"] = Query("arrow", description="Формат выгрузки"),
+    start_date: Optional[datetime] = Query(None, description="Начальная дата (YYYY-MM-DDTHH:MM:SS)"),
+    end_date: Optional[datetime] = Query(None, description="Конечная дата (YYYY-MM-DDTHH:MM:SS)"),
+    batch_size: int = Query(65536, ge=1024, le=1_000_000, description="Строк в одном record batch"),
+    use_case: GetAllPricesUseCase = Depends(get_all_prices_use_case)
+):
+    try:
+        batches = use_case.stream_row_batches(ticker, batch_size, start_date, end_date)
+        require_pyarrow()
+    except (InvalidTickerException, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ExportUnavailableError as e:
+        raise HTTPException(status_code=501, detail=str(e))
     
+    extension = "arrows" if format == "arrow" else "parquet"
+    return _streaming_response(
+        encode_batches(format, ticker, batches),
+        batches,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{ticker}.{extension}"'}
+    )
+
+
 @router.get(
     "/last",
-    response_model=PriceResponse,
-    summary="Получить последнюю цену по тикеру",
+    response_model=Union[PriceResponse, LastPricesResponse],
+    summary="Получить последнюю цену по тикеру или по списку тикеров",
     responses={
         400: {"model": ErrorResponse, "description": "Неверный запрос"},
         404: {"model": ErrorResponse, "description": "Цена не найдена"}
     }
 )
 async def get_last_price(
-    ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    request: Request,
+    response: Response,
+    ticker: Optional[str] = Query(None, description="Тикер валютной пары (btc_usd или eth_usd)"),
+    tickers: Optional[str] = Query(None, description="Несколько тикеров через запятую: btc_usd,eth_usd"),
     use_case: GetLastPriceUseCase = Depends(get_last_price_use_case)
 ):
     try:
+        batch = _parse_tickers(ticker, tickers)
+        if batch is not None:
+            prices_dto = await use_case.execute_many(batch)
+            validator = CacheValidator.for_latest(f"last:{','.join(prices_dto)}", prices_dto.values())
+            if validator.is_not_modified(request):
+                return validator.not_modified()
+            
+            validator.apply(response)
+            return LastPricesResponse(prices={
+                key: PriceResponse.from_dto(price_dto) if price_dto else None
+                for key, price_dto in prices_dto.items()
+            })
+        
         price_dto = await use_case.execute(ticker)
         
         if not price_dto:
@@ -84,8 +238,15 @@ async def get_last_price(
                 detail=f"No prices found for ticker: {ticker}"
             )
         
+        validator = CacheValidator.for_latest(f"last:{ticker}", [price_dto])
+        if validator.is_not_modified(request):
+            return validator.not_modified()
+        
+        validator.apply(response)
         return PriceResponse.from_dto(price_dto)
         
+    except HTTPException:
+        raise
     except InvalidTickerException as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -94,18 +255,23 @@ async def get_last_price(
 
 @router.get(
     "/by-date",
-    response_model=PriceListResponse,
-    summary="Получить цены по тикеру с фильтром по дате",
+    response_model=Union[PriceListResponse, PriceRangesResponse],
+    summary="Получить цены по тикеру или по списку тикеров с фильтром по дате",
     responses={
         400: {"model": ErrorResponse, "description": "Неверный запрос"},
         404: {"model": ErrorResponse, "description": "Цены не найдены"}
     }
 )
 async def get_prices_by_date(
-    ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    request: Request,
+    response: Response,
+    ticker: Optional[str] = Query(None, description="Тикер валютной пары (btc_usd или eth_usd)"),
+    tickers: Optional[str] = Query(None, description="Несколько тикеров через запятую: btc_usd,eth_usd"),
     start_date: datetime = Query(..., description="Начальная дата (YYYY-MM-DDTHH:MM:SS)"),
     end_date: datetime = Query(..., description="Конечная дата (YYYY-MM-DDTHH:MM:SS)"),
-    use_case: GetPricesByDateUseCase = Depends(get_prices_by_date_use_case)
+    use_case: GetPricesByDateUseCase = Depends(get_prices_by_date_use_case),
+    last_price_use_case: GetLastPriceUseCase = Depends(get_last_price_use_case),
+    registry: TickerRegistry = Depends(get_ticker_registry)
 ):
     try:
         if start_date > end_date:
@@ -114,23 +280,84 @@ async def get_prices_by_date(
                 detail="start_date cannot be greater than end_date"
             )
         
-        prices_dto = await use_case.execute(ticker, start_date, end_date)
+        batch = _parse_tickers(ticker, tickers)
+        if batch is not None:
+            requested = registry.validate_many(batch, MAX_RANGE_TICKERS)
+        else:
+            registry.validate(ticker)
+            requested = [ticker]
+        
+        # closed ranges never change, so they revalidate without querying the
+        # range; open ranges are versioned by each ticker's latest price
+        scope = f"by-date:{','.join(requested)}:{start_date.isoformat()}:{end_date.isoformat()}"
+        latest = await last_price_use_case.execute_many(requested)
+        if is_closed_range(end_date, latest.values()):
+            validator = CacheValidator.for_closed_range(scope, end_date)
+        else:
+            validator = CacheValidator.for_latest(scope, latest.values())
+        if validator.is_not_modified(request):
+            return validator.not_modified()
+        
+        if batch is not None:
+            ranges_dto = await use_case.execute_many(batch, start_date, end_date)
+            ranges = {
+                key: [PriceResponse.from_dto(price_dto) for price_dto in prices_dto]
+                for key, prices_dto in ranges_dto.items()
+            }
+            validator.apply(response)
+            return PriceRangesResponse(
+                prices=ranges,
+                count=sum(len(prices) for prices in ranges.values())
+            )
+        
+        rows = await use_case.execute_rows(ticker, start_date, end_date)
         
-        if not prices_dto:
+        if not rows:
             raise HTTPException(
                 status_code=404,
                 detail=f"No prices found for ticker {ticker} in date range "
                       f"{start_date} to {end_date}"
             )
         
-        prices_response = [
-            PriceResponse.from_dto(price_dto) for price_dto in prices_dto
+        return validator.apply(price_list_response(ticker, rows))
+        
+    except HTTPException:
+        raise
+    except InvalidTickerException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get(
+    "/ohlc",
+    response_model=OhlcResponse,
+    summary="Получить OHLC-свечи по тикеру за период",
+    responses={
+        400: {"model": ErrorResponse, "description": "Неверный запрос"}
+    }
+)
+async def get_ohlc(
+    ticker: str = Query(..., description="Тикер валютной пары (btc_usd или eth_usd)"),
+    start_date: datetime = Query(..., description="Начальная дата (YYYY-MM-DDTHH:MM:SS)"),
+    end_date: datetime = Query(..., description="Конечная дата (YYYY-MM-DDTHH:MM:SS)"),
+    interval: CandleInterval = Query(CandleInterval.ONE_MINUTE, description="Размер свечи"),
+    use_case: GetOhlcUseCase = Depends(get_ohlc_use_case)
+):
+    try:
+        candles_dto = await use_case.execute(ticker, start_date, end_date, interval)
+        
+        candles_response = [
+            CandleResponse.from_dto(candle_dto) for candle_dto in candles_dto
         ]
         
-        return PriceListResponse(
+        return OhlcResponse(
             ticker=ticker,
-            prices=prices_response,
-            count=len(prices_response)
+            interval=interval.value,
+            candles=candles_response,
+            count=len(candles_response)
         )
         
     except InvalidTickerException as e:
@@ -146,6 +373,15 @@ async def get_prices_by_date(
     summary="Получить список поддерживаемых тикеров",
     response_model=List[str]
 )
-async def get_supported_tickers():
-    from src.domain.value_objects.currency import CurrencyPair
-    return CurrencyPair.list()
\ No newline at end of file
+async def get_supported_tickers(
+    registry: TickerRegistry = Depends(get_ticker_registry)
+):
+    return sorted(registry.tickers())
+
+
+@router.get(
+    "/cache-stats",
+    summary="Статистика кэша последних цен и объединения одинаковых запросов"
+)
+async def get_cache_stats():
+    return {**price_cache_manager.stats(), "single_flight": price_queries.stats()}
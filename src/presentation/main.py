@@ -1,21 +1,92 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from src.presentation.middleware.error_handler import ErrorHandlerMiddleware
-from src.presentation.middleware.logging_middleware import LoggingMiddleware
+from src.presentation.middleware.request_middleware import RequestMiddleware
 from src.infrastructure.config.logging_config import setup_logging
 from src.infrastructure.database.session import db_manager
+from src.infrastructure.external.http_session import start_http_clients, close_http_clients
+from src.infrastructure.database.repositories.price_repository_impl import PriceRepositoryImpl
+from src.infrastructure.cache.cache_manager import price_cache_manager
+from src.infrastructure.config.settings import settings
+from src.infrastructure.monitoring.metrics import metrics, CONTENT_TYPE
+from src.application.use_cases.get_last_price_uc import GetLastPriceUseCase
+from src.infrastructure.external.deribit_ticker_registry import ticker_registry
 from src.presentation.api.v1.prices import router as prices_router
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
+
+async def warm_price_cache():
+    tickers = settings.ingest_tickers(ticker_registry.tickers())
+    try:
+        use_case = GetLastPriceUseCase(
+            PriceRepositoryImpl(session_factory=db_manager.read_session_factory),
+            price_cache_manager.local
+        )
+        warmed = await use_case.warm(tickers)
+        logger.info(f"Warmed latest-price cache for {warmed} tickers")
+    except Exception as e:
+        logger.warning(f"Failed to warm latest-price cache: {str(e)}")
+
+
+async def warm_recent_prices():
+    # the ring buffer only answers ranges inside what it has loaded, so serving
+    # while this runs is safe; it just misses until the load completes
+    tickers = settings.ingest_tickers(ticker_registry.tickers())
+    try:
+        # primary, not the replica: rows lagging behind there would leave a gap
+        warmed = await price_cache_manager.warm_window(
+            PriceRepositoryImpl(session_factory=db_manager.async_session_factory), tickers
+        )
+        if warmed:
+            logger.info(f"Loaded recent prices of {warmed} tickers into the ring buffer")
+    except Exception as e:
+        logger.warning(f"Failed to warm recent-price ring buffer: {str(e)}")
+
+
+async def warm_up():
+    # network and database warm-ups run while the API already serves: until they
+    # finish, validation uses the static pairs and reads fall through to the repository
+    await ticker_registry.ensure_fresh()
+    ticker_registry.start()
+    await warm_price_cache()
+    await warm_recent_prices()
+
+
+async def update_ingest_lag():
+    try:
+        repository = PriceRepositoryImpl(session_factory=db_manager.async_session_factory)
+        latest = await repository.get_last_many(settings.ingest_tickers(ticker_registry.tickers()))
+        metrics.update_ingest_lag({ticker: price.timestamp for ticker, price in latest.items()})
+    except Exception as e:
+        logger.warning(f"Failed to update ingest lag: {str(e)}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
     
-    await db_manager.create_tables()
+    # schema is managed by migrations only (alembic upgrade head at deploy time)
+    await start_http_clients()
+    await price_cache_manager.start()
+    warm_up_task = asyncio.create_task(warm_up())
+    if settings.INGEST_EMBEDDED:
+        from src.infrastructure.ingest.service import ingest_service
+        ingest_service.start()
 
     yield
-    
+
+    warm_up_task.cancel()
+    await asyncio.gather(warm_up_task, return_exceptions=True)
+    if settings.INGEST_EMBEDDED:
+        await ingest_service.stop()
+    await price_cache_manager.stop()
+    await ticker_registry.stop()
+    await close_http_clients()
 
 
 app = FastAPI(
@@ -35,8 +106,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-app.add_middleware(ErrorHandlerMiddleware)
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(
+    RequestMiddleware,
+    sample_rate=settings.REQUEST_LOG_SAMPLE_RATE,
+    slow_threshold=settings.REQUEST_LOG_SLOW_THRESHOLD,
+)
 
 app.include_router(prices_router, prefix="/api/v1")
 
@@ -53,11 +127,26 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "database": "connected", 
-        "timestamp": int(time.time())
-    }
+    database_ok = await db_manager.ping()
+    return JSONResponse(
+        status_code=200 if database_ok else 503,
+        content={
+            "status": "healthy" if database_ok else "unhealthy",
+            "database": "connected" if database_ok else "unavailable",
+            "pool": db_manager.pool_stats(),
+            "timestamp": int(time.time())
+        }
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    if not metrics.enabled:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    
+    metrics.update_pools(db_manager.pool_stats())
+    await update_ingest_lag()
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
 
 
 @app.get("/info")
@@ -67,5 +156,5 @@ async def app_info():
         "app_name": "Crypto Price Tracker",
         "version": "1.0.0",
         "description": "Track cryptocurrency prices from Deribit exchange",
-        "supported_tickers": ["btc_usd", "eth_usd"]
+        "supported_tickers": sorted(ticker_registry.tickers())
     }
\ No newline at end of file
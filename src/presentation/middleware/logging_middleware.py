@@ -1,38 +0,0 @@
-import time
-import logging
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-
-logger = logging.getLogger(__name__)
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        logger.info(
-            f"Incoming request: {request.method} {request.url.path} "
-            f"from {request.client.host if request.client else 'unknown'}"
-        )
-        
-        try:
-            response = await call_next(request)
-            
-            process_time = time.time() - start_time
-            logger.info(
-                f"Request completed: {request.method} {request.url.path} "
-                f"Status: {response.status_code} "
-                f"Duration: {process_time:.3f}s"
-            )
-            
-            return response
-            
-        except Exception as exc:
-            process_time = time.time() - start_time
-            logger.error(
-                f"Request failed: {request.method} {request.url.path} "
-                f"Error: {str(exc)} "
-                f"Duration: {process_time:.3f}s"
-            )
-            raise
\ No newline at end of file
@@ -0,0 +1,94 @@
+import logging
+import random
+import time
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.domain.exceptions.domain_exceptions import DomainException
+from src.infrastructure.monitoring.metrics import metrics, route_template
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMiddleware:
+    # plain ASGI instead of BaseHTTPMiddleware: no extra task or memory stream per
+    # request, and streaming bodies pass through untouched
+    def __init__(self, app: ASGIApp, sample_rate: float = 1.0, slow_threshold: float = 1.0):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            if response_started:
+                self._log_failure(scope, exc, start_time)
+                raise
+            status_code, response = self._error_response(exc)
+            await response(scope, receive, send)
+        self._log_completed(scope, status_code, start_time)
+
+    def _error_response(self, exc: Exception):
+        if isinstance(exc, DomainException):
+            logger.warning("Domain exception: %s", exc)
+            return 400, JSONResponse(
+                status_code=400,
+                content={
+                    "detail": str(exc),
+                    "error_code": type(exc).__name__
+                }
+            )
+        logger.error("Unexpected error: %s", exc, exc_info=True)
+        return 500, JSONResponse(
+            status_code=500,
+            content={
+                "detail": "Internal server error",
+                "error_code": "INTERNAL_SERVER_ERROR"
+            }
+        )
+
+    def _log_completed(self, scope: Scope, status_code: int, start_time: float):
+        duration = time.perf_counter() - start_time
+        if metrics.enabled:
+            metrics.observe_http(scope["method"], route_template(scope), status_code, duration)
+        # errors and slow requests are always logged, the rest only when sampled
+        if status_code >= 500 or duration >= self.slow_threshold:
+            level = logging.WARNING
+        elif self.sample_rate >= 1 or random.random() < self.sample_rate:
+            level = logging.INFO
+        else:
+            return
+        if logger.isEnabledFor(level):
+            client = scope.get("client")
+            logger.log(
+                level,
+                "%s %s %s %.3fs from %s",
+                scope["method"], scope["path"], status_code, duration,
+                client[0] if client else "unknown",
+            )
+
+    def _log_failure(self, scope: Scope, exc: Exception, start_time: float):
+        logger.error(
+            "Request failed: %s %s Error: %s Duration: %.3fs",
+            scope["method"], scope["path"], exc, time.perf_counter() - start_time,
+        )
@@ -0,0 +1,72 @@
+import io
+from typing import AsyncIterator, List
+from src.domain.ports.price_repository import PriceRow
+
+MEDIA_TYPES = {
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class ExportUnavailableError(Exception):
+    pass
+
+
+def require_pyarrow():
+    # imported lazily: pyarrow is heavy and only the export endpoint needs it
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ExportUnavailableError("Columnar export requires pyarrow to be installed")
+    return pyarrow
+
+
+def price_schema(pa, ticker: str):
+    return pa.schema(
+        [("timestamp", pa.int64()), ("price", pa.float64())],
+        metadata={"ticker": ticker},
+    )
+
+
+def record_batch(pa, schema, rows: List[PriceRow]):
+    import numpy as np
+
+    count = len(rows)
+    timestamps = np.fromiter((row[3] for row in rows), dtype=np.int64, count=count)
+    prices = np.fromiter((row[2] for row in rows), dtype=np.float64, count=count)
+    return pa.RecordBatch.from_arrays([pa.array(timestamps), pa.array(prices)], schema=schema)
+
+
+def _drain(sink: io.BytesIO) -> bytes:
+    data = sink.getvalue()
+    sink.seek(0)
+    sink.truncate()
+    return data
+
+
+async def encode_batches(
+    format: str,
+    ticker: str,
+    batches: AsyncIterator[List[PriceRow]]
+) -> AsyncIterator[bytes]:
+    pa = require_pyarrow()
+    schema = price_schema(pa, ticker)
+    sink = io.BytesIO()
+
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(sink, schema)
+        write = lambda batch: writer.write_batch(batch)  # noqa: E731
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+        write = writer.write_batch
+
+    # each repository batch becomes one record batch / row group, flushed as it is written
+    async for rows in batches:
+        if rows:
+            write(record_batch(pa, schema, rows))
+            yield _drain(sink)
+
+    writer.close()
+    yield _drain(sink)
@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import List, Optional
+import orjson
+from fastapi.responses import Response
+from src.domain.ports.price_repository import PriceRow
+
+
+# Same body as PriceListResponse, encoded straight from (id, ticker, price, timestamp)
+# rows: the rows come from our own database, so response-model validation is skipped.
+def price_list_response(
+    ticker: str,
+    rows: List[PriceRow],
+    next_cursor: Optional[int] = None
+) -> Response:
+    fromtimestamp = datetime.fromtimestamp
+    body = orjson.dumps({
+        "ticker": ticker,
+        "prices": [
+            {
+                "ticker": row_ticker,
+                "value": price,
+                "timestamp": timestamp,
+                "id": price_id,
+                "datetime": fromtimestamp(timestamp),
+            }
+            for price_id, row_ticker, price, timestamp in rows
+        ],
+        "count": len(rows),
+        "next_cursor": next_cursor,
+    })
+    return Response(content=body, media_type="application/json")
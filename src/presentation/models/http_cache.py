@@ -0,0 +1,88 @@
+import hashlib
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional
+from fastapi import Request, Response
+from src.application.dtos.price_dto import PriceDTO
+from src.infrastructure.config.settings import settings
+
+
+class CacheValidator:
+    def __init__(self, etag: str, last_modified: Optional[int], cache_control: str):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.cache_control = cache_control
+
+    @classmethod
+    def for_latest(cls, scope: str, prices: Iterable[Optional[PriceDTO]]) -> "CacheValidator":
+        # a ticker's data only changes when a newer price lands, so its latest
+        # (timestamp, price) pair versions every representation built from it
+        versions = sorted(
+            (price.ticker, price.timestamp, price.price) for price in prices if price
+        )
+        return cls(
+            _etag(scope, versions),
+            max((timestamp for _, timestamp, _ in versions), default=None),
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, must-revalidate",
+        )
+
+    @classmethod
+    def for_closed_range(cls, scope: str, end_date: datetime) -> "CacheValidator":
+        return cls(
+            _etag(scope, []),
+            int(end_date.timestamp()),
+            f"public, max-age={settings.HTTP_CACHE_IMMUTABLE_MAX_AGE}, immutable",
+        )
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                datetime.fromtimestamp(self.last_modified, tz=timezone.utc), usegmt=True
+            )
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # "*" is not honoured: whether the range has any rows is only known
+            # after querying it, and an empty one must answer 404, not 304
+            tags = {_strip_weak(tag.strip()) for tag in if_none_match.split(",")}
+            return _strip_weak(self.etag) in tags
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return self.last_modified <= since.timestamp()
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response) -> Response:
+        response.headers.update(self.headers())
+        return response
+
+
+def is_closed_range(end_date: datetime, latest: Iterable[Optional[PriceDTO]]) -> bool:
+    # closed only once ingest of every ticker has moved past end_date by the
+    # grace period: while ingest lags (DB outage, re-queued stream batches)
+    # the range can still fill in and must not be cached as immutable
+    latest = list(latest)
+    if not latest or any(price is None for price in latest):
+        return False
+    ingested_until = min(min(price.timestamp for price in latest), time.time())
+    return end_date.timestamp() < ingested_until - settings.HTTP_CACHE_CLOSED_RANGE_GRACE
+
+
+def _etag(scope: str, versions: list) -> str:
+    digest = hashlib.blake2b(f"{scope}|{versions}".encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
@@ -1,6 +1,6 @@
 from datetime import datetime as Datetime
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 
@@ -21,6 +21,17 @@ class PriceBase(BaseModel):
 class PriceResponse(PriceBase):
     id: int = Field(...)
     datetime: Datetime = Field(..., description="Дата и время в читаемом формате")
+    
+    @classmethod
+    def from_dto(cls, price_dto) -> 'PriceResponse':
+        return cls(
+            id=price_dto.id,
+            ticker=price_dto.ticker,
+            value=price_dto.price,
+            timestamp=price_dto.timestamp,
+            datetime=price_dto.datetime
+        )
+
 class PriceCreate(PriceBase):
     pass
 
@@ -29,6 +40,9 @@ class PriceListResponse(BaseModel):
     ticker: str
     prices: List[PriceResponse]
     count: int
+    next_cursor: Optional[int] = Field(
+        None, description="Передайте как cursor, чтобы получить следующую страницу"
+    )
     
     class Config:
         json_schema_extra = {
@@ -43,11 +57,52 @@ class PriceListResponse(BaseModel):
                         "datetime": "2023-11-15T00:00:00"
                     }
                 ],
-                "count": 1
+                "count": 1,
+                "next_cursor": None
             }
         }
 
 
+class LastPricesResponse(BaseModel):
+    prices: Dict[str, Optional[PriceResponse]] = Field(
+        ..., description="Последняя цена по каждому тикеру (null, если цен нет)"
+    )
+
+
+class PriceRangesResponse(BaseModel):
+    prices: Dict[str, List[PriceResponse]]
+    count: int
+
+
+class CandleResponse(BaseModel):
+    bucket_start: int
+    datetime: Datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    count: int
+    
+    @classmethod
+    def from_dto(cls, candle_dto) -> 'CandleResponse':
+        return cls(
+            bucket_start=candle_dto.bucket_start,
+            datetime=candle_dto.datetime,
+            open=candle_dto.open,
+            high=candle_dto.high,
+            low=candle_dto.low,
+            close=candle_dto.close,
+            count=candle_dto.count
+        )
+
+
+class OhlcResponse(BaseModel):
+    ticker: str
+    interval: str
+    candles: List[CandleResponse]
+    count: int
+
+
 class ErrorResponse(BaseModel):
     detail: str
     error_code: Optional[str] = None
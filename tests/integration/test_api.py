@@ -1,7 +1,16 @@
+import asyncio
+import time
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 from src.presentation.main import app
+from src.presentation.api.v1.prices import stream_prices
+from src.application.use_cases.get_all_prices_uc import GetAllPricesUseCase
+from src.domain.entities.price import Price
+from src.infrastructure.database.session import db_manager
+from src.application.dtos.price_dto import PriceDTO
+from src.presentation.api.dependencies import get_prices_by_date_use_case, get_last_price_use_case
 
 
 class TestPricesAPI:    
@@ -25,7 +34,66 @@ class TestPricesAPI:
         data = response.json()
         assert "detail" in data
     
-    def test_health_endpoint(self, client):
+    def test_stream_prices_invalid_ticker(self, client):
+        response = client.get("/api/v1/prices/stream?ticker=invalid&format=csv")
+        
+        assert response.status_code == 400
+    
+    def test_export_prices_invalid_ticker(self, client):
+        response = client.get("/api/v1/prices/export?ticker=invalid&format=parquet")
+        
+        assert response.status_code == 400
+    
+    def test_export_prices_without_pyarrow(self, client):
+        try:
+            import pyarrow  # noqa: F401
+            pytest.skip("pyarrow is installed")
+        except ImportError:
+            pass
+        
+        response = client.get("/api/v1/prices/export?ticker=btc_usd")
+        
+        assert response.status_code == 501
+    
+    def test_closed_range_revalidates_without_range_query(self, client):
+        by_date = MagicMock()
+        by_date.execute_rows = AsyncMock(return_value=[])
+        last_price = MagicMock()
+        last_price.execute_many = AsyncMock(
+            return_value={"btc_usd": PriceDTO(1, "btc_usd", 45000.0, int(time.time()))}
+        )
+        app.dependency_overrides[get_prices_by_date_use_case] = lambda: by_date
+        app.dependency_overrides[get_last_price_use_case] = lambda: last_price
+        url = ("/api/v1/prices/by-date?ticker=btc_usd"
+               "&start_date=2023-11-14T00:00:00&end_date=2023-11-15T00:00:00")
+        try:
+            response = client.get(url, headers={"If-Modified-Since": "Fri, 01 Dec 2023 00:00:00 GMT"})
+            empty = client.get(url, headers={"If-None-Match": "*"})
+        finally:
+            app.dependency_overrides.clear()
+        
+        assert response.status_code == 304
+        assert "immutable" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith('W/"')
+        assert empty.status_code == 404
+        by_date.execute_rows.assert_awaited_once()
+    
+    def test_invalid_ticker_does_not_open_a_session(self, client, monkeypatch):
+        factory = MagicMock()
+        monkeypatch.setattr(db_manager, "read_session_factory", factory)
+        
+        assert client.get("/api/v1/prices/last?ticker=invalid").status_code == 400
+        assert client.get("/api/v1/prices/by-date?ticker=invalid"
+                          "&start_date=2023-11-14T00:00:00&end_date=2023-11-15T00:00:00").status_code == 400
+        factory.assert_not_called()
+    
+    def test_last_price_batch_validation(self, client):
+        assert client.get("/api/v1/prices/last").status_code == 400
+        assert client.get("/api/v1/prices/last?ticker=btc_usd&tickers=eth_usd").status_code == 400
+        assert client.get("/api/v1/prices/last?tickers=btc_usd,invalid").status_code == 400
+    
+    def test_health_endpoint(self, client, monkeypatch):
+        monkeypatch.setattr(db_manager, "ping", AsyncMock(return_value=True))
         response = client.get("/health")
         
         assert response.status_code == 200
@@ -33,10 +101,53 @@ class TestPricesAPI:
         assert "status" in data
         assert data["status"] == "healthy"
     
+    def test_health_endpoint_reports_database_outage(self, client, monkeypatch):
+        monkeypatch.setattr(db_manager, "ping", AsyncMock(return_value=False))
+        response = client.get("/health")
+        
+        assert response.status_code == 503
+        assert response.json()["database"] == "unavailable"
+    
+    def test_metrics_disabled_by_default(self, client):
+        assert client.get("/metrics").status_code == 404
+    
     def test_root_endpoint(self, client):
         response = client.get("/")
         
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
-        assert "version" in data
\ No newline at end of file
+        assert "version" in data
+
+class StreamingRepository:
+    def __init__(self):
+        self.closed = False
+
+    async def stream_all(self, ticker, batch_size=1000):
+        try:
+            for i in range(1, 1000000):
+                yield Price(id=i, ticker=ticker, price=1.0, timestamp=1700000000 + i)
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_repository_session_on_client_disconnect():
+    repository = StreamingRepository()
+    response = await stream_prices(
+        ticker="btc_usd", format="ndjson", use_case=GetAllPricesUseCase(repository)
+    )
+    sent = []
+
+    async def receive():
+        await asyncio.sleep(0.05)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+        await asyncio.sleep(0)
+
+    await response({"type": "http", "method": "GET", "headers": []}, receive, send)
+
+    assert sent and repository.closed
+    assert sent[-1].get("more_body", False)
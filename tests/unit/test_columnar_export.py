@@ -0,0 +1,34 @@
+import io
+import pytest
+from src.presentation.models.columnar_export import encode_batches
+
+pa = pytest.importorskip("pyarrow")
+
+
+async def batches():
+    yield [(1, "btc_usd", 45000.5, 1700000000), (2, "btc_usd", 45001.25, 1700000060)]
+    yield [(3, "btc_usd", 45002.0, 1700000120)]
+
+
+async def encode(format):
+    return b"".join([chunk async for chunk in encode_batches(format, "btc_usd", batches())])
+
+
+@pytest.mark.asyncio
+async def test_arrow_stream_roundtrip():
+    table = pa.ipc.open_stream(await encode("arrow")).read_all()
+
+    assert table.schema.metadata[b"ticker"] == b"btc_usd"
+    assert table.column("timestamp").type == pa.int64()
+    assert table.column("timestamp").to_pylist() == [1700000000, 1700000060, 1700000120]
+    assert table.column("price").to_pylist() == [45000.5, 45001.25, 45002.0]
+
+
+@pytest.mark.asyncio
+async def test_parquet_row_group_per_batch():
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(io.BytesIO(await encode("parquet")))
+
+    assert parquet.num_row_groups == 2
+    assert parquet.read().column("price").to_pylist() == [45000.5, 45001.25, 45002.0]
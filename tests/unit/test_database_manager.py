@@ -0,0 +1,38 @@
+from src.infrastructure.config.settings import settings
+from src.infrastructure.database.session import DatabaseManager
+
+
+def test_engines_are_created_on_first_use():
+    manager = DatabaseManager()
+
+    assert manager.engines() == {}
+    assert manager.pool_stats() == {}
+
+    engine = manager.engine
+
+    assert manager.engines() == {"primary": engine}
+    assert manager.async_session_factory.kw["bind"] is engine
+
+
+def test_reads_use_primary_without_replica(monkeypatch):
+    monkeypatch.setattr(settings, "POSTGRES_REPLICA_HOST", None)
+    manager = DatabaseManager()
+
+    assert manager.read_engine is None
+    assert manager.read_session_factory.kw["bind"] is manager.engine
+    assert list(manager.pool_stats()) == ["primary"]
+
+
+def test_replica_gets_its_own_pool(monkeypatch):
+    monkeypatch.setattr(settings, "POSTGRES_REPLICA_HOST", "replica")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    manager = DatabaseManager()
+
+    assert manager.read_engine.url.host == "replica"
+    assert manager.engine.url.host == settings.POSTGRES_HOST
+    assert manager.read_session_factory.kw["bind"] is manager.read_engine
+    assert manager.async_session_factory.kw["bind"] is manager.engine
+
+    stats = manager.pool_stats()
+    assert set(stats) == {"primary", "replica"}
+    assert stats["replica"]["size"] == 7 and stats["replica"]["checked_out"] == 0
@@ -0,0 +1,87 @@
+import asyncio
+import pytest
+from src.infrastructure.external.deribit_client import DeribitClient
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+
+
+class StubHttpClient:
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.is_started = True
+        self.base_url = "http://stub"
+        self.entered = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def get(self, endpoint, params=None):
+        index_name = params["index_name"]
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(index_name, 0.01))
+            if index_name in self.failures:
+                raise RuntimeError("upstream error")
+            return {"result": {"index_price": 100.0}}
+        finally:
+            self.in_flight -= 1
+
+
+def make_client(http_client, tickers, **kwargs):
+    return DeribitClient(
+        "http://stub",
+        ticker_registry=StaticTickerRegistry.from_tickers(tickers),
+        http_client=http_client,
+        **kwargs
+    )
+
+
+class TestDeribitClientFanOut:
+    @pytest.mark.asyncio
+    async def test_respects_concurrency_limit(self):
+        tickers = [f"t{i}_usd" for i in range(10)]
+        http_client = StubHttpClient()
+        client = make_client(http_client, tickers, max_concurrency=3)
+
+        prices = await client.get_index_prices(tickers)
+
+        assert set(prices) == set(tickers)
+        assert http_client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_are_isolated(self):
+        tickers = ["ok_usd", "bad_usd", "slow_usd"]
+        http_client = StubHttpClient(delays={"slow_usd": 1.0}, failures={"bad_usd"})
+        client = make_client(http_client, tickers, request_timeout=0.1)
+
+        prices = await client.get_index_prices(tickers + ["unknown"])
+
+        assert list(prices) == ["ok_usd"]
+        assert prices["ok_usd"].price == 100.0
+
+
+class TestDeribitClientSession:
+    @pytest.mark.asyncio
+    async def test_unstarted_shared_client_is_never_entered(self, monkeypatch):
+        shared = StubHttpClient()
+        shared.is_started = False
+        private = []
+
+        def private_client(base_url=None):
+            private.append(StubHttpClient())
+            return private[-1]
+
+        monkeypatch.setattr("src.infrastructure.external.deribit_client.AioHttpClient", private_client)
+        client = make_client(shared, ["btc_usd"])
+
+        await asyncio.gather(client.get_index_price("btc_usd"), client.get_index_price("btc_usd"))
+
+        assert shared.entered == 0
+        assert len(private) == 2 and all(stub.entered == 1 for stub in private)
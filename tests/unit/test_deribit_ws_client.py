@@ -0,0 +1,159 @@
+import asyncio
+import json
+import pytest
+from aiohttp import web
+from src.domain.entities.price import Price
+from src.infrastructure.external.deribit_ws_client import DeribitWebSocketClient
+from src.infrastructure.ingest.stream_ingestor import PriceStreamIngestor
+
+
+class StandInServer:
+    def __init__(self, prices_per_connection=2):
+        self.prices_per_connection = prices_per_connection
+        self.connections = 0
+        self.requests = []
+        self.channels = []
+        self.runner = None
+        self.url = None
+
+    async def handler(self, request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.connections += 1
+
+        async for message in ws:
+            payload = json.loads(message.data)
+            self.requests.append(payload["method"])
+            if "id" in payload:
+                await ws.send_json({"jsonrpc": "2.0", "id": payload["id"], "result": "ok"})
+
+            if payload["method"] == "public/subscribe":
+                self.channels = payload["params"]["channels"]
+                await ws.send_json({
+                    "jsonrpc": "2.0", "method": "heartbeat", "params": {"type": "test_request"}
+                })
+                for i in range(self.prices_per_connection):
+                    await ws.send_json({
+                        "jsonrpc": "2.0",
+                        "method": "subscription",
+                        "params": {
+                            "channel": "deribit_price_index.btc_usd",
+                            "data": {
+                                "index_name": "btc_usd",
+                                "price": 45000.0 + i,
+                                "timestamp": (1700000000 + self.connections * 10 + i) * 1000,
+                            },
+                        },
+                    })
+                if self.connections == 1:
+                    # drop the first connection to force a reconnect
+                    await asyncio.sleep(0.05)
+                    await ws.close()
+        return ws
+
+    async def __aenter__(self):
+        app = web.Application()
+        app.router.add_get("/ws/api/v2", self.handler)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/ws/api/v2"
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.runner.cleanup()
+
+
+async def take(stream, count):
+    prices = []
+    async for price in stream:
+        prices.append(price)
+        if len(prices) == count:
+            return prices
+
+
+class TestDeribitWebSocketClient:
+    @pytest.mark.asyncio
+    async def test_streams_prices_and_reconnects(self):
+        async with StandInServer() as server:
+            client = DeribitWebSocketClient(server.url, request_timeout=0.2, max_backoff=0.1)
+            async with client:
+                prices = await asyncio.wait_for(take(client.stream(), 4), timeout=5)
+                snapshot = await client.get_index_prices(["btc_usd", "eth_usd"])
+
+        assert [price.price for price in prices] == [45000.0, 45001.0, 45000.0, 45001.0]
+        assert prices[0].timestamp == 1700000010
+        assert server.connections == 2 and client.connects == 2
+        assert server.requests[:2] == ["public/set_heartbeat", "public/subscribe"]
+        assert "public/test" in server.requests
+        assert set(snapshot) == {"btc_usd"}
+        assert sorted(server.channels) == [
+            "deribit_price_index.btc_usd", "deribit_price_index.eth_usd"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_subscribes_only_to_filtered_tickers(self):
+        async with StandInServer() as server:
+            client = DeribitWebSocketClient(
+                server.url,
+                ticker_filter=lambda tickers: [t for t in tickers if t == "btc_usd"],
+                request_timeout=0.2,
+            )
+            async with client:
+                await asyncio.wait_for(take(client.stream(), 1), timeout=5)
+
+        assert server.channels == ["deribit_price_index.btc_usd"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_ticker_rejected(self):
+        client = DeribitWebSocketClient("http://127.0.0.1:1/ws")
+
+        with pytest.raises(ValueError):
+            await client.get_index_price("doge_usd")
+
+
+class RecordingIngestor(PriceStreamIngestor):
+    def __init__(self, prices, fail_first=False, **kwargs):
+        async def source():
+            for price in prices:
+                yield price
+                await asyncio.sleep(0)
+
+        super().__init__(source, session_factory=None, **kwargs)
+        self.batches = []
+        self.fail_first = fail_first
+
+    async def _write(self, prices):
+        if self.fail_first:
+            self.fail_first = False
+            raise RuntimeError("database unavailable")
+        self.batches.append(prices)
+        return prices
+
+
+def make_prices(count):
+    return [Price(ticker="btc_usd", price=1.0, timestamp=1700000000 + i) for i in range(count)]
+
+
+class TestPriceStreamIngestor:
+    @pytest.mark.asyncio
+    async def test_micro_batches_by_size(self):
+        ingestor = RecordingIngestor(make_prices(25), batch_size=10, flush_interval=5)
+
+        await asyncio.wait_for(ingestor.run(), timeout=2)
+
+        assert sum(len(batch) for batch in ingestor.batches) == 25
+        assert len(ingestor.batches) >= 2
+        assert ingestor.saved == 25
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self):
+        ingestor = RecordingIngestor(make_prices(5), fail_first=True, batch_size=100)
+        ingestor._buffer = make_prices(3)
+
+        assert await ingestor.flush() == 0
+        assert len(ingestor._buffer) == 3
+        assert await ingestor.flush() == 3
+        assert ingestor.failed_flushes == 1
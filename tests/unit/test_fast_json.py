@@ -0,0 +1,20 @@
+import json
+from src.application.dtos.price_dto import PriceDTO
+from src.presentation.models.fast_json import price_list_response
+from src.presentation.models.price_schemas import PriceListResponse, PriceResponse
+
+
+def test_fast_path_matches_response_model():
+    rows = [(2, "btc_usd", 45001.25, 1700000060), (1, "btc_usd", 45000.5, 1700000000)]
+    expected = PriceListResponse(
+        ticker="btc_usd",
+        prices=[PriceResponse.from_dto(PriceDTO(*row)) for row in rows],
+        count=2,
+        next_cursor=1700000000,
+    ).model_dump_json()
+
+    response = price_list_response("btc_usd", rows, next_cursor=1700000000)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == json.loads(expected)
+    assert response.body == expected.encode()
@@ -0,0 +1,51 @@
+from datetime import datetime
+from starlette.requests import Request
+from src.application.dtos.price_dto import PriceDTO
+from src.presentation.models.http_cache import CacheValidator, is_closed_range
+
+
+def make_request(**headers):
+    raw = [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_etag_follows_latest_price():
+    old = CacheValidator.for_latest("last:btc_usd", [PriceDTO(1, "btc_usd", 45000.0, 1700000000)])
+    same = CacheValidator.for_latest("last:btc_usd", [PriceDTO(1, "btc_usd", 45000.0, 1700000000)])
+    new = CacheValidator.for_latest("last:btc_usd", [PriceDTO(2, "btc_usd", 45010.0, 1700000060)])
+
+    assert old.etag == same.etag != new.etag
+    assert new.last_modified == 1700000060
+    assert old.is_not_modified(make_request(if_none_match=same.etag))
+    assert not old.is_not_modified(make_request(if_none_match=new.etag))
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    validator = CacheValidator.for_latest("last:btc_usd", [PriceDTO(1, "btc_usd", 45000.0, 1700000000)])
+    last_modified = validator.headers()["Last-Modified"]
+
+    assert validator.is_not_modified(make_request(if_modified_since=last_modified))
+    assert not validator.is_not_modified(
+        make_request(if_none_match='W/"stale"', if_modified_since=last_modified)
+    )
+
+
+def test_closed_range_is_immutable():
+    end_date = datetime(2023, 11, 15)
+    validator = CacheValidator.for_closed_range("by-date:btc_usd", end_date)
+
+    latest = [PriceDTO(1, "btc_usd", 45000.0, int(datetime.now().timestamp()))]
+    assert is_closed_range(end_date, latest)
+    assert not is_closed_range(datetime.now(), latest)
+    assert "immutable" in validator.headers()["Cache-Control"]
+    assert validator.not_modified().status_code == 304
+    assert not validator.is_not_modified(make_request(if_none_match="*"))
+
+
+def test_range_stays_open_while_ingest_lags():
+    end_date = datetime(2023, 11, 15)
+    lagging = PriceDTO(1, "btc_usd", 45000.0, int(end_date.timestamp()) + 60)
+
+    assert not is_closed_range(end_date, [lagging])
+    assert not is_closed_range(end_date, [None])
+    assert not is_closed_range(end_date, [])
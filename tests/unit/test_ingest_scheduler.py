@@ -0,0 +1,114 @@
+import asyncio
+import time
+import pytest
+from src.infrastructure.ingest.scheduler import TickerScheduler
+
+
+async def run_for(scheduler, seconds):
+    task = asyncio.create_task(scheduler.run())
+    await asyncio.sleep(seconds)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+class TestTickerScheduler:
+    @pytest.mark.asyncio
+    async def test_fire_times_do_not_drift(self):
+        loop = asyncio.get_running_loop()
+        fired = []
+
+        async def job(tickers):
+            fired.append(loop.time())
+            await asyncio.sleep(0.03)
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.05})
+        await run_for(scheduler, 0.52)
+
+        offsets = [(t - fired[0]) % 0.05 for t in fired]
+        assert len(fired) >= 9
+        assert all(min(offset, 0.05 - offset) < 0.02 for offset in offsets)
+
+    @pytest.mark.asyncio
+    async def test_per_ticker_intervals_are_batched_when_due_together(self):
+        batches = []
+
+        async def job(tickers):
+            batches.append(sorted(tickers))
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.02, "eth_usd": 0.1})
+        await run_for(scheduler, 0.25)
+
+        btc_runs = sum("btc_usd" in batch for batch in batches)
+        eth_runs = sum("eth_usd" in batch for batch in batches)
+        assert btc_runs >= 3 * eth_runs
+        assert all(batch == ["btc_usd", "eth_usd"] for batch in batches if "eth_usd" in batch)
+
+    @pytest.mark.asyncio
+    async def test_overlapping_runs_are_skipped(self):
+        running = 0
+        max_running = 0
+
+        async def job(tickers):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.12)
+            running -= 1
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.05})
+        await run_for(scheduler, 0.3)
+
+        assert max_running == 1
+        assert scheduler.skipped >= 2
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_schedule(self):
+        async def job(tickers):
+            raise RuntimeError("upstream down")
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.02})
+        await run_for(scheduler, 0.11)
+
+        assert scheduler.failures >= 3 and scheduler.runs == 0
+
+    def test_rejects_jitter_wider_than_interval(self):
+        with pytest.raises(ValueError):
+            TickerScheduler(lambda tickers: None, {"btc_usd": 1.0}, jitter=1.0)
+
+    @pytest.mark.asyncio
+    async def test_set_intervals_adds_and_removes_tickers(self):
+        batches = []
+
+        async def job(tickers):
+            batches.append(sorted(tickers))
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.02})
+        task = asyncio.create_task(scheduler.run())
+        await asyncio.sleep(0.05)
+        scheduler.set_intervals({"eth_usd": 0.02})
+        batches.clear()
+        await asyncio.sleep(0.07)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert batches and all(batch == ["eth_usd"] for batch in batches)
+
+    @pytest.mark.asyncio
+    async def test_stalled_loop_does_not_fetch_ticker_twice_in_one_batch(self):
+        batches = []
+
+        async def job(tickers):
+            batches.append(list(tickers))
+
+        async def stall():
+            await asyncio.sleep(0.01)
+            time.sleep(0.035)
+
+        scheduler = TickerScheduler(job, {"btc_usd": 0.02}, coalesce_window=0.02)
+        stalling = asyncio.create_task(stall())
+        await run_for(scheduler, 0.1)
+        await stalling
+
+        assert batches and all(batch == ["btc_usd"] for batch in batches)
@@ -0,0 +1,59 @@
+import pytest
+from src.infrastructure.monitoring import metrics as metrics_module
+from src.infrastructure.monitoring.metrics import Metrics, timed_methods
+
+
+class Repository:
+    async def get_last(self, ticker):
+        return ticker
+
+
+def test_disabled_metrics_leave_methods_untouched():
+    original = Repository.get_last
+
+    assert not Metrics(False).enabled
+    assert timed_methods(Repository) is Repository
+    assert Repository.get_last is original
+
+
+@pytest.mark.asyncio
+async def test_enabled_metrics_record_latency_and_lag(monkeypatch):
+    pytest.importorskip("prometheus_client")
+    enabled = Metrics(True)
+    monkeypatch.setattr(metrics_module, "metrics", enabled)
+
+    class TimedRepository(Repository):
+        pass
+    TimedRepository.get_last = Repository.get_last
+    timed_methods(TimedRepository)
+
+    assert await TimedRepository().get_last("btc_usd") == "btc_usd"
+    enabled.update_ingest_lag({"btc_usd": 1700000000, "eth_usd": None}, now=1700000042)
+    text = enabled.render().decode()
+
+    assert 'repository_query_duration_seconds_count{method="get_last",repository="TimedRepository"} 1.0' in text
+    assert 'ingest_lag_seconds{ticker="btc_usd"} 42.0' in text
+    assert 'ticker="eth_usd"' not in text
+
+
+def test_worker_metrics_need_multiproc_dir_for_prefork(tmp_path, monkeypatch):
+    class Worker:
+        pool_cls = "prefork"
+
+    started = []
+    monkeypatch.setattr(metrics_module, "start_metrics_server", started.append)
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    from celery.signals import task_prerun, task_postrun, worker_init, worker_process_shutdown
+    for signal in (task_prerun, task_postrun, worker_init, worker_process_shutdown):
+        monkeypatch.setattr(signal, "receivers", list(signal.receivers))
+    metrics_module.install_celery_metrics()
+
+    worker_init.send(sender=Worker())
+    assert started == []
+
+    stale = tmp_path / "counter_123.db"
+    stale.write_bytes(b"stale")
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    worker_init.send(sender=Worker())
+    assert started == [metrics_module.settings.METRICS_PORT]
+    assert not stale.exists()
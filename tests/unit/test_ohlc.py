@@ -0,0 +1,83 @@
+import pytest
+from unittest.mock import AsyncMock
+from datetime import datetime
+from src.application.services.ohlc_aggregator import aggregate_ohlc
+from src.application.use_cases.get_ohlc_uc import GetOhlcUseCase
+from src.domain.entities.price import Price
+from src.domain.value_objects.candle_interval import CandleInterval
+
+
+class TestAggregateOhlc:
+    def test_buckets_unsorted_prices(self):
+        prices = [
+            Price(ticker="btc_usd", price=12.0, timestamp=1700000050),
+            Price(ticker="btc_usd", price=10.0, timestamp=1699999980),
+            Price(ticker="btc_usd", price=15.0, timestamp=1700000000),
+            Price(ticker="btc_usd", price=9.0, timestamp=1700000020),
+        ]
+        
+        candles = aggregate_ohlc("btc_usd", prices, 60)
+        
+        assert [candle.bucket_start for candle in candles] == [1699999980, 1700000040]
+        first, second = candles
+        assert (first.open, first.high, first.low, first.close, first.count) == (10.0, 15.0, 9.0, 9.0, 3)
+        assert (second.open, second.close, second.count) == (12.0, 12.0, 1)
+    
+    def test_empty(self):
+        assert aggregate_ohlc("btc_usd", [], 60) == []
+
+
+class TestGetOhlcUseCase:
+    @pytest.mark.asyncio
+    async def test_pushes_down_to_repository_without_cache(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_ohlc.return_value = []
+        use_case = GetOhlcUseCase(mock_repository)
+        
+        start_date = datetime(2023, 11, 15)
+        end_date = datetime(2023, 11, 16)
+        await use_case.execute("btc_usd", start_date, end_date, CandleInterval.ONE_HOUR)
+        
+        mock_repository.get_ohlc.assert_called_once_with(
+            "btc_usd", int(start_date.timestamp()), int(end_date.timestamp()), 3600
+        )
+    
+    @pytest.mark.asyncio
+    async def test_rejects_too_many_candles(self):
+        use_case = GetOhlcUseCase(AsyncMock())
+        
+        with pytest.raises(ValueError):
+            await use_case.execute(
+                "btc_usd", datetime(2020, 1, 1), datetime(2023, 1, 1), CandleInterval.ONE_MINUTE
+            )
+
+    @pytest.mark.asyncio
+    async def test_picks_coarsest_aligned_rollup(self):
+        mock_repository = AsyncMock()
+        mock_rollups = AsyncMock()
+        mock_rollups.resolutions = lambda: [60, 3600, 86400]
+        mock_rollups.get_ohlc.return_value = []
+        use_case = GetOhlcUseCase(mock_repository, rollup_repository=mock_rollups)
+        
+        start_date = datetime.fromtimestamp(1699920000)
+        end_date = datetime.fromtimestamp(1699920000 + 7 * 86400)
+        await use_case.execute("btc_usd", start_date, end_date, CandleInterval.ONE_DAY)
+        await use_case.execute("btc_usd", start_date, end_date, CandleInterval.FIVE_MINUTES)
+        
+        assert [call.args[4] for call in mock_rollups.get_ohlc.call_args_list] == [86400, 60]
+        mock_repository.get_ohlc.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_unaligned_range_falls_back_to_raw(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_ohlc.return_value = []
+        mock_rollups = AsyncMock()
+        mock_rollups.resolutions = lambda: [60, 3600, 86400]
+        use_case = GetOhlcUseCase(mock_repository, rollup_repository=mock_rollups)
+        
+        start_date = datetime.fromtimestamp(1699920030)
+        end_date = datetime.fromtimestamp(1699920030 + 3600)
+        await use_case.execute("btc_usd", start_date, end_date, CandleInterval.ONE_MINUTE)
+        
+        mock_rollups.get_ohlc.assert_not_called()
+        mock_repository.get_ohlc.assert_called_once()
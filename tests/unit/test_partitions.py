@@ -0,0 +1,69 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.infrastructure.database.partitions import MonthPartition, PricePartitionManager
+
+NOW = 1700000000  # 2023-11-14 UTC
+
+
+class TestMonthPartition:
+    def test_name_and_bounds(self):
+        partition = MonthPartition.containing(NOW)
+
+        assert partition.name == "prices_y2023m11"
+        assert partition.start == 1698796800
+        assert partition.end == 1701388800
+        assert partition.start <= NOW < partition.end
+
+    def test_shift_wraps_years(self):
+        assert MonthPartition(2023, 11).shift(3) == MonthPartition(2024, 2)
+        assert MonthPartition(2024, 1).shift(-1) == MonthPartition(2023, 12)
+        assert MonthPartition.from_name("prices_y2024m02") == MonthPartition(2024, 2)
+        assert MonthPartition.from_name("prices_default") is None
+
+
+def make_connection(partition_names, scalars=()):
+    connection = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value = partition_names
+    connection.execute = AsyncMock(return_value=result)
+    connection.scalar = AsyncMock(side_effect=list(scalars))
+    return connection
+
+
+def executed_sql(connection):
+    return [str(call.args[0]) for call in connection.execute.call_args_list]
+
+
+class TestPricePartitionManager:
+    @pytest.mark.asyncio
+    async def test_ensure_partitions_creates_missing_months_and_default(self):
+        connection = make_connection(["prices_y2023m11", "prices_default"])
+
+        created = await PricePartitionManager(connection).ensure_partitions(2, now=NOW)
+
+        assert created == ["prices_y2023m12", "prices_y2024m01"]
+        sql = executed_sql(connection)
+        assert any("prices_y2024m01 PARTITION OF prices FOR VALUES FROM (1704067200)" in s for s in sql)
+        assert any("prices_default PARTITION OF prices DEFAULT" in s for s in sql)
+
+    @pytest.mark.asyncio
+    async def test_retention_keeps_partitions_that_are_not_rolled_up(self):
+        connection = make_connection(
+            ["prices_y2023m07", "prices_y2023m08", "prices_y2023m11"],
+            scalars=[10, 10, 5, 4],
+        )
+
+        expired = await PricePartitionManager(connection).apply_retention(2, "drop", now=NOW)
+
+        assert expired == ["prices_y2023m07"]
+        sql = executed_sql(connection)
+        assert any("DETACH PARTITION prices_y2023m07" in s for s in sql)
+        assert any("DROP TABLE prices_y2023m07" in s for s in sql)
+        assert not any("prices_y2023m08" in s for s in sql[1:])
+
+    @pytest.mark.asyncio
+    async def test_retention_disabled_by_default(self):
+        connection = make_connection([])
+
+        assert await PricePartitionManager(connection).apply_retention(0) == []
+        connection.execute.assert_not_called()
@@ -0,0 +1,44 @@
+import pytest
+from src.domain.entities.price import Price
+from src.infrastructure.cache.memory_price_cache import InMemoryPriceCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestInMemoryPriceCache:
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_counters(self):
+        clock = FakeClock()
+        cache = InMemoryPriceCache(ttl=60, clock=clock)
+        price = Price(ticker="btc_usd", price=45000.5, timestamp=1700000000)
+
+        assert await cache.get_last("btc_usd") is None
+        await cache.set_last(price)
+        assert await cache.get_last("btc_usd") == price
+
+        clock.now = 61
+        assert await cache.get_last("btc_usd") is None
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_keeps_newest_price_and_invalidates(self):
+        cache = InMemoryPriceCache()
+        newer = Price(ticker="btc_usd", price=2.0, timestamp=1700000060)
+
+        await cache.set_last(newer)
+        await cache.set_last(Price(ticker="btc_usd", price=1.0, timestamp=1700000000))
+        assert await cache.get_last("btc_usd") == newer
+
+        await cache.invalidate("btc_usd")
+        assert await cache.get_last("btc_usd") is None
+        assert cache.stats()["invalidations"] == 1
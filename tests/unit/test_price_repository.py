@@ -0,0 +1,137 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+from src.domain.entities.price import Price
+from src.infrastructure.database.repositories.price_repository_impl import (
+    PriceRepositoryImpl,
+    OnConflict,
+)
+
+
+def compiled_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def make_session(returned_rows):
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=returned_rows)
+    return session
+
+
+class TestPriceRepositoryBatchSave:
+    @pytest.mark.asyncio
+    async def test_single_insert_returns_persisted_ids(self):
+        session = make_session([
+            SimpleNamespace(id=1, ticker="btc_usd", price=45000.5, timestamp=1700000000),
+            SimpleNamespace(id=2, ticker="eth_usd", price=2500.0, timestamp=1700000000),
+        ])
+        repository = PriceRepositoryImpl(session)
+
+        saved = await repository.batch_save([
+            Price(ticker="btc_usd", price=45000.5, timestamp=1700000000),
+            Price(ticker="eth_usd", price=2500.0, timestamp=1700000000),
+        ])
+
+        assert [price.id for price in saved] == [1, 2]
+        session.execute.assert_awaited_once()
+        sql = compiled_sql(session.execute.call_args.args[0])
+        assert "ON CONFLICT (ticker, timestamp) DO NOTHING" in sql
+        assert "RETURNING prices.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_update_policy_and_in_batch_dedupe(self):
+        session = make_session([])
+        repository = PriceRepositoryImpl(session, on_conflict=OnConflict.UPDATE)
+
+        await repository.batch_save([
+            Price(ticker="btc_usd", price=1.0, timestamp=1700000000),
+            Price(ticker="btc_usd", price=2.0, timestamp=1700000000),
+        ])
+
+        stmt = session.execute.call_args.args[0]
+        assert "DO UPDATE SET price = excluded.price" in compiled_sql(stmt)
+        assert stmt.compile(dialect=postgresql.dialect()).params["price_m0"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_conflicting_keys_are_returned_as_stored(self):
+        session = MagicMock()
+        session.execute = AsyncMock(side_effect=[
+            [SimpleNamespace(id=2, ticker="eth_usd", price=2500.0, timestamp=1700000000)],
+            [SimpleNamespace(id=1, ticker="btc_usd", price=45000.0, timestamp=1700000000)],
+        ])
+        repository = PriceRepositoryImpl(session)
+
+        saved = await repository.batch_save([
+            Price(ticker="btc_usd", price=45001.0, timestamp=1700000000),
+            Price(ticker="eth_usd", price=2500.0, timestamp=1700000000),
+        ])
+
+        assert sorted(price.id for price in saved) == [1, 2]
+        lookup = compiled_sql(session.execute.call_args.args[0])
+        assert "(prices.ticker, prices.timestamp) IN" in lookup
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_skips_database(self):
+        session = make_session([])
+        repository = PriceRepositoryImpl(session)
+
+        assert await repository.batch_save([]) == []
+        session.execute.assert_not_called()
+
+
+class FakeSessionFactory:
+    def __init__(self, returned_rows):
+        self.returned_rows = returned_rows
+        self.sessions = []
+        self.open = 0
+
+    def __call__(self):
+        factory = self
+        session = make_session(self.returned_rows)
+        session.begin = MagicMock(return_value=MagicMock(
+            __aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)
+        ))
+
+        class Scope:
+            async def __aenter__(self):
+                factory.open += 1
+                return session
+
+            async def __aexit__(self, *exc):
+                factory.open -= 1
+                return False
+
+        self.sessions.append(session)
+        return Scope()
+
+
+class TestPriceRepositorySessionFactory:
+    @pytest.mark.asyncio
+    async def test_each_call_uses_and_releases_its_own_session(self):
+        factory = FakeSessionFactory([
+            SimpleNamespace(id=1, ticker="btc_usd", price=45000.5, timestamp=1700000000),
+        ])
+        repository = PriceRepositoryImpl(session_factory=factory)
+
+        first = await repository.get_last_many(["btc_usd"])
+        await repository.get_last_many(["btc_usd"])
+
+        assert first["btc_usd"].id == 1
+        assert len(factory.sessions) == 2 and factory.open == 0
+        factory.sessions[0].begin.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_writes_run_in_a_committed_transaction(self):
+        factory = FakeSessionFactory([])
+        repository = PriceRepositoryImpl(session_factory=factory)
+
+        await repository.batch_save([Price(ticker="btc_usd", price=1.0, timestamp=1700000000)])
+
+        factory.sessions[0].begin.assert_called_once()
+
+    def test_requires_exactly_one_session_source(self):
+        with pytest.raises(ValueError):
+            PriceRepositoryImpl()
+        with pytest.raises(ValueError):
+            PriceRepositoryImpl(MagicMock(), session_factory=FakeSessionFactory([]))
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import pytest
+from src.domain.entities.price import Price
+from src.infrastructure.cache.cache_manager import PriceCacheManager
+from src.infrastructure.cache.memory_price_cache import InMemoryPriceCache
+from src.infrastructure.cache.price_ring_buffer import PriceRingBuffer, RecentPriceWindow, BYTES_PER_SLOT
+
+
+def make_price(timestamp: int, ticker: str = "btc_usd") -> Price:
+    return Price(id=timestamp, ticker=ticker, price=float(timestamp), timestamp=timestamp)
+
+
+class TestPriceRingBuffer:
+    def test_wraps_at_capacity_and_keeps_order(self):
+        buffer = PriceRingBuffer("btc_usd", capacity=4)
+        for timestamp in range(1, 8):
+            buffer.append(timestamp, float(timestamp), timestamp)
+
+        assert len(buffer) == 4
+        assert buffer.oldest == 4
+        assert buffer.newest == 7
+        assert buffer.covered_since == 4
+        assert buffer.memory_bytes() == 4 * BYTES_PER_SLOT
+        assert [row[3] for row in buffer.range_rows(0, 100)] == [7, 6, 5, 4]
+        assert buffer.range_rows(5, 6) == [(6, "btc_usd", 6.0, 6), (5, "btc_usd", 5.0, 5)]
+
+    def test_duplicate_replaces_and_late_price_shrinks_coverage(self):
+        buffer = PriceRingBuffer("btc_usd", capacity=8)
+        for timestamp in (10, 20, 30):
+            buffer.append(None, 1.0, timestamp)
+
+        buffer.append(5, 2.0, 20)
+        assert buffer.range_rows(20, 20) == [(5, "btc_usd", 2.0, 20)]
+
+        buffer.append(None, 3.0, 25)
+        assert not buffer.covers(20)
+        assert buffer.covers(26)
+        assert len(buffer) == 3
+
+
+class TestRecentPriceWindow:
+    def test_serves_covered_ranges_only(self):
+        window = RecentPriceWindow(capacity=100)
+        window.add([make_price(1700000060), make_price(1700000000), make_price(1700000120)])
+
+        rows = window.get_range_rows("btc_usd", 1700000000, 1700000100)
+        assert [row[3] for row in rows] == [1700000060, 1700000000]
+        assert window.get_range_rows("btc_usd", 1699999999, 1700000100) is None
+        assert window.get_range_rows("eth_usd", 1700000000, 1700000100) is None
+
+        window.reset()
+        assert window.get_range_rows("btc_usd", 1700000000, 1700000100) is None
+        assert window.stats()["hits"] == 1
+        assert window.stats()["misses"] == 3
+
+    def test_load_keeps_prices_received_while_loading(self):
+        window = RecentPriceWindow(capacity=100)
+        window.add([make_price(1700000120), make_price(1700000180)])
+
+        rows = [(1700000000, "btc_usd", 1.0, 1700000000), (1700000060, "btc_usd", 1.0, 1700000060)]
+        window.load("btc_usd", rows, covered_since=1699990000)
+
+        rows = window.get_range_rows("btc_usd", 1699990000, 1700000200)
+        assert [row[3] for row in rows] == [1700000180, 1700000120, 1700000060, 1700000000]
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_serves_ranges_from_window(self):
+        cache = InMemoryPriceCache(window=RecentPriceWindow(capacity=10))
+        assert await cache.get_range("btc_usd", 0, 1) is None
+
+        cache.window.add([make_price(1700000000), make_price(1700000060)])
+        assert await cache.get_range("btc_usd", 1700000000, 1700000060) == [
+            make_price(1700000060), make_price(1700000000)
+        ]
+
+
+class StubRepository:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def stream_row_batches(self, ticker, batch_size, start_timestamp=None, end_timestamp=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        yield [(1, ticker, 1.0, start_timestamp + 10), (2, ticker, 2.0, start_timestamp + 20)]
+
+
+class StubSubscriber:
+    def __init__(self):
+        self.subscribed = asyncio.Event()
+        self.subscribed.set()
+
+
+@pytest.mark.asyncio
+async def test_warm_window_loads_tickers_with_bounded_concurrency():
+    manager = PriceCacheManager()
+    manager.window = RecentPriceWindow(capacity=10)
+    manager.subscriber = StubSubscriber()
+    repository = StubRepository()
+    tickers = ["btc_usd", "eth_usd", "sol_usd", "xrp_usd"]
+
+    assert await manager.warm_window(repository, tickers, concurrency=2) == 4
+
+    assert repository.max_running == 2
+    now = int(time.time())
+    rows = manager.window.get_range_rows("sol_usd", now - 86400, now)
+    assert [row[0] for row in rows] == [2, 1]
@@ -0,0 +1,149 @@
+import asyncio
+import pytest
+from redis.exceptions import ConnectionError
+from src.domain.entities.price import Price
+from src.infrastructure.cache import cache_manager
+from src.infrastructure.cache.memory_price_cache import InMemoryPriceCache
+from src.infrastructure.cache.price_ring_buffer import RecentPriceWindow
+from src.infrastructure.cache.redis_price_cache import RedisPriceCache, PriceUpdateSubscriber
+from src.infrastructure.cache.tiered_price_cache import TieredPriceCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+class TestRedisPriceCache:
+    @pytest.mark.asyncio
+    async def test_write_through_serves_last_and_window(self, redis):
+        cache = RedisPriceCache(redis, window_seconds=120)
+        prices = [
+            Price(id=i, ticker="btc_usd", price=100.0 + i, timestamp=1700000000 + i * 60)
+            for i in range(1, 5)
+        ]
+
+        assert await cache.get_range("btc_usd", 1700000000, 1700001000) is None
+
+        await cache.publish_prices(prices)
+
+        assert (await cache.get_last("btc_usd")).id == 4
+        window = await cache.get_range("btc_usd", 1700000120, 1700001000)
+        assert [price.id for price in window] == [4, 3, 2]
+        assert await cache.get_range("btc_usd", 1700000000, 1700001000) is None
+
+    @pytest.mark.asyncio
+    async def test_subscriber_updates_local_tier(self, redis):
+        local = InMemoryPriceCache()
+        remote = RedisPriceCache(redis)
+
+        async def on_prices(prices):
+            for price in prices:
+                await local.set_last(price)
+
+        subscriber = PriceUpdateSubscriber(redis, remote.channel, on_prices)
+        subscriber.start()
+        await asyncio.sleep(0.05)
+
+        await remote.publish_prices([Price(id=7, ticker="eth_usd", price=2500.0, timestamp=1700000000)])
+
+        for _ in range(50):
+            if subscriber.messages_received:
+                break
+            await asyncio.sleep(0.01)
+        await subscriber.stop()
+
+        assert (await local.get_last("eth_usd")).id == 7
+
+    @pytest.mark.asyncio
+    async def test_tiered_cache_fills_local_from_redis(self, redis):
+        local = InMemoryPriceCache()
+        remote = RedisPriceCache(redis)
+        await remote.publish_prices([Price(id=3, ticker="btc_usd", price=1.0, timestamp=1700000000)])
+
+        tiered = TieredPriceCache(local, remote)
+
+        assert (await tiered.get_last("btc_usd")).id == 3
+        assert (await local.get_last("btc_usd")).id == 3
+
+    @pytest.mark.asyncio
+    async def test_set_last_does_not_replace_newer_price(self, redis):
+        pytest.importorskip("lupa")
+        cache = RedisPriceCache(redis)
+        await cache.publish_prices([Price(id=2, ticker="btc_usd", price=2.0, timestamp=1700000060)])
+
+        await cache.set_last(Price(id=1, ticker="btc_usd", price=1.0, timestamp=1700000000))
+        assert (await cache.get_last("btc_usd")).id == 2
+
+        await cache.set_last(Price(id=3, ticker="btc_usd", price=3.0, timestamp=1700000120))
+        assert (await cache.get_last("btc_usd")).id == 3
+        assert 0 < await redis.ttl(cache._last_key("btc_usd")) <= cache.ttl
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_resets_subscribers_ring_buffer(redis, monkeypatch):
+    monkeypatch.setattr(cache_manager.settings, "PRICE_CACHE_REDIS_ENABLED", True)
+    monkeypatch.setattr(cache_manager, "_unpublished_tickers", set())
+    window = RecentPriceWindow(capacity=10)
+
+    async def on_prices(prices):
+        window.add(prices)
+
+    subscriber = PriceUpdateSubscriber(
+        redis, cache_manager.settings.PRICE_CACHE_CHANNEL, on_prices, on_reset=window.reset
+    )
+    subscriber.start()
+    await asyncio.sleep(0.05)
+
+    async def wait_for_messages(count):
+        for _ in range(50):
+            if subscriber.messages_received >= count:
+                break
+            await asyncio.sleep(0.01)
+
+    await cache_manager.publish_prices([Price(id=1, ticker="btc_usd", price=1.0, timestamp=1700000000)], redis)
+    await wait_for_messages(1)
+    assert window.get_range_rows("btc_usd", 1700000000, 1700000000)
+
+    def unavailable(*args, **kwargs):
+        raise ConnectionError("redis is down")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(redis, "pipeline", unavailable)
+        patched.setattr(redis, "publish", unavailable)
+        await cache_manager.publish_prices([Price(id=2, ticker="btc_usd", price=2.0, timestamp=1700000060)], redis)
+    assert cache_manager._unpublished_tickers == {"btc_usd"}
+
+    await cache_manager.publish_prices([Price(id=3, ticker="btc_usd", price=3.0, timestamp=1700000120)], redis)
+    await wait_for_messages(3)
+    await subscriber.stop()
+
+    assert cache_manager._unpublished_tickers == set()
+    assert window.get_range_rows("btc_usd", 1700000000, 1700000120) is None
+    assert [row[0] for row in window.get_range_rows("btc_usd", 1700000120, 1700000120)] == [3]
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_drops_redis_window_coverage(redis, monkeypatch):
+    monkeypatch.setattr(cache_manager.settings, "PRICE_CACHE_REDIS_ENABLED", True)
+    monkeypatch.setattr(cache_manager, "_unpublished_tickers", set())
+    cache = RedisPriceCache(redis)
+    await cache_manager.publish_prices([Price(id=1, ticker="btc_usd", price=1.0, timestamp=1700000000)], redis)
+
+    real_pipeline = redis.pipeline
+    calls = []
+
+    def failing_once(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise ConnectionError("connection reset")
+        return real_pipeline(*args, **kwargs)
+
+    monkeypatch.setattr(redis, "pipeline", failing_once)
+    await cache_manager.publish_prices([Price(id=2, ticker="btc_usd", price=2.0, timestamp=1700000060)], redis)
+    await cache_manager.publish_prices([Price(id=3, ticker="btc_usd", price=3.0, timestamp=1700000120)], redis)
+
+    assert await cache.get_range("btc_usd", 1700000000, 1700000120) is None
+    assert [price.id for price in await cache.get_range("btc_usd", 1700000120, 1700000120)] == [3]
@@ -0,0 +1,62 @@
+import logging
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from src.domain.exceptions.domain_exceptions import InvalidTickerException
+from src.presentation.middleware.request_middleware import RequestMiddleware
+
+
+def make_client(**options):
+    app = FastAPI()
+    app.add_middleware(RequestMiddleware, **options)
+
+    @app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+
+    @app.get("/domain-error")
+    async def domain_error():
+        raise InvalidTickerException("Invalid ticker: doge_usd")
+
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_exceptions_are_mapped_to_json_errors():
+    client = make_client()
+
+    domain = client.get("/domain-error")
+    crash = client.get("/crash")
+
+    assert domain.status_code == 400
+    assert domain.json()["error_code"] == "InvalidTickerException"
+    assert crash.status_code == 500
+    assert crash.json()["error_code"] == "INTERNAL_SERVER_ERROR"
+
+
+def test_streaming_response_passes_through():
+    response = make_client().get("/stream")
+
+    assert response.status_code == 200
+    assert response.text == "0\n1\n2\n"
+
+
+def test_sampling_skips_successful_requests_but_not_errors(caplog):
+    client = make_client(sample_rate=0.0)
+
+    with caplog.at_level(logging.INFO, logger="src.presentation.middleware.request_middleware"):
+        client.get("/ok")
+        client.get("/crash")
+
+    completed = [record.getMessage() for record in caplog.records if record.getMessage().startswith("GET")]
+    assert len(completed) == 1 and completed[0].startswith("GET /crash 500 ")
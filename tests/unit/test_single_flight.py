@@ -0,0 +1,75 @@
+import asyncio
+import pytest
+from unittest.mock import MagicMock
+from src.application.services.single_flight import SingleFlight
+from src.application.use_cases.get_last_price_uc import GetLastPriceUseCase
+from src.domain.entities.price import Price
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    flight = SingleFlight()
+    executions = 0
+
+    async def query():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return executions
+
+    results = await asyncio.gather(*(flight.do(("last", "btc_usd"), query) for _ in range(50)))
+    other = await flight.do(("last", "eth_usd"), query)
+
+    assert results == [1] * 50
+    assert other == 2
+    assert flight.stats()["coalesced"] == 49 and flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failure_is_shared_and_not_cached():
+    flight = SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(*(flight.do("key", failing) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.failures == 1
+    assert await flight.do("key", lambda: asyncio.sleep(0, result="ok")) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_others():
+    flight = SingleFlight()
+
+    leader = asyncio.create_task(flight.do("key", lambda: asyncio.sleep(0.02, result="done")))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", lambda: asyncio.sleep(0, result="other")))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+
+
+@pytest.mark.asyncio
+async def test_use_cases_coalesce_through_a_shared_flight():
+    flight = SingleFlight()
+    repository = MagicMock()
+    calls = 0
+
+    async def get_last(ticker):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Price(ticker=ticker, price=45000.5, timestamp=1700000000, id=1)
+
+    repository.get_last = get_last
+    # one use case per request, as the API dependencies build them
+    results = await asyncio.gather(*(
+        GetLastPriceUseCase(repository, single_flight=flight).execute("btc_usd") for _ in range(20)
+    ))
+
+    assert calls == 1
+    assert {result.price for result in results} == {45000.5}
@@ -0,0 +1,77 @@
+import pytest
+from src.application.services.static_ticker_registry import StaticTickerRegistry
+from src.domain.exceptions.domain_exceptions import InvalidTickerException
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.deribit_ticker_registry import DeribitTickerRegistry
+
+
+class StubHttpClient:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.is_started = True
+        self.calls = 0
+
+    async def get(self, endpoint, params=None):
+        assert endpoint == "public/get_index_price_names"
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestStaticTickerRegistry:
+    def test_defaults_to_currency_pairs(self):
+        registry = StaticTickerRegistry()
+
+        assert registry.tickers() == frozenset({"btc_usd", "eth_usd"})
+        assert registry.index_name("btc_usd") == "btc_usd"
+        registry.validate("eth_usd")
+        with pytest.raises(InvalidTickerException):
+            registry.validate("doge_usd")
+
+
+class TestDeribitTickerRegistry:
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_tickers_and_notifies(self):
+        http_client = StubHttpClient([{"result": ["btc_usd", "eth_usd", "SOL_USDC"]}])
+        registry = DeribitTickerRegistry(http_client)
+        changes = []
+        registry.on_change(changes.append)
+
+        assert await registry.refresh()
+
+        assert registry.is_supported("sol_usdc")
+        assert registry.index_name("sol_usdc") == "sol_usdc"
+        assert changes == [frozenset({"btc_usd", "eth_usd", "sol_usdc"})]
+
+    @pytest.mark.asyncio
+    async def test_failed_or_empty_refresh_keeps_previous_tickers(self):
+        http_client = StubHttpClient([RuntimeError("down"), {"result": []}])
+        registry = DeribitTickerRegistry(http_client)
+
+        assert not await registry.refresh()
+        assert not await registry.refresh()
+
+        assert registry.tickers() == frozenset({"btc_usd", "eth_usd"})
+        assert registry.refresh_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_ensure_fresh_respects_interval_and_static_mode(self):
+        http_client = StubHttpClient([{"result": ["btc_usd"]}])
+        registry = DeribitTickerRegistry(http_client, refresh_interval=3600)
+
+        await registry.ensure_fresh()
+        await registry.ensure_fresh()
+        await DeribitTickerRegistry(http_client, dynamic=False).ensure_fresh()
+
+        assert http_client.calls == 1
+
+
+class TestIngestTickers:
+    def test_dynamic_registry_does_not_widen_ingest(self):
+        available = {"btc_usd", "eth_usd", "sol_usd"}
+
+        assert Settings().ingest_tickers(available) == ["btc_usd", "eth_usd"]
+        assert Settings(INGEST_TICKERS=["sol_usd", "doge_usd"]).ingest_tickers(available) == ["sol_usd"]
+        assert Settings(INGEST_TICKERS=["*"]).ingest_tickers(available) == sorted(available)
@@ -6,6 +6,7 @@ from src.application.use_cases.get_last_price_uc import GetLastPriceUseCase
 from src.application.use_cases.get_prices_by_date_uc import GetPricesByDateUseCase
 from src.domain.entities.price import Price
 from src.domain.exceptions.domain_exceptions import InvalidTickerException
+from src.infrastructure.cache.memory_price_cache import InMemoryPriceCache
 
 
 class TestGetAllPricesUseCase:    
@@ -37,6 +38,32 @@ class TestGetAllPricesUseCase:
         mock_repository.get_all.assert_not_called()
 
 
+    @pytest.mark.asyncio
+    async def test_execute_page_returns_next_cursor(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_page.return_value = [
+            Price(ticker="btc_usd", price=45100.75, timestamp=1700000200),
+            Price(ticker="btc_usd", price=45000.50, timestamp=1700000100),
+            Price(ticker="btc_usd", price=44900.25, timestamp=1700000000),
+        ]
+        
+        use_case = GetAllPricesUseCase(mock_repository)
+        
+        prices, next_cursor = await use_case.execute_page("btc_usd", 2, 1700000300)
+        
+        assert [price.timestamp for price in prices] == [1700000200, 1700000100]
+        assert next_cursor == 1700000100
+        mock_repository.get_page.assert_called_once_with("btc_usd", 3, 1700000300)
+    
+    @pytest.mark.asyncio
+    async def test_stream_invalid_ticker(self):
+        mock_repository = AsyncMock()
+        use_case = GetAllPricesUseCase(mock_repository)
+        
+        with pytest.raises(InvalidTickerException):
+            use_case.stream("invalid_ticker")
+
+
 class TestGetLastPriceUseCase:    
     @pytest.mark.asyncio
     async def test_execute_success(self):
@@ -64,6 +91,51 @@ class TestGetLastPriceUseCase:
         result = await use_case.execute("btc_usd")
         
         assert result is None
+    
+    @pytest.mark.asyncio
+    async def test_execute_served_from_cache(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_last_many.return_value = {
+            "btc_usd": Price(ticker="btc_usd", price=45000.50, timestamp=1700000000)
+        }
+        cache = InMemoryPriceCache()
+        
+        use_case = GetLastPriceUseCase(mock_repository, cache)
+        assert await use_case.warm(["btc_usd"]) == 1
+        
+        result = await use_case.execute("btc_usd")
+        
+        assert result.price == 45000.50
+        mock_repository.get_last_many.assert_called_once_with(["btc_usd"])
+        mock_repository.get_last.assert_not_called()
+        assert cache.stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_execute_many_fetches_cache_misses_in_one_query(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_last_many.return_value = {
+            "eth_usd": Price(ticker="eth_usd", price=2500.0, timestamp=1700000000)
+        }
+        cache = InMemoryPriceCache()
+        await cache.set_last(Price(ticker="btc_usd", price=45000.50, timestamp=1700000000))
+        
+        use_case = GetLastPriceUseCase(mock_repository, cache)
+        result = await use_case.execute_many(["btc_usd", "eth_usd", "btc_usd"])
+        
+        assert list(result) == ["btc_usd", "eth_usd"]
+        assert result["btc_usd"].price == 45000.50
+        assert result["eth_usd"].price == 2500.0
+        mock_repository.get_last_many.assert_called_once_with(["eth_usd"])
+    
+    @pytest.mark.asyncio
+    async def test_execute_many_rejects_unknown_ticker(self):
+        mock_repository = AsyncMock()
+        use_case = GetLastPriceUseCase(mock_repository)
+        
+        with pytest.raises(InvalidTickerException):
+            await use_case.execute_many(["btc_usd", "doge_usd"])
+        
+        mock_repository.get_last_many.assert_not_called()
 
 
 class TestGetPricesByDateUseCase:    
@@ -97,4 +169,22 @@ class TestGetPricesByDateUseCase:
         with pytest.raises(ValueError):
             await use_case.execute("btc_usd", start_date, end_date)
         
-        mock_repository.get_by_date_range.assert_not_called()
\ No newline at end of file
+        mock_repository.get_by_date_range.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_execute_many_returns_every_requested_ticker(self):
+        mock_repository = AsyncMock()
+        mock_repository.get_by_date_range_many.return_value = {
+            "btc_usd": [Price(ticker="btc_usd", price=45000.50, timestamp=1700000000)],
+            "eth_usd": [],
+        }
+        use_case = GetPricesByDateUseCase(mock_repository)
+        
+        start_date = datetime(2023, 11, 14)
+        end_date = datetime(2023, 11, 16)
+        result = await use_case.execute_many(["btc_usd", "eth_usd"], start_date, end_date)
+        
+        assert len(result["btc_usd"]) == 1 and result["eth_usd"] == []
+        mock_repository.get_by_date_range_many.assert_called_once_with(
+            ["btc_usd", "eth_usd"], start_date, end_date
+        )
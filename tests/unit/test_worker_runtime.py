@@ -0,0 +1,31 @@
+import asyncio
+from src.infrastructure.celery_app.runtime import WorkerRuntime
+from src.infrastructure.external.http_session import deribit_http_client
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+class TestWorkerRuntime:
+    def test_tasks_share_one_loop_and_http_session(self):
+        runtime = WorkerRuntime()
+        try:
+            first = runtime.run(current_loop())
+            second = runtime.run(current_loop())
+
+            assert first is second is runtime.loop
+            assert deribit_http_client.is_started
+            assert runtime.market_data_provider is not None
+            assert runtime.tasks_run == 2
+        finally:
+            runtime.stop()
+
+        assert runtime.loop is None
+        assert not deribit_http_client.is_started
+        assert first.is_closed()
+
+    def test_stop_without_start_is_noop(self):
+        runtime = WorkerRuntime()
+        runtime.stop()
+        assert not runtime.is_started